@@ -0,0 +1,101 @@
+"""
+Alembic migration environment (async PostgreSQL).
+
+Migrations are run explicitly, once per deploy (`uv run alembic upgrade head`),
+never from the app's startup. A transaction-scoped advisory lock serializes
+concurrent runs.
+
+Callers that already hold a connection (tests) pass it in as
+config.attributes["connection"]; the migrations then run inside the caller's
+transaction.
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool, text
+from sqlalchemy.ext.asyncio import async_engine_from_config
+
+import models  # noqa: F401  (registers every table on Base.metadata)
+from core.config import settings
+from models.base import Base
+
+config = context.config
+
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Arbitrary key for pg_advisory_xact_lock, shared by every migration run
+MIGRATION_LOCK_KEY = 7340211
+
+# Database objects that exist on purpose without a model counterpart;
+# autogenerate must not propose dropping them
+UNMANAGED_OBJECTS = {
+    ("index", "idx_user_email_trgm"),
+    ("column", "recommended_course_ids_jsonb"),
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave objects outside the model metadata alone in autogenerate."""
+    return (type_, name) not in UNMANAGED_OBJECTS
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting to a database."""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    """Run the migrations on a sync connection under the migration lock."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Open an async engine for DATABASE_URL and run the migrations on it."""
+    section = config.get_section(config.config_ini_section, {})
+    section["sqlalchemy.url"] = settings.DATABASE_URL
+    connectable = async_engine_from_config(
+        section,
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """Run the migrations against a live database."""
+    connection = config.attributes.get("connection")
+    if connection is None:
+        asyncio.run(run_async_migrations())
+    else:
+        do_run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
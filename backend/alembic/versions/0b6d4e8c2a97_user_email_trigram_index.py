@@ -0,0 +1,44 @@
+"""Index user emails for the admin substring search
+
+A B-tree can't serve a leading wildcard (ILIKE '%term%'); a pg_trgm GIN
+index can, for both LIKE and ILIKE. The index is kept out of the model
+metadata because it depends on the extension. Where pg_trgm can't be
+installed the revision logs a warning and the search falls back to a
+sequential scan.
+
+Revision ID: 0b6d4e8c2a97
+Revises: f19b3c7a5e28
+Create Date: 2026-10-16 12:02:26
+"""
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.exc import DBAPIError
+
+revision: str = "0b6d4e8c2a97"
+down_revision: Union[str, None] = "f19b3c7a5e28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    try:
+        # Savepoint, so a failure doesn't abort the rest of the upgrade
+        with bind.begin_nested():
+            bind.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            bind.execute(sa.text(
+                "CREATE INDEX IF NOT EXISTS idx_user_email_trgm "
+                'ON "user" USING gin (email gin_trgm_ops)'
+            ))
+    except DBAPIError as e:
+        log.warning("Skipping email trigram index (pg_trgm unavailable): %s", e.orig)
+
+
+def downgrade() -> None:
+    # The extension may be used elsewhere, so only the index is dropped
+    op.execute("DROP INDEX IF EXISTS idx_user_email_trgm")
@@ -0,0 +1,41 @@
+"""Add the admin user list and LLM metrics indexes
+
+- idx_user_admin_list: covers the admin user list's filters and email sort,
+  with id/is_verified included for index-only scans.
+- idx_llm_errors: partial index over failed LLM calls.
+- idx_llm_op_time: per-operation latency/token dashboards, served from the
+  index alone.
+
+Revision ID: 2f8a6c1d4b53
+Revises: 0b6d4e8c2a97
+Create Date: 2026-10-16 12:27:49
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "2f8a6c1d4b53"
+down_revision: Union[str, None] = "0b6d4e8c2a97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_admin_list "
+        'ON "user" (is_active, is_superuser, email) INCLUDE (id, is_verified)'
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_errors "
+        "ON llm_metrics (created_at) WHERE status = 'error'"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_op_time "
+        "ON llm_metrics (operation, created_at) INCLUDE (duration_ms, tokens_total)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_llm_op_time")
+    op.execute("DROP INDEX IF EXISTS idx_llm_errors")
+    op.execute("DROP INDEX IF EXISTS idx_user_admin_list")
@@ -0,0 +1,30 @@
+"""Baseline: create missing tables from the models
+
+Databases created before migrations existed were built by create_all() at
+app startup. This revision does the same for an empty database, so
+`alembic upgrade head` works on both; the revisions after it bring tables
+created by older code up to the current models.
+
+Revision ID: 5b0e2c7d9a41
+Revises:
+Create Date: 2026-10-16 09:12:04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from models.base import Base
+
+revision: str = "5b0e2c7d9a41"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    Base.metadata.create_all(op.get_bind())
+
+
+def downgrade() -> None:
+    # Never drop the application's tables from a downgrade
+    pass
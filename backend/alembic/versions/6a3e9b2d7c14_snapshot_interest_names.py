@@ -0,0 +1,50 @@
+"""Keep snapshot tag names denormalized in interests_snapshot
+
+Snapshots are an immutable history, so the tag names are stored with each
+row (renaming or deleting a tag must not rewrite past snapshots); the
+interest_tag_ids column added in 8d3f61a2c5e7 stays alongside for the
+GIN-indexed tag queries.
+
+Rows converted by 8d3f61a2c5e7 kept their original names. Rows written
+while the model only stored tag IDs have no names; they are filled from
+the tags' current names, the only record left, and the column becomes
+NOT NULL again with an empty-array default.
+
+Revision ID: 6a3e9b2d7c14
+Revises: 2f8a6c1d4b53
+Create Date: 2026-10-16 13:10:08
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "6a3e9b2d7c14"
+down_revision: Union[str, None] = "2f8a6c1d4b53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE user_profile_snapshots "
+        "ADD COLUMN IF NOT EXISTS interests_snapshot jsonb"
+    )
+    op.execute(
+        "UPDATE user_profile_snapshots s SET interests_snapshot = coalesce(("
+        " SELECT jsonb_agg(t.name ORDER BY e.pos)"
+        " FROM unnest(s.interest_tag_ids) WITH ORDINALITY AS e(id, pos)"
+        " JOIN tags t ON t.id = e.id), '[]'::jsonb)"
+        " WHERE s.interests_snapshot IS NULL"
+    )
+    op.alter_column(
+        "user_profile_snapshots", "interests_snapshot",
+        nullable=False, server_default=sa.text("'[]'::jsonb"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "user_profile_snapshots", "interests_snapshot",
+        nullable=True, server_default=None,
+    )
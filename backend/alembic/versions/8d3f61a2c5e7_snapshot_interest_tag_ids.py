@@ -0,0 +1,85 @@
+"""Store snapshot interests as a uuid[] of tag IDs
+
+Backfills user_profile_snapshots.interest_tag_ids from the legacy JSONB
+interests_snapshot column (tag names, in order). Names that no longer match
+a tag can't be converted; the number of affected snapshots is logged.
+
+The JSONB column is kept, made nullable since the model no longer writes it,
+until the backfill has been checked. Snapshots that lost names:
+
+    SELECT id, interests_snapshot, interest_tag_ids
+    FROM user_profile_snapshots
+    WHERE jsonb_array_length(interests_snapshot) <> cardinality(interest_tag_ids);
+
+6a3e9b2d7c14 keeps it for good, as the denormalized tag names.
+
+Revision ID: 8d3f61a2c5e7
+Revises: 5b0e2c7d9a41
+Create Date: 2026-10-16 09:20:31
+"""
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8d3f61a2c5e7"
+down_revision: Union[str, None] = "5b0e2c7d9a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+
+def _columns() -> set:
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns("user_profile_snapshots")}
+
+
+def upgrade() -> None:
+    columns = _columns()
+    if "interest_tag_ids" not in columns:
+        op.execute(
+            "ALTER TABLE user_profile_snapshots "
+            "ADD COLUMN interest_tag_ids uuid[] NOT NULL DEFAULT '{}'"
+        )
+        if "interests_snapshot" in columns:
+            op.execute(
+                "UPDATE user_profile_snapshots s SET interest_tag_ids = ARRAY("
+                " SELECT t.id FROM jsonb_array_elements_text(s.interests_snapshot)"
+                " WITH ORDINALITY AS e(name, pos) JOIN tags t ON t.name = e.name"
+                " ORDER BY e.pos)"
+            )
+            unmatched = op.get_bind().scalar(sa.text(
+                "SELECT count(*) FROM user_profile_snapshots"
+                " WHERE jsonb_array_length(interests_snapshot) <> cardinality(interest_tag_ids)"
+            ))
+            if unmatched:
+                log.warning(
+                    "%d snapshot(s) had interest names with no matching tag; "
+                    "the originals remain in interests_snapshot",
+                    unmatched,
+                )
+            op.alter_column("user_profile_snapshots", "interests_snapshot", nullable=True)
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_snapshot_tags "
+        "ON user_profile_snapshots USING gin (interest_tag_ids)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_snapshot_tags")
+    op.execute(
+        "ALTER TABLE user_profile_snapshots "
+        "ADD COLUMN IF NOT EXISTS interests_snapshot jsonb"
+    )
+    # Snapshots written after the upgrade only have IDs; map them back to names
+    op.execute(
+        "UPDATE user_profile_snapshots s SET interests_snapshot = coalesce(("
+        " SELECT jsonb_agg(t.name ORDER BY e.pos)"
+        " FROM unnest(s.interest_tag_ids) WITH ORDINALITY AS e(id, pos)"
+        " JOIN tags t ON t.id = e.id), '[]'::jsonb)"
+        " WHERE s.interests_snapshot IS NULL"
+    )
+    op.alter_column("user_profile_snapshots", "interests_snapshot", nullable=False)
+    op.drop_column("user_profile_snapshots", "interest_tag_ids")
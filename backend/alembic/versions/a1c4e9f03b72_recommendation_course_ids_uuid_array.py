@@ -0,0 +1,105 @@
+"""Store recommended course IDs as a native uuid[]
+
+Converts recommendations.recommended_course_ids from a JSONB array of UUID
+strings to uuid[]. Elements that aren't valid UUIDs (or a value that isn't
+an array at all) are skipped instead of failing the cast; the number of
+affected recommendations is logged.
+
+The JSONB values are kept in recommended_course_ids_jsonb, made nullable,
+until the conversion has been checked. Recommendations that lost IDs:
+
+    SELECT id, recommended_course_ids_jsonb, recommended_course_ids
+    FROM recommendations
+    WHERE recommended_course_ids_jsonb IS NOT NULL
+      AND (jsonb_typeof(recommended_course_ids_jsonb) <> 'array'
+           OR jsonb_array_length(recommended_course_ids_jsonb)
+              <> cardinality(recommended_course_ids));
+
+Dropping it is left to a later revision.
+
+Revision ID: a1c4e9f03b72
+Revises: 8d3f61a2c5e7
+Create Date: 2026-10-16 10:05:12
+"""
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "a1c4e9f03b72"
+down_revision: Union[str, None] = "8d3f61a2c5e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+UUID_PATTERN = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+
+def _column_type():
+    columns = sa.inspect(op.get_bind()).get_columns("recommendations")
+    return next((col["type"] for col in columns if col["name"] == "recommended_course_ids"), None)
+
+
+def upgrade() -> None:
+    if isinstance(_column_type(), JSONB):
+        # ALTER ... TYPE ... USING can't take a subquery, so go through a new column
+        op.execute(
+            "ALTER TABLE recommendations "
+            "ADD COLUMN recommended_course_ids_new uuid[] NOT NULL DEFAULT '{}'"
+        )
+        op.get_bind().execute(
+            sa.text(
+                "UPDATE recommendations SET recommended_course_ids_new = ARRAY("
+                " SELECT e.id::uuid FROM jsonb_array_elements_text("
+                "  CASE WHEN jsonb_typeof(recommended_course_ids) = 'array'"
+                "  THEN recommended_course_ids ELSE '[]'::jsonb END"
+                " ) WITH ORDINALITY AS e(id, pos)"
+                " WHERE e.id ~* :pattern ORDER BY e.pos)"
+            ),
+            {"pattern": UUID_PATTERN},
+        )
+        skipped = op.get_bind().scalar(sa.text(
+            "SELECT count(*) FROM recommendations"
+            " WHERE jsonb_typeof(recommended_course_ids) <> 'array'"
+            " OR jsonb_array_length(recommended_course_ids) <> cardinality(recommended_course_ids_new)"
+        ))
+        if skipped:
+            log.warning(
+                "%d recommendation(s) had course IDs that aren't UUIDs; "
+                "the originals remain in recommended_course_ids_jsonb",
+                skipped,
+            )
+        op.alter_column(
+            "recommendations", "recommended_course_ids",
+            new_column_name="recommended_course_ids_jsonb", nullable=True,
+        )
+        op.alter_column(
+            "recommendations", "recommended_course_ids_new",
+            new_column_name="recommended_course_ids", server_default=None,
+        )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_recommendation_courses "
+        "ON recommendations USING gin (recommended_course_ids)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_recommendation_courses")
+    op.execute(
+        "ALTER TABLE recommendations "
+        "ADD COLUMN IF NOT EXISTS recommended_course_ids_jsonb jsonb"
+    )
+    # Recommendations written after the upgrade only have the uuid[]
+    op.execute(
+        "UPDATE recommendations SET recommended_course_ids_jsonb = to_jsonb(recommended_course_ids)"
+        " WHERE recommended_course_ids_jsonb IS NULL"
+    )
+    op.drop_column("recommendations", "recommended_course_ids")
+    op.alter_column(
+        "recommendations", "recommended_course_ids_jsonb",
+        new_column_name="recommended_course_ids", nullable=False,
+    )
@@ -0,0 +1,80 @@
+"""Store enum columns as native PostgreSQL enum types
+
+Older tables stored enums as VARCHAR (native_enum=False). Both store the
+member name, so each column is a straight text -> enum cast; indexes on the
+column are rebuilt by the ALTER, which holds an ACCESS EXCLUSIVE lock on the
+table while it rewrites it.
+
+Revision ID: c7e2b5d18f90
+Revises: a1c4e9f03b72
+Create Date: 2026-10-16 10:41:57
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c7e2b5d18f90"
+down_revision: Union[str, None] = "a1c4e9f03b72"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Member names as of this revision (later additions ship in their own revision)
+ENUM_TYPES = {
+    "difficulty_level": ("BEGINNER", "INTERMEDIATE", "ADVANCED"),
+    "time_commitment": ("HOURS_1_5", "HOURS_5_10", "HOURS_10_20", "HOURS_20_PLUS"),
+    "tag_category": (
+        "PROGRAMMING", "DATA_SCIENCE", "DEVOPS", "BUSINESS", "MARKETING", "DESIGN",
+        "SOFT_SKILLS", "HR_TALENT", "SECURITY", "SUSTAINABILITY", "OTHER",
+    ),
+}
+
+# (table, column, enum type)
+ENUM_COLUMNS = (
+    ("courses", "difficulty", "difficulty_level"),
+    ("tags", "category", "tag_category"),
+    ("user_profiles", "current_level", "difficulty_level"),
+    ("user_profiles", "time_commitment", "time_commitment"),
+    ("user_profile_snapshots", "current_level", "difficulty_level"),
+    ("user_profile_snapshots", "time_commitment", "time_commitment"),
+)
+
+
+def _data_type(table: str, column: str):
+    return op.get_bind().scalar(
+        sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for type_name, members in ENUM_TYPES.items():
+        postgresql.ENUM(*members, name=type_name, create_type=False).create(bind, checkfirst=True)
+
+    for table, column, type_name in ENUM_COLUMNS:
+        if _data_type(table, column) != "character varying":
+            continue
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE {type_name} USING {column}::text::{type_name}'
+        )
+
+
+def downgrade() -> None:
+    for table, column, type_name in ENUM_COLUMNS:
+        if _data_type(table, column) != "USER-DEFINED":
+            continue
+        length = max(len(member) for member in ENUM_TYPES[type_name])
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE varchar({length}) USING {column}::text"
+        )
+
+    bind = op.get_bind()
+    for type_name, members in ENUM_TYPES.items():
+        postgresql.ENUM(*members, name=type_name, create_type=False).drop(bind, checkfirst=True)
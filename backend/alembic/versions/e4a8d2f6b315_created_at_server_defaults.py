@@ -0,0 +1,42 @@
+"""Default created_at/updated_at to now() on the server
+
+These columns moved from Python-side defaults to server defaults, so inserts
+that leave them out (bulk inserts, raw SQL) would otherwise be rejected by
+tables created before the change. SET DEFAULT only touches the catalog; no
+rows are rewritten.
+
+Revision ID: e4a8d2f6b315
+Revises: c7e2b5d18f90
+Create Date: 2026-10-16 11:12:40
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e4a8d2f6b315"
+down_revision: Union[str, None] = "c7e2b5d18f90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column)
+TIMESTAMP_COLUMNS = (
+    ("courses", "created_at"),
+    ("tags", "created_at"),
+    ("skills", "created_at"),
+    ("recommendations", "created_at"),
+    ("llm_metrics", "created_at"),
+    ("user_profiles", "created_at"),
+    ("user_profiles", "updated_at"),
+    ("user_profile_snapshots", "created_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
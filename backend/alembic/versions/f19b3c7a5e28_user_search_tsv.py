@@ -0,0 +1,30 @@
+"""Add the generated user.search_tsv column for admin search
+
+A STORED generated column is filled for existing rows as part of the ALTER
+(a table rewrite), so no backfill is needed.
+
+Revision ID: f19b3c7a5e28
+Revises: e4a8d2f6b315
+Create Date: 2026-10-16 11:38:03
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "f19b3c7a5e28"
+down_revision: Union[str, None] = "e4a8d2f6b315"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS search_tsv tsvector '
+        "GENERATED ALWAYS AS (to_tsvector('simple', translate(email, '@.', '  '))) STORED"
+    )
+    op.execute('CREATE INDEX IF NOT EXISTS idx_user_search_tsv ON "user" USING gin (search_tsv)')
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_user_search_tsv")
+    op.execute('ALTER TABLE "user" DROP COLUMN IF EXISTS search_tsv')
@@ -3,9 +3,10 @@ Admin routes for user management and analytics.
 
 All endpoints require superuser authentication.
 """
+import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional, Tuple
 
 import csv
 import io
@@ -15,6 +16,8 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy import select, func, cast, Date
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import AsyncTTLCache
+from core.config import settings
 from core.database import get_async_session
 from core.users import current_superuser
 from models.user import User
@@ -23,11 +26,11 @@ from models.course import Tag, Course
 from models.recommendation import Recommendation
 from repositories.user_repository import UserRepository
 from schemas.admin import (
-    UserListItem,
+    UserListItemListAdapter,
     UserListResponse,
     UserDetailResponse,
     ProfileSummary,
-    SnapshotRead,
+    SnapshotListAdapter,
     SnapshotListResponse,
     AnalyticsOverview,
     PopularTag,
@@ -48,8 +51,21 @@ from schemas.admin import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Dashboard aggregates change slowly; polls within the TTL share one
+# computation (concurrent misses wait on a single load)
+_analytics_cache = AsyncTTLCache(
+    maxsize=8, ttl_seconds=settings.ADMIN_ANALYTICS_CACHE_TTL_SECONDS
+)
+
+
+def clear_analytics_cache() -> None:
+    """Drop cached analytics (call after bulk user/profile changes)."""
+    _analytics_cache.clear()
+
 
 # ============================================================================
 # User Management Endpoints
@@ -60,10 +76,11 @@ router = APIRouter()
 async def list_users(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Max records to return"),
-    email: Optional[str] = Query(None, description="Email substring search"),
+    email: Optional[str] = Query(None, description="Email substring search; several words match as email tokens"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     is_superuser: Optional[bool] = Query(None, description="Filter by superuser status"),
     profile_status: Optional[str] = Query(None, description="Filter by profile completion: complete, partial, empty"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
     _: User = Depends(current_superuser),
     db: AsyncSession = Depends(get_async_session),
 ):
@@ -72,85 +89,31 @@ async def list_users(
 
     Supports pagination and filtering by email, is_active, is_superuser, profile_status.
     Profile status: complete (all fields), partial (some fields), empty (no fields).
+    Deep pages should use the keyset cursor: pass next_cursor back as `after`.
     """
     repo = UserRepository(db)
-    users, total = await repo.get_users_with_filters(
+    users, total, next_cursor = await repo.get_users_with_filters(
         skip=skip,
         limit=limit,
         email_search=email,
         is_active=is_active,
         is_superuser=is_superuser,
+        after_email=after,
+        profile_status=profile_status,
     )
 
-    # Build response with profile summaries
-    user_items = []
-    for user in users:
-        # Get profile summary for each user
-        profile_result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == user.id)
-        )
-        profile = profile_result.scalar_one_or_none()
-
-        interest_count = 0
-        has_learning_goal = False
-        has_level = False
-        has_time_commitment = False
-        current_level = None
-
-        if profile:
-            has_learning_goal = profile.learning_goal is not None
-            has_level = profile.current_level is not None
-            has_time_commitment = profile.time_commitment is not None
-            current_level = profile.current_level.value if profile.current_level else None
-            # Count interests
-            count_result = await db.execute(
-                select(func.count())
-                .select_from(UserInterest)
-                .where(UserInterest.user_profile_id == profile.id)
-            )
-            interest_count = count_result.scalar() or 0
-
-        # Determine profile completion status for filtering
-        filled_fields = sum([has_learning_goal, has_level, has_time_commitment, interest_count > 0])
-        if filled_fields == 4:
-            user_profile_status = "complete"
-        elif filled_fields == 0:
-            user_profile_status = "empty"
-        else:
-            user_profile_status = "partial"
-
-        # Skip user if profile_status filter doesn't match
-        if profile_status and user_profile_status != profile_status:
-            continue
-
-        user_items.append(UserListItem(
-            id=user.id,
-            email=user.email,
-            is_active=user.is_active,
-            is_superuser=user.is_superuser,
-            is_verified=user.is_verified,
-            has_learning_goal=has_learning_goal,
-            has_level=has_level,
-            has_time_commitment=has_time_commitment,
-            interest_count=interest_count,
-            current_level=current_level,
-        ))
-
-    # Adjust total count if profile_status filter applied
-    if profile_status:
-        total = len(user_items)
-
     return UserListResponse(
-        users=user_items,
+        users=UserListItemListAdapter.validate_python(users),
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/users/export")
 async def export_users(
-    email: Optional[str] = Query(None, description="Email substring search"),
+    email: Optional[str] = Query(None, description="Email substring search; several words match as email tokens"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     profile_status: Optional[str] = Query(None, description="Filter by profile completion: complete, partial, empty"),
     _: User = Depends(current_superuser),
@@ -162,16 +125,25 @@ async def export_users(
     Same filters as /users endpoint but returns all matching users as CSV.
     """
     repo = UserRepository(db)
-    # Fetch all users without pagination
-    users, _ = await repo.get_users_with_filters(
-        skip=0,
-        limit=10000,  # High limit for export
+    rows = repo.stream_users_with_profiles(
         email_search=email,
         is_active=is_active,
         is_superuser=None,
+        profile_status=profile_status,
     )
 
-    # Build CSV in memory
+    return StreamingResponse(
+        _users_csv(rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=users.csv"}
+    )
+
+
+async def _users_csv(
+    rows: AsyncIterator[Tuple[User, Optional[UserProfile], int]],
+    chunk_rows: int = 500,
+) -> AsyncIterator[str]:
+    """Render streamed (user, profile, interest count) rows as CSV chunks."""
     output = io.StringIO()
     writer = csv.writer(output)
 
@@ -182,51 +154,17 @@ async def export_users(
     ])
 
     # Data rows
-    for user in users:
-        # Get profile data
-        profile_result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == user.id)
-        )
-        profile = profile_result.scalar_one_or_none()
-
-        # Profile fields
-        has_learning_goal = False
-        has_level = False
-        has_time_commitment = False
+    pending = 0
+    async for user, profile, interest_count in rows:
         current_level = None
         learning_goal = None
         time_commitment = None
-        interest_count = 0
 
         if profile:
-            has_learning_goal = profile.learning_goal is not None
-            has_level = profile.current_level is not None
-            has_time_commitment = profile.time_commitment is not None
             current_level = profile.current_level.value if profile.current_level else None
             learning_goal = profile.learning_goal
             time_commitment = profile.time_commitment.value if profile.time_commitment else None
 
-            # Count interests
-            count_result = await db.execute(
-                select(func.count())
-                .select_from(UserInterest)
-                .where(UserInterest.user_profile_id == profile.id)
-            )
-            interest_count = count_result.scalar() or 0
-
-        # Determine profile status for filtering
-        filled_fields = sum([has_learning_goal, has_level, has_time_commitment, interest_count > 0])
-        if filled_fields == 4:
-            user_profile_status = "complete"
-        elif filled_fields == 0:
-            user_profile_status = "empty"
-        else:
-            user_profile_status = "partial"
-
-        # Skip if profile_status filter doesn't match
-        if profile_status and user_profile_status != profile_status:
-            continue
-
         writer.writerow([
             user.email,
             'Active' if user.is_active else 'Inactive',
@@ -238,13 +176,15 @@ async def export_users(
             str(interest_count),
         ])
 
-    output.seek(0)
+        # Hand off a chunk every chunk_rows rows to keep the buffer small
+        pending += 1
+        if pending == chunk_rows:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+            pending = 0
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=users.csv"}
-    )
+    yield output.getvalue()
 
 
 @router.get("/users/{user_id}", response_model=UserDetailResponse)
@@ -335,7 +275,7 @@ async def deactivate_user(
         db.add(activity_log)
         await db.commit()
     except Exception as e:
-        print(f"Failed to log deactivation activity: {e}")
+        logger.warning(f"Failed to log deactivation activity: {e}")
 
     # Get profile for response
     result = await repo.get_user_with_profile(user_id)
@@ -389,18 +329,7 @@ async def get_user_profile_history(
     repo = UserRepository(db)
     snapshots = await repo.get_user_profile_snapshots(user_id, limit=limit)
 
-    snapshot_items = [
-        SnapshotRead(
-            id=s.id,
-            version=s.version,
-            learning_goal=s.learning_goal,
-            current_level=s.current_level,
-            time_commitment=s.time_commitment,
-            interests_snapshot=s.interests_snapshot if isinstance(s.interests_snapshot, list) else [],
-            created_at=s.created_at,
-        )
-        for s in snapshots
-    ]
+    snapshot_items = SnapshotListAdapter.validate_python(snapshots, from_attributes=True)
 
     return SnapshotListResponse(
         snapshots=snapshot_items,
@@ -420,63 +349,31 @@ async def get_analytics_overview(
 ):
     """
     Get system-wide analytics overview (superuser only).
-    """
-    repo = UserRepository(db)
-
-    stats = await repo.get_user_count_stats()
-    completion_rate = await repo.get_profile_completion_rate()
 
-    # Calculate new registrations in last 7 and 30 days
-    now = datetime.utcnow()
-    seven_days_ago = now - timedelta(days=7)
-    thirty_days_ago = now - timedelta(days=30)
-
-    new_7d_result = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= seven_days_ago)
-    )
-    new_registrations_7d = new_7d_result.scalar() or 0
-
-    new_30d_result = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= thirty_days_ago)
-    )
-    new_registrations_30d = new_30d_result.scalar() or 0
-
-    # Calculate average profile updates (version number)
-    avg_version_result = await db.execute(
-        select(func.avg(UserProfile.version))
+    Served from an in-process cache for ADMIN_ANALYTICS_CACHE_TTL_SECONDS,
+    so counts may lag registrations by up to that long.
+    """
+    return await _analytics_cache.get_or_create(
+        b"overview", lambda: _compute_analytics_overview(db)
     )
-    avg_profile_updates = avg_version_result.scalar() or 0.0
-
-    # Calculate complete profiles count (all 4 fields filled)
-    profiles_result = await db.execute(select(UserProfile))
-    profiles = profiles_result.scalars().all()
-    complete_count = 0
 
-    for profile in profiles:
-        interest_count_result = await db.execute(
-            select(func.count())
-            .select_from(UserInterest)
-            .where(UserInterest.user_profile_id == profile.id)
-        )
-        interest_count = interest_count_result.scalar() or 0
 
-        has_goal = profile.learning_goal is not None
-        has_level = profile.current_level is not None
-        has_time = profile.time_commitment is not None
-        has_interests = interest_count > 0
+async def _compute_analytics_overview(db: AsyncSession) -> AnalyticsOverview:
+    """Aggregate the overview counters from the database."""
+    repo = UserRepository(db)
 
-        if all([has_goal, has_level, has_time, has_interests]):
-            complete_count += 1
+    stats = await repo.get_user_count_stats()
+    profile_stats = await repo.get_profile_stats()
 
     return AnalyticsOverview(
         total_users=stats["total_users"],
         active_users=stats["active_users"],
         superuser_count=stats["superuser_count"],
-        new_registrations_7d=new_registrations_7d,
-        new_registrations_30d=new_registrations_30d,
-        profile_completion_rate=completion_rate,
-        avg_profile_updates=round(avg_profile_updates, 1),
-        profiles_complete_count=complete_count,
+        new_registrations_7d=stats["new_registrations_7d"],
+        new_registrations_30d=stats["new_registrations_30d"],
+        profile_completion_rate=profile_stats["completion_rate"],
+        avg_profile_updates=round(profile_stats["avg_version"], 1),
+        profiles_complete_count=profile_stats["complete_count"],
     )
 
 
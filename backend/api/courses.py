@@ -19,6 +19,7 @@ from core.users import current_active_user
 from models.user import User
 from models.course import Course, Tag, Skill
 from models.enums import DifficultyLevel
+from models.ids import id_in
 
 
 router = APIRouter()
@@ -60,7 +61,7 @@ async def list_courses(
 
     # Filter by tags (courses with at least one matching tag)
     if tag_ids:
-        query = query.join(Course.tags).where(Tag.id.in_(tag_ids))
+        query = query.join(Course.tags).where(id_in(Tag.id, tag_ids))
 
     # Apply pagination
     query = query.offset(offset).limit(limit)
@@ -79,6 +79,7 @@ async def update_my_profile(
             current_level=profile_data.current_level,
             time_commitment=profile_data.time_commitment,
             interest_tag_ids=profile_data.interest_tag_ids,
+            user_email=user.email,
         )
         return updated_profile
     except ValueError as e:
@@ -7,6 +7,9 @@ Provides:
 - Recommendation history (stub)
 - Recommendation quota (stub)
 """
+import asyncio
+from typing import Union
+
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi_users import exceptions
 from fastapi_users.password import PasswordHelper
@@ -14,6 +17,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_async_session
+from core.responses import ORJSONResponse
 from core.users import fastapi_users, current_active_user
 from schemas.user import UserRead, UserUpdate
 from schemas.auth import PasswordChangeRequest
@@ -26,6 +30,7 @@ from schemas.recommendation import (
 )
 from models.user import User
 from models.course import Course
+from models.ids import id_in
 from services.recommendation_service import RecommendationService
 
 
@@ -63,22 +68,28 @@ async def change_password(
     password_helper = PasswordHelper()
 
     # Verify old password
-    verified, _ = password_helper.verify_and_update(
-        password_data.old_password, user.hashed_password
+    # Hashing is CPU-bound; run it in a worker thread, not on the event loop
+    verified, _ = await asyncio.to_thread(
+        password_helper.verify_and_update, password_data.old_password, user.hashed_password
     )
 
     if not verified:
         raise HTTPException(status_code=400, detail="Incorrect old password")
 
     # Update password
-    user.hashed_password = password_helper.hash(password_data.new_password)
+    user.hashed_password = await asyncio.to_thread(
+        password_helper.hash, password_data.new_password
+    )
     db.add(user)
     await db.commit()
 
     return None
 
 
-@router.post("/me/recommendations")
+@router.post(
+    "/me/recommendations",
+    response_model=Union[RecommendationRead, ClarificationResponse],
+)
 async def generate_recommendations(
     request: RecommendationRequest,
     user: User = Depends(current_active_user),
@@ -104,9 +115,10 @@ async def generate_recommendations(
 
     # Handle clarification responses (vague/irrelevant queries)
     if result.get("type") == "clarification_needed":
-        return ClarificationResponse(**result)
+        return ORJSONResponse(ClarificationResponse(**result).model_dump())
 
-    return RecommendationRead(**result)
+    # Validated once, then serialized by orjson (no response-model pass)
+    return ORJSONResponse(RecommendationRead(**result).model_dump())
 
 
 @router.get("/me/recommendations", response_model=RecommendationListResponse)
@@ -136,7 +148,7 @@ async def get_my_recommendations(
     course_titles = {}
     if all_course_ids:
         result = await db.execute(
-            select(Course.id, Course.title).where(Course.id.in_(all_course_ids))
+            select(Course.id, Course.title).where(id_in(Course.id, all_course_ids))
         )
         for course_id, title in result.all():
             course_titles[str(course_id)] = title
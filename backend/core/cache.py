@@ -0,0 +1,70 @@
+"""
+In-process caching primitives shared across the app.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """
+    LRU cache with per-entry expiry and single-flight loading.
+
+    Concurrent misses on the same key wait on one per-key lock, so only the
+    first caller runs the (expensive) factory.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        # key -> [lock, number of callers using it]
+        self._locks: Dict[bytes, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Store a value, evicting the least recently used entries over maxsize."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    async def get_or_create(self, key: bytes, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, running factory once on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        slot = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        slot[1] += 1
+        try:
+            async with slot[0]:
+                value = self.get(key)
+                if value is None:
+                    value = await factory()
+                    self.set(key, value)
+                return value
+        finally:
+            slot[1] -= 1
+            if slot[1] == 0:
+                del self._locks[key]
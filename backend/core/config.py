@@ -28,16 +28,28 @@ class Settings(BaseSettings):
     # Demo User Seeding (for assessment/demos)
     SEED_DEMO_USERS: bool = False
     DEMO_USER_PASSWORD: Optional[str] = None
+    DEMO_SEED: Optional[int] = None  # Fixed seed for reproducible demo data
 
     # OpenAI / LLM Configuration
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-5-nano"
     OPENAI_TEMPERATURE: float = 0.3  # Lower for more consistent outputs
     OPENAI_TIMEOUT_SECONDS: int = 120
+    # Optional cap on the intent call; on timeout the query is treated as "specific"
+    INTENT_TIMEOUT_SECONDS: Optional[float] = None
 
     # LLM Feature Flags
     LLM_ENABLED: bool = True
     LLM_DEBUG_MODE: bool = False  # Log prompts/responses when True
+    LLM_TWO_STAGE_PARSING: bool = False  # Free-text answer, then JSON via parser model
+    OPENAI_PARSER_MODEL: str = "gpt-4o-mini"  # Small model for two-stage JSON parsing
+    LLM_COMPACT_SCHEMAS: bool = False  # Strip field descriptions from response_format schemas
+    PROFILE_ANALYSIS_CACHE_SIZE: int = 4096  # 0 disables the profile analysis cache
+    PROFILE_ANALYSIS_CACHE_TTL_SECONDS: int = 600
+    ADMIN_ANALYTICS_CACHE_TTL_SECONDS: int = 60  # 0 disables the analytics overview cache
+
+    # Runtime checks
+    PYDANTIC_ALLOW_PURE_PY: bool = False  # Dev only: boot without compiled pydantic-core
 
     # API
     API_V1_STR: str = "/api/v1"
@@ -4,13 +4,17 @@ Database engine and session management.
 This module provides the async SQLAlchemy engine, session factory,
 and FastAPI dependency injection for database sessions.
 """
+import logging
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from .config import settings
+from .logging import STARTUP_LOGGER
 from models.base import Base
 
+log = logging.getLogger(STARTUP_LOGGER)
+
 
 # Create async SQLAlchemy engine
 # echo=False: Set to True for SQL query logging during development
@@ -20,7 +24,14 @@ engine = create_async_engine(
     echo=False,  # Set to True to see SQL queries
     pool_pre_ping=True,  # Verify connections before use
     pool_size=10,        # Connection pool size
-    max_overflow=20      # Allow up to 30 total connections
+    max_overflow=20,     # Allow up to 30 total connections
+    # Per-connection caches of server-side prepared statements. Hot queries
+    # keep stable SQL text (lambda_stmt, ANY($1) binds), so each is parsed
+    # and planned once per connection.
+    connect_args={
+        "prepared_statement_cache_size": 256,  # SQLAlchemy adapter cache
+        "statement_cache_size": 256,           # asyncpg's own cache
+    },
 )
 
 # Async session factory
@@ -35,12 +46,14 @@ async def init_db() -> None:
     """
     Initialize database by creating all tables asynchronously.
 
-    Uses Base.metadata.create_all() - no Alembic migrations for MVP.
+    Uses Base.metadata.create_all(), which only creates missing tables.
+    Changes to existing tables ship as Alembic revisions (alembic/versions)
+    and are applied explicitly with `alembic upgrade head`, not at startup.
     This is idempotent - safe to call multiple times.
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    print("Database tables created successfully")
+    log.info("Database tables created successfully")
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -5,9 +5,12 @@ Configures Python logging to output JSON format for better observability.
 """
 
 import logging
+import logging.handlers
 import sys
 from pythonjsonlogger import jsonlogger
 
+STARTUP_LOGGER = "acmelearn.startup"
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
@@ -38,4 +41,20 @@ def setup_logging(level: str = "INFO") -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
+    # Startup messages are buffered and written in one go once startup is
+    # done (or immediately when an error is logged)
+    startup_logger = logging.getLogger(STARTUP_LOGGER)
+    startup_logger.handlers = [
+        logging.handlers.MemoryHandler(
+            capacity=100, flushLevel=logging.ERROR, target=handler
+        )
+    ]
+    startup_logger.propagate = False
+
     logging.info("JSON logging initialized", extra={"level": level})
+
+
+def flush_startup_logs() -> None:
+    """Write out any buffered startup log records."""
+    for handler in logging.getLogger(STARTUP_LOGGER).handlers:
+        handler.flush()
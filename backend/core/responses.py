@@ -0,0 +1,23 @@
+"""
+Response classes shared across the API.
+"""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Routes that return one of these skip FastAPI's response-model pass
+    (validate, dump, jsonable_encoder, json.dumps); the body is serialized
+    once by orjson, which handles UUIDs and datetimes natively. UTC
+    datetimes end in "Z", as in Pydantic's JSON output. The route's
+    response_model still documents the shape in OpenAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
@@ -3,6 +3,7 @@ User manager for authentication hooks.
 
 Handles on_after_register to create UserProfile and initial snapshot.
 """
+import logging
 import uuid
 from typing import Optional
 
@@ -11,11 +12,13 @@ from fastapi_users import BaseUserManager, UUIDIDMixin
 
 from models.user import User
 from models.user_profile import UserProfile
-from models.user_profile_snapshot import UserProfileSnapshot
+from repositories.user_profile_repository import UserProfileRepository
 from core.database import get_async_session
 from core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     """
@@ -40,7 +43,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
 
         Both created in same transaction for atomicity.
         """
-        print(f"User {user.id} has registered.")
+        logger.info(f"User {user.id} has registered.")
 
         # Get DB session from the user_db
         from sqlalchemy.ext.asyncio import AsyncSession
@@ -61,19 +64,20 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         await db.flush()  # Get profile.id
 
         # Create initial snapshot (version 1, all fields empty)
-        snapshot = UserProfileSnapshot(
-            user_profile_id=profile.id,
-            version=1,
-            learning_goal=None,
-            current_level=None,
-            time_commitment=None,
-            interests_snapshot=[],  # Empty list
-        )
-
-        db.add(snapshot)
+        await UserProfileRepository(db).bulk_snapshot([
+            dict(
+                user_profile_id=profile.id,
+                version=1,
+                learning_goal=None,
+                current_level=None,
+                time_commitment=None,
+                interest_tag_ids=[],  # No interests yet
+                interests_snapshot=[],
+            )
+        ])
         await db.commit()
 
-        print(f"Created empty profile {profile.id} and initial snapshot for user {user.id}")
+        logger.info(f"Created empty profile {profile.id} and initial snapshot for user {user.id}")
 
         # Log registration event (non-blocking)
         try:
@@ -88,7 +92,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             db.add(activity_log)
             await db.commit()
         except Exception as e:
-            print(f"Failed to log registration activity: {e}")
+            logger.warning(f"Failed to log registration activity: {e}")
 
 
 async def get_user_manager(session: AsyncSession = Depends(get_async_session)):
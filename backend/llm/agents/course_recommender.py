@@ -13,21 +13,36 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from llm.config import get_llm
 from llm.exceptions import LLMNoCoursesError, LLMTimeoutError, LLMValidationError
-from llm.prompts.course_recommender import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
-from llm.schemas import ProfileAnalysis, RecommendationOutput
+from llm.prompts.course_recommender import SYSTEM_PROMPT, USER_PROMPT_PREFIX, USER_PROMPT_REST
+from llm.prompts.template import CompiledTemplate
+from llm.schemas import (
+    RECOMMENDATION_ADAPTER,
+    RECOMMENDATION_RESPONSE_FORMAT,
+    ProfileAnalysis,
+    RecommendationOutput,
+)
 
 logger = logging.getLogger(__name__)
 
+# The system prompt never changes, so its message is built once at import
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+# The variable part of the user prompt is parsed once, not on every render
+USER_PROMPT = CompiledTemplate(USER_PROMPT_REST)
+
+# The user prompt's static lead-in goes first as its own content block, so the
+# request prefix stays byte-identical across users for provider prefix caching
+PROMPT_PREFIX_BLOCK = {"type": "text", "text": USER_PROMPT_PREFIX}
+
 
 class CourseRecommenderAgent:
     """
     Agent 2: Generates course recommendations based on profile analysis.
 
-    Uses LangChain v1.0 `.with_structured_output()` for type-safe responses.
+    Requests JSON-schema output and validates it with a pydantic TypeAdapter.
     """
 
     def __init__(self):
-        self.llm = get_llm().with_structured_output(RecommendationOutput)
+        self.llm = get_llm().bind(response_format=RECOMMENDATION_RESPONSE_FORMAT)
 
     async def recommend(
         self,
@@ -61,9 +76,10 @@ class CourseRecommenderAgent:
         messages = self._build_messages(analysis, courses, query, num_courses)
 
         try:
-            # Invoke LLM with structured output and optional callbacks
+            # Invoke LLM with JSON-schema output and optional callbacks
             config = {"callbacks": callbacks} if callbacks else {}
-            result = await self.llm.ainvoke(messages, config=config)
+            message = await self.llm.ainvoke(messages, config=config)
+            result = RECOMMENDATION_ADAPTER.validate_json(message.content)
 
             # Validate course IDs exist in filtered list
             valid_ids = {c["id"] for c in courses}
@@ -109,23 +125,25 @@ class CourseRecommenderAgent:
         courses_json = json.dumps(courses_formatted, indent=2)
 
         # Build user prompt
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            skill_level=analysis.skill_level,
-            skill_gaps=(
-                ", ".join(analysis.skill_gaps[:3]) if analysis.skill_gaps else "None identified"
-            ),
-            time_constraint_hours=analysis.time_constraint_hours,
-            personalization_note=analysis.personalization_note,
-            profile_completeness=analysis.profile_completeness,
-            profile_confidence=analysis.confidence,
-            courses_json=courses_json,
-            user_query=query or "Recommend the best courses for my profile",
-            num_courses=num_courses,
+        user_prompt = USER_PROMPT.render(
+            dict(
+                skill_level=analysis.skill_level,
+                skill_gaps=(
+                    ", ".join(analysis.skill_gaps[:3]) if analysis.skill_gaps else "None identified"
+                ),
+                time_constraint_hours=analysis.time_constraint_hours,
+                personalization_note=analysis.personalization_note,
+                profile_completeness=analysis.profile_completeness,
+                profile_confidence=analysis.confidence,
+                courses_json=courses_json,
+                user_query=query or "Recommend the best courses for my profile",
+                num_courses=num_courses,
+            )
         )
 
         return [
-            SystemMessage(content=SYSTEM_PROMPT),
-            HumanMessage(content=user_prompt),
+            SYSTEM_MESSAGE,
+            HumanMessage(content=[PROMPT_PREFIX_BLOCK, {"type": "text", "text": user_prompt}]),
         ]
 
     def _validate_course_ids(
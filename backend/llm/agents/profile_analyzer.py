@@ -10,26 +10,43 @@ from typing import List, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from core.config import settings
+from llm.cache import profile_analysis_cache, profile_cache_key
 from llm.config import get_llm
 from llm.exceptions import LLMTimeoutError, LLMValidationError
-from llm.prompts.profile_analyzer import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
-from llm.schemas import ProfileAnalysis
+from llm.prompts.profile_analyzer import SYSTEM_PROMPT, USER_PROMPT_PREFIX, USER_PROMPT_REST
+from llm.prompts.template import CompiledTemplate
+from llm.schemas import (
+    PROFILE_ANALYSIS_ADAPTER,
+    PROFILE_ANALYSIS_RESPONSE_FORMAT,
+    ProfileAnalysis,
+)
+from llm.two_stage import call_structured
 from models.user_profile import UserProfile
 from models.user_profile_snapshot import UserProfileSnapshot
 
 logger = logging.getLogger(__name__)
 
+# The system prompt never changes, so its message is built once at import
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+# The variable part of the user prompt is parsed once, not on every render
+USER_PROMPT = CompiledTemplate(USER_PROMPT_REST)
+
+# The user prompt's static lead-in goes first as its own content block, so the
+# request prefix stays byte-identical across users for provider prefix caching
+PROMPT_PREFIX_BLOCK = {"type": "text", "text": USER_PROMPT_PREFIX}
+
 
 class ProfileAnalyzerAgent:
     """
     Agent 1: Analyzes user profile to understand learning context.
 
-    Uses LangChain v1.0 `.with_structured_output()` for type-safe responses.
+    Requests JSON-schema output and validates it with a pydantic TypeAdapter.
     """
 
     def __init__(self):
-        # Get LLM with structured output enforcement
-        self.llm = get_llm().with_structured_output(ProfileAnalysis)
+        # Get LLM with JSON-schema output enforcement
+        self.llm = get_llm().bind(response_format=PROFILE_ANALYSIS_RESPONSE_FORMAT)
 
     async def analyze(
         self,
@@ -58,13 +75,34 @@ class ProfileAnalyzerAgent:
             logger.info(f"Empty profile for user {profile.user_id}, returning default")
             return self._default_analysis(profile, query)
 
+        # Reuse a recent analysis for the same query, profile fields and
+        # history; concurrent identical requests share one LLM call
+        return await profile_analysis_cache.get_or_create(
+            profile_cache_key(profile, history, query),
+            lambda: self._invoke_llm(profile, history, query, callbacks),
+        )
+
+    async def _invoke_llm(
+        self,
+        profile: UserProfile,
+        history: List[UserProfileSnapshot],
+        query: Optional[str],
+        callbacks: Optional[List],
+    ) -> ProfileAnalysis:
+        """Run the LLM analysis (uncached)."""
         # Build prompt messages
         messages = self._build_messages(profile, history, query)
 
         try:
-            # Invoke LLM with structured output and optional callbacks
+            # Invoke LLM with JSON-schema output and optional callbacks
             config = {"callbacks": callbacks} if callbacks else {}
-            result = await self.llm.ainvoke(messages, config=config)
+            if settings.LLM_TWO_STAGE_PARSING:
+                result = await call_structured(
+                    messages, ProfileAnalysis, PROFILE_ANALYSIS_ADAPTER, config
+                )
+            else:
+                message = await self.llm.ainvoke(messages, config=config)
+                result = PROFILE_ANALYSIS_ADAPTER.validate_json(message.content)
 
             logger.info(
                 f"Profile analysis complete: user={profile.user_id}, "
@@ -95,7 +133,7 @@ class ProfileAnalyzerAgent:
         """Return low-confidence default for empty profiles."""
         return ProfileAnalysis(
             skill_level=profile.current_level.value if profile.current_level else "beginner",
-            skill_gaps=["Define your learning goals", "Identify areas of interest"],
+            skill_gaps=("Define your learning goals", "Identify areas of interest"),
             time_constraint_hours=self._parse_time_commitment(profile.time_commitment),
             personalization_note="Profile incomplete - please add your learning goal and interests for personalized recommendations.",
             profile_completeness="minimal",
@@ -123,18 +161,20 @@ class ProfileAnalyzerAgent:
         time_str = profile.time_commitment.value if profile.time_commitment else "Not specified"
 
         # Build user prompt from template
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            learning_goal=profile.learning_goal or "Not specified",
-            current_level=profile.current_level.value if profile.current_level else "Not specified",
-            time_commitment=time_str,
-            interests=interests_text,
-            profile_history=history_text,
-            user_query=query or "No specific request - recommend based on my profile",
+        user_prompt = USER_PROMPT.render(
+            dict(
+                learning_goal=profile.learning_goal or "Not specified",
+                current_level=profile.current_level.value if profile.current_level else "Not specified",
+                time_commitment=time_str,
+                interests=interests_text,
+                profile_history=history_text,
+                user_query=query or "No specific request - recommend based on my profile",
+            )
         )
 
         return [
-            SystemMessage(content=SYSTEM_PROMPT),
-            HumanMessage(content=user_prompt),
+            SYSTEM_MESSAGE,
+            HumanMessage(content=[PROMPT_PREFIX_BLOCK, {"type": "text", "text": user_prompt}]),
         ]
 
     def _format_history(self, history: List[UserProfileSnapshot]) -> str:
@@ -0,0 +1,87 @@
+"""
+Batched profile analysis.
+
+Packs several Agent 1 prompts into a single LLM call so bulk paths (admin
+recomputes, seeding) share one system prompt and one round trip instead of
+paying per-user request overhead.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from llm.config import get_llm
+from llm.exceptions import LLMTimeoutError, LLMValidationError
+from llm.prompts.profile_analyzer import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from llm.prompts.template import CompiledTemplate
+from llm.schemas import (
+    PROFILE_ANALYSIS_BATCH_ADAPTER,
+    ProfileAnalysis,
+    ProfileAnalysisBatch,
+    json_schema_response_format,
+)
+
+logger = logging.getLogger(__name__)
+
+USER_BOUNDARY = "\n---USER_BOUNDARY---\n"
+
+BATCH_SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+BATCH_USER_PROMPT = CompiledTemplate(USER_PROMPT_TEMPLATE)
+
+BATCH_INSTRUCTION = (
+    "Analyze each learner below independently. Learners are separated by "
+    f"{USER_BOUNDARY.strip()!r}. Return one analysis per learner in `analyses`, "
+    "in the same order.\n"
+)
+
+
+async def analyze_profiles_batch(
+    contexts: List[Dict[str, Any]],
+    callbacks: Optional[List] = None,
+) -> List[ProfileAnalysis]:
+    """
+    Analyze several learner profiles with one LLM call.
+
+    Args:
+        contexts: Prompt fields per learner (learning_goal, current_level,
+            time_commitment, interests, profile_history, user_query);
+            missing fields render as "unknown"
+        callbacks: Optional LangChain callbacks
+
+    Returns:
+        One ProfileAnalysis per context, in input order
+
+    Raises:
+        LLMTimeoutError: If request times out
+        LLMValidationError: If the response fails validation or the count differs
+    """
+    if not contexts:
+        return []
+
+    prompts = [BATCH_USER_PROMPT.render(ctx) for ctx in contexts]
+    messages = [
+        BATCH_SYSTEM_MESSAGE,
+        HumanMessage(content=BATCH_INSTRUCTION + USER_BOUNDARY.join(prompts)),
+    ]
+
+    llm = get_llm().bind(response_format=json_schema_response_format(ProfileAnalysisBatch))
+    try:
+        config = {"callbacks": callbacks} if callbacks else {}
+        message = await llm.ainvoke(messages, config=config)
+        batch = PROFILE_ANALYSIS_BATCH_ADAPTER.validate_json(message.content)
+    except TimeoutError as e:
+        logger.error(f"Batched profile analysis timeout: {len(contexts)} profiles")
+        raise LLMTimeoutError("Batched profile analysis timed out") from e
+    except Exception as e:
+        logger.error(f"Batched profile analysis failed: {e}")
+        raise LLMValidationError(f"Failed to analyze profiles: {e}") from e
+
+    if len(batch.analyses) != len(contexts):
+        raise LLMValidationError(
+            f"Expected {len(contexts)} analyses, got {len(batch.analyses)}"
+        )
+
+    logger.info(f"Batched profile analysis complete: {len(contexts)} profiles")
+    return list(batch.analyses)
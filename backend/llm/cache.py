@@ -0,0 +1,55 @@
+"""
+In-process cache for LLM results.
+
+Profile analysis depends only on the user's query, profile fields and the
+recent profile history in the prompt, so repeated requests with an unchanged
+profile (refreshes, retries) can reuse the validated ProfileAnalysis instead
+of calling the LLM again.
+"""
+
+import json
+from hashlib import blake2b
+from typing import List, Optional
+
+from core.cache import AsyncTTLCache
+from core.config import settings
+from models.user_profile import UserProfile
+from models.user_profile_snapshot import UserProfileSnapshot
+
+
+def profile_cache_key(
+    profile: UserProfile,
+    history: List[UserProfileSnapshot],
+    query: Optional[str],
+) -> bytes:
+    """
+    Stable 16-byte key over everything the analysis prompt is built from:
+    the query, the profile fields and the snapshots rendered as history.
+
+    Two users (or one user after an A -> B -> A edit) only share an entry
+    when their prompts would be identical.
+    """
+    parts = (
+        query or "",
+        profile.learning_goal or "",
+        profile.current_level.value if profile.current_level else "",
+        profile.time_commitment.value if profile.time_commitment else "",
+        sorted(tag.name for tag in profile.interests) if profile.interests else [],
+        [
+            (
+                snapshot.version,
+                snapshot.learning_goal or "",
+                snapshot.current_level.value if snapshot.current_level else "",
+                [str(tag_id) for tag_id in snapshot.interest_tag_ids or ()],
+            )
+            for snapshot in history[-3:]  # the snapshots _format_history renders
+        ],
+    )
+    payload = json.dumps(parts, separators=(",", ":")).encode("utf-8")
+    return blake2b(payload, digest_size=16).digest()
+
+
+profile_analysis_cache = AsyncTTLCache(
+    maxsize=settings.PROFILE_ANALYSIS_CACHE_SIZE,
+    ttl_seconds=settings.PROFILE_ANALYSIS_CACHE_TTL_SECONDS,
+)
@@ -58,9 +58,10 @@ class LLMMetricsCallback(BaseCallbackHandler):
         prompts: List[str],
         **kwargs: Any,
     ) -> None:
-        """Called when LLM starts processing."""
-        self.start_time = time.time()
-        self.model = serialized.get("kwargs", {}).get("model_name") or serialized.get("name")
+        """Called when LLM starts processing (first call of the operation wins)."""
+        if self.start_time is None:
+            self.start_time = time.time()
+            self.model = serialized.get("kwargs", {}).get("model_name") or serialized.get("name")
 
     def on_llm_end(self, response: Any, **kwargs: Any) -> None:
         """Called when LLM completes successfully."""
@@ -70,8 +71,9 @@ class LLMMetricsCallback(BaseCallbackHandler):
         # LangChain stores this in llm_output for OpenAI models
         if hasattr(response, "llm_output") and response.llm_output:
             usage = response.llm_output.get("token_usage", {})
-            self.tokens_input = usage.get("prompt_tokens", 0)
-            self.tokens_output = usage.get("completion_tokens", 0)
+            # Accumulate: an operation may span several calls (two-stage parsing)
+            self.tokens_input += usage.get("prompt_tokens", 0)
+            self.tokens_output += usage.get("completion_tokens", 0)
 
         # Log the metrics
         logger.info(
@@ -44,3 +44,27 @@ def get_llm() -> ChatOpenAI:
         )
 
     return llm
+
+
+@lru_cache(maxsize=1)
+def get_parser_llm() -> ChatOpenAI:
+    """
+    Get the small LLM used to convert free text to JSON (singleton).
+
+    Only used when LLM_TWO_STAGE_PARSING is enabled.
+
+    Returns:
+        ChatOpenAI instance configured with OPENAI_PARSER_MODEL
+
+    Raises:
+        ValueError: If OPENAI_API_KEY not configured
+    """
+    if not settings.OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY not configured in environment")
+
+    return ChatOpenAI(
+        model=settings.OPENAI_PARSER_MODEL,
+        temperature=0,
+        timeout=settings.OPENAI_TIMEOUT_SECONDS,
+        api_key=settings.OPENAI_API_KEY,
+    )
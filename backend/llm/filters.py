@@ -7,12 +7,15 @@ Uses QUERY-FIRST scoring: user's request is primary, profile is enrichment.
 Target: 48 courses → ~20 courses (tighter filtering for token efficiency)
 """
 
+import heapq
 import logging
 import re
-from typing import Dict, List, Optional
+import sys
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
 
 from models.course import Course
-from models.enums import DifficultyLevel, TimeCommitment
 from models.user_profile import UserProfile
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,126 @@ logger = logging.getLogger(__name__)
 # Description truncation for token savings
 MAX_DESCRIPTION_LENGTH = 150
 
+# Description prefix searched for query words
+DESCRIPTION_SEARCH_LENGTH = 500
+
+_WORD_RE = re.compile(r"\w+")
+
+# Result size bounds: keep the best TOP_K, but never return fewer than MIN_RESULTS
+TOP_K = 20
+MIN_RESULTS = 10
+
+# Common words ignored in queries (interned so set lookups hit pointer equality)
+_STOP_WORDS = frozenset(
+    sys.intern(w)
+    for w in ("the", "and", "for", "with", "about", "want", "need", "help", "please")
+)
+
+# Difficulty ordering for alignment scoring
+_LEVEL_INDEX = {"beginner": 0, "intermediate": 1, "advanced": 2}
+
+# Difficulty alignment (0-15 points), indexed [user_level][course_level]:
+# perfect match = 15, adjacent level = 10, two levels away = 3
+_DIFFICULTY_SCORES = (
+    (15, 10, 3),
+    (10, 15, 10),
+    (3, 10, 15),
+)
+_NEUTRAL_DIFFICULTY_SCORES = (8, 8, 8)  # No level set
+
+# Duration feasibility (0-10 points) by weeks to complete:
+# <=4 weeks = 10, <=8 = 7, <=12 = 5, longer = 2
+_DURATION_SCORES = (10, 7, 5, 2)
+_NEUTRAL_DURATION_SCORES = (5,)  # No time commitment set
+
+# Week thresholds pre-multiplied by weekly hours (conservative) per time
+# commitment, so course hours can be bisected directly
+_DURATION_HOUR_THRESHOLDS = {
+    commitment: (4 * hours, 8 * hours, 12 * hours)
+    for commitment, hours in {"1-5": 3, "5-10": 7, "10-20": 15, "20+": 25}.items()
+}
+_DEFAULT_DURATION_HOUR_THRESHOLDS = (20, 40, 60)  # Unknown commitment: 5 hours/week
+
+# Bit position per lowercase tag name, so tag sets become int bitmasks
+_tag_bits: Dict[str, int] = {}
+
+
+def _tag_mask(tag_names) -> int:
+    """Return the bitmask for lowercase tag names, assigning new bits as needed."""
+    mask = 0
+    for name in tag_names:
+        bit = _tag_bits.get(name)
+        if bit is None:
+            bit = _tag_bits[sys.intern(name)] = len(_tag_bits)
+        mask |= 1 << bit
+    return mask
+
+
+class _CourseEntry:
+    """Request-independent data for one course, built once and reused."""
+
+    __slots__ = (
+        "template",
+        "title_lower",
+        "title_words",
+        "desc_lower",
+        "desc_words",
+        "tag_names",
+        "tags_text",
+        "tag_mask",
+        "level_idx",
+        "duration",
+    )
+
+    def __init__(self, course: Course):
+        # Truncate description for token savings
+        truncated_desc = course.description[:MAX_DESCRIPTION_LENGTH]
+        if len(course.description) > MAX_DESCRIPTION_LENGTH:
+            cut = truncated_desc.rfind(" ")
+            truncated_desc = (truncated_desc[:cut] if cut > 0 else truncated_desc) + "..."
+
+        # Static LLM context; callers must copy before adding per-request fields
+        self.template = {
+            "id": str(course.id),
+            "title": course.title,
+            "description": truncated_desc,
+            "difficulty": course.difficulty.value,
+            "duration": course.duration,
+            "tags": [tag.name for tag in course.tags],
+        }
+        # Lowercased search text and word sets for query matching
+        self.title_lower = course.title.lower()
+        self.title_words = frozenset(_WORD_RE.findall(self.title_lower))
+        self.desc_lower = course.description[:DESCRIPTION_SEARCH_LENGTH].lower()
+        self.desc_words = frozenset(_WORD_RE.findall(self.desc_lower))
+
+        # Lowercase tag names are interned: the same few names recur across
+        # courses and interests, so hashing/equality short-circuit on identity
+        self.tag_names = frozenset(sys.intern(tag.name.lower()) for tag in course.tags)
+        self.tags_text = "\n".join(self.tag_names)
+        self.tag_mask = _tag_mask(self.tag_names)
+
+        # Profile scoring inputs
+        self.level_idx = _LEVEL_INDEX[course.difficulty.value]
+        self.duration = course.duration
+
+
+_course_entries: Dict[UUID, _CourseEntry] = {}
+
+
+def _course_entry(course: Course) -> _CourseEntry:
+    """Return the cached entry for a course, building it on first use."""
+    entry = _course_entries.get(course.id)
+    if entry is None:
+        entry = _course_entries[course.id] = _CourseEntry(course)
+    return entry
+
+
+def clear_course_cache() -> None:
+    """Drop cached course entries (call after the catalog changes)."""
+    _course_entries.clear()
+    _tag_bits.clear()
+
 
 def filter_courses(
     courses: List[Course],
@@ -55,116 +178,26 @@ def filter_courses(
         List of course dicts with 'relevance_score', sorted by score.
         Target size: ~20 courses (token-efficient).
     """
-    scored_courses = []
-
-    # Extract user interests as lowercase set
-    user_interest_names = set()
-    if profile.interests:
-        user_interest_names = {tag.name.lower() for tag in profile.interests}
-
     # Parse query keywords (simple tokenization)
     query_words = set()
     has_query = bool(user_query and user_query.strip())
     if has_query:
         # Extract words, filter short ones and common stop words
-        stop_words = {"the", "and", "for", "with", "about", "want", "need", "help", "please"}
         query_words = {
-            w.lower()
-            for w in re.findall(r"\w+", user_query)
-            if len(w) > 2 and w.lower() not in stop_words
-        }
-
-    for course in courses:
-        query_score = 0.0
-        profile_score = 0.0
-
-        # ===== QUERY SCORING (0-50 points) - PRIMARY when query present =====
-        if query_words:
-            title_lower = course.title.lower()
-            title_words = set(re.findall(r"\w+", title_lower))
-            course_tag_names_lower = {tag.name.lower() for tag in course.tags}
-            desc_lower = course.description[:500].lower()
-            desc_words = set(re.findall(r"\w+", desc_lower))
-
-            # Title match: strongest signal (+30)
-            title_matches = query_words & title_words
-            # Also check if query words appear as substrings in title
-            title_substring_match = any(qw in title_lower for qw in query_words)
-            if title_matches or title_substring_match:
-                query_score += 30
-
-            # Tag match: categorical relevance (+20)
-            # Check both exact match and substring match in tags
-            tag_matches = query_words & course_tag_names_lower
-            tag_substring_match = any(
-                qw in tag_name
-                for qw in query_words
-                for tag_name in course_tag_names_lower
-            )
-            if tag_matches or tag_substring_match:
-                query_score += 20
-
-            # Description match: content relevance (+15)
-            desc_matches = query_words & desc_words
-            desc_substring_match = any(qw in desc_lower for qw in query_words)
-            if desc_matches or desc_substring_match:
-                query_score += 15
-
-            # Cap query score at 50
-            query_score = min(query_score, 50)
-
-        # ===== PROFILE SCORING (0-50 points) - ENRICHMENT =====
-
-        # Tag/interest overlap (0-25 points)
-        course_tag_names = {tag.name.lower() for tag in course.tags}
-        overlap_count = len(user_interest_names & course_tag_names)
-        profile_score += min(overlap_count * 8, 25)  # 8 points per match, max 25
-
-        # Difficulty alignment (0-15 points)
-        profile_score += _score_difficulty(course.difficulty, profile.current_level)
-
-        # Duration feasibility (0-10 points)
-        profile_score += _score_duration(course.duration, profile.time_commitment)
-
-        # ===== TOTAL SCORE =====
-        # When query present: query_score + profile_score (query dominates)
-        # When no query: profile_score is the only score (profile drives)
-        total_score = query_score + profile_score
-
-        # Convert course to dict for LLM context
-        # Truncate description for token savings
-        truncated_desc = course.description[:MAX_DESCRIPTION_LENGTH]
-        if len(course.description) > MAX_DESCRIPTION_LENGTH:
-            truncated_desc = truncated_desc.rsplit(" ", 1)[0] + "..."
-
-        course_dict = {
-            "id": str(course.id),
-            "title": course.title,
-            "description": truncated_desc,
-            "difficulty": course.difficulty.value,
-            "duration": course.duration,
-            "tags": [tag.name for tag in course.tags],
-            "relevance_score": total_score,
+            sys.intern(w.lower())
+            for w in _WORD_RE.findall(user_query)
+            if len(w) > 2 and w.lower() not in _STOP_WORDS
         }
 
-        scored_courses.append(course_dict)
-
-    # Sort by score (highest first)
-    scored_courses.sort(key=lambda x: x["relevance_score"], reverse=True)
+    entries = [_course_entry(course) for course in courses]
+    scoring = _profile_scoring(profile)
 
-    # When query is present, prioritize query-matching courses
-    if has_query:
-        # Courses with query_score > 0 should come first
-        # We already scored them higher, but ensure minimum query relevance
-        filtered = [c for c in scored_courses if c["relevance_score"] > 0][:20]
+    # Dispatch once to a scoring loop specialized for the input shape
+    if query_words:
+        scores = _score_with_query(entries, scoring, query_words)
     else:
-        # No query: just use profile scoring, limit to 20
-        filtered = [c for c in scored_courses if c["relevance_score"] > 0][:20]
-
-    # Ensure minimum 10 courses for variety (reduced from 20)
-    if len(filtered) < 10:
-        remaining = [c for c in scored_courses if c not in filtered]
-        filtered.extend(remaining[: 10 - len(filtered)])
+        scores = _score_profile_only(entries, scoring)
+    filtered = _select_top(entries, scores)
 
     query_preview = user_query[:30] if user_query else "None"
     logger.info(
@@ -175,65 +208,140 @@ def filter_courses(
     return filtered
 
 
-def _score_difficulty(
-    course_difficulty: DifficultyLevel,
-    user_level: Optional[DifficultyLevel],
-) -> float:
+class _ProfileScoring(NamedTuple):
+    """Profile-invariant inputs for profile scoring, resolved once per request."""
+
+    tag_mask: int
+    difficulty_scores: Tuple[int, ...]
+    duration_thresholds: Tuple[int, ...]
+    duration_scores: Tuple[int, ...]
+
+
+def _profile_scoring(profile: UserProfile) -> _ProfileScoring:
+    """Resolve the user's interests, level and time commitment into lookups."""
+    # Extract user interests as a tag bitmask
+    tag_mask = 0
+    if profile.interests:
+        tag_mask = _tag_mask(tag.name.lower() for tag in profile.interests)
+
+    difficulty_scores = _NEUTRAL_DIFFICULTY_SCORES
+    if profile.current_level:
+        user_level_idx = _LEVEL_INDEX.get(profile.current_level.value)
+        if user_level_idx is not None:
+            difficulty_scores = _DIFFICULTY_SCORES[user_level_idx]
+
+    duration_thresholds: Tuple[int, ...] = ()
+    duration_scores = _NEUTRAL_DURATION_SCORES
+    if profile.time_commitment:
+        duration_thresholds = _DURATION_HOUR_THRESHOLDS.get(
+            profile.time_commitment.value, _DEFAULT_DURATION_HOUR_THRESHOLDS
+        )
+        duration_scores = _DURATION_SCORES
+
+    return _ProfileScoring(tag_mask, difficulty_scores, duration_thresholds, duration_scores)
+
+
+def _score_profile_only(
+    entries: List[_CourseEntry],
+    scoring: _ProfileScoring,
+) -> List[float]:
     """
-    Score difficulty alignment (0-15 points).
+    Score courses on profile fit alone (no query).
 
-    Perfect match = 15, adjacent level = 10, two levels away = 3.
+    Tag/interest overlap (0-25, 8 points per match), difficulty alignment
+    (0-15) and duration feasibility (0-10).
+    """
+    tag_mask, difficulty_scores, duration_thresholds, duration_scores = scoring
+    scores = []
+    for entry in entries:
+        overlap_count = (tag_mask & entry.tag_mask).bit_count()
+        profile_score = 0.0
+        profile_score += 25 if overlap_count >= 4 else overlap_count * 8
+        profile_score += difficulty_scores[entry.level_idx]
+        profile_score += duration_scores[bisect_left(duration_thresholds, entry.duration)]
+        scores.append(profile_score)
+    return scores
+
+
+def _score_with_query(
+    entries: List[_CourseEntry],
+    scoring: _ProfileScoring,
+    query_words: Set[str],
+) -> List[float]:
     """
-    if not user_level:
-        return 8  # Neutral score if no level set
+    Score courses on query relevance (0-50) plus profile fit (0-50).
 
-    levels = ["beginner", "intermediate", "advanced"]
+    Exact word matches are checked first; the substring scan only runs when
+    they miss (`or` short-circuits).
+    """
+    # One alternation scans each text once for any query word as a substring
+    query_pattern = re.compile("|".join(map(re.escape, query_words)))
+    profile_scores = _score_profile_only(entries, scoring)
 
-    try:
-        course_idx = levels.index(course_difficulty.value)
-        user_idx = levels.index(user_level.value)
-    except ValueError:
-        return 8  # Neutral if unknown level
+    scores = []
+    for entry, profile_score in zip(entries, profile_scores):
+        query_score = 0.0
 
-    diff = abs(course_idx - user_idx)
+        # Title match: strongest signal (+30)
+        if not query_words.isdisjoint(entry.title_words) or query_pattern.search(
+            entry.title_lower
+        ):
+            query_score += 30
 
-    if diff == 0:
-        return 15  # Exact match
-    elif diff == 1:
-        return 10  # Adjacent level (stretch is good)
-    else:
-        return 3  # Two levels away (still include but low priority)
+        # Tag match: categorical relevance (+20)
+        # Check both exact match and substring match in tags
+        # (query words never contain newlines, so matches can't span tags)
+        if not query_words.isdisjoint(entry.tag_names) or query_pattern.search(
+            entry.tags_text
+        ):
+            query_score += 20
+
+        # Description match: content relevance (+15)
+        if not query_words.isdisjoint(entry.desc_words) or query_pattern.search(
+            entry.desc_lower
+        ):
+            query_score += 15
+
+        # Cap query score at 50
+        if query_score > 50:
+            query_score = 50
 
+        # Query dominates; profile enriches
+        scores.append(query_score + profile_score)
+    return scores
 
-def _score_duration(
-    course_hours: int,
-    time_commitment: Optional[TimeCommitment],
-) -> float:
+
+def _select_top(entries: List[_CourseEntry], scores: List[float]) -> List[Dict]:
     """
-    Score duration feasibility (0-10 points).
+    Return course dicts for the best TOP_K positive scores, highest first.
 
-    Based on whether course is completable in reasonable time.
+    Pads with the best non-positive scores up to MIN_RESULTS for variety.
     """
-    if not time_commitment:
-        return 5  # Neutral score
-
-    # Map time commitment to weekly hours (conservative)
-    hours_map = {
-        "1-5": 3,
-        "5-10": 7,
-        "10-20": 15,
-        "20+": 25,
-    }
-    hours_per_week = hours_map.get(time_commitment.value, 5)
-
-    # Calculate weeks to complete
-    weeks = course_hours / hours_per_week if hours_per_week > 0 else 999
-
-    if weeks <= 4:
-        return 10  # Completable in a month
-    elif weeks <= 8:
-        return 7  # Completable in two months
-    elif weeks <= 12:
-        return 5  # Three months
-    else:
-        return 2  # Long commitment but still viable
+    top_heap: List[tuple] = []
+    non_positive: List[tuple] = []
+
+    for index, (entry, total_score) in enumerate(zip(entries, scores)):
+        # Min-heap of the best TOP_K; ties keep catalog order (lower index
+        # wins), matching a stable descending sort
+        ranked_entry = (total_score, -index, entry)
+        if total_score > 0:
+            if len(top_heap) < TOP_K:
+                heapq.heappush(top_heap, ranked_entry)
+            elif ranked_entry > top_heap[0]:
+                heapq.heapreplace(top_heap, ranked_entry)
+        else:
+            non_positive.append(ranked_entry)
+
+    # Courses displaced from the heap are never needed for padding:
+    # displacement only happens once the heap holds TOP_K entries
+    ranked = sorted(top_heap, reverse=True)
+    if len(ranked) < MIN_RESULTS:
+        ranked.extend(heapq.nlargest(MIN_RESULTS - len(ranked), non_positive))
+
+    # Materialize dicts only for accepted courses
+    filtered = []
+    for total_score, _, entry in ranked:
+        course_dict = entry.template.copy()
+        course_dict["relevance_score"] = total_score
+        filtered.append(course_dict)
+    return filtered
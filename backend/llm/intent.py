@@ -4,14 +4,19 @@ Query intent classification for recommendation system.
 Uses a brief LLM call to classify intent - handles nuance better than keywords.
 """
 
+import asyncio
+import logging
 from enum import Enum
 from typing import Optional
 
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
+from core.config import settings
 from llm.config import get_llm
 
+logger = logging.getLogger(__name__)
+
 
 class QueryIntent(Enum):
     """Classification of user query intent."""
@@ -65,7 +70,10 @@ async def classify_intent(query: Optional[str]) -> QueryIntent:
     try:
         llm = get_llm()
         chain = INTENT_PROMPT | llm.with_structured_output(IntentClassification)
-        result = await chain.ainvoke({"query": query_clean})
+        result = await asyncio.wait_for(
+            chain.ainvoke({"query": query_clean}),
+            timeout=settings.INTENT_TIMEOUT_SECONDS,
+        )
 
         intent_map = {
             "specific": QueryIntent.SPECIFIC,
@@ -74,6 +82,13 @@ async def classify_intent(query: Optional[str]) -> QueryIntent:
         }
         return intent_map.get(result.intent.lower(), QueryIntent.VAGUE)
 
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Intent classification timed out after {settings.INTENT_TIMEOUT_SECONDS}s; "
+            "treating query as specific"
+        )
+        return QueryIntent.SPECIFIC
+
     except Exception:
         # On LLM failure, default to SPECIFIC (let the pipeline handle it)
         return QueryIntent.SPECIFIC
@@ -1,5 +1,6 @@
 """
 Prompt templates for LLM agents.
 
-Uses DETAILED & EDUCATIONAL style prompts for high-quality recommendations.
+Uses QUERY-FIRST prompts: the user's request is primary, profile data enriches.
+Each agent has a single canonical prompt module (profile_analyzer, course_recommender).
 """
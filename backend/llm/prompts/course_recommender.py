@@ -4,6 +4,8 @@ Prompt templates for Course Recommender Agent (Agent 2).
 QUERY-FIRST Architecture: Recommend what they ASKED FOR, personalized with their profile.
 """
 
+from llm.prompts.template import split_static_prefix
+
 SYSTEM_PROMPT = """You are an expert course recommendation specialist at AcmeLearn.
 
 ## CRITICAL PRINCIPLE: Query-First Recommendations
@@ -113,3 +115,6 @@ You MUST only recommend courses from this list. Use the exact course IDs.
 5. Write an overall_summary (1-2 sentences) explaining your strategy
 
 Remember: Recommend what THEY asked for. Use their profile to personalize, not redirect."""
+
+# Static lead-in (identical for every request) and the per-request remainder
+USER_PROMPT_PREFIX, USER_PROMPT_REST = split_static_prefix(USER_PROMPT_TEMPLATE)
@@ -5,6 +5,8 @@ QUERY-FIRST Architecture: The user's current request is PRIMARY.
 Profile data is used to ENRICH and PERSONALIZE, not to redirect.
 """
 
+from llm.prompts.template import split_static_prefix
+
 SYSTEM_PROMPT = """You are an expert learning advisor at AcmeLearn, an AI-powered education platform.
 
 ## CRITICAL PRINCIPLE: Query-First Architecture
@@ -93,3 +95,6 @@ Provide your analysis (keep it concise):
 7. **profile_feedback**: If profile has issues, ONE specific suggestion. Otherwise null.
 
 Remember: Help them succeed in what THEY want to learn."""
+
+# Static lead-in (identical for every request) and the per-request remainder
+USER_PROMPT_PREFIX, USER_PROMPT_REST = split_static_prefix(USER_PROMPT_TEMPLATE)
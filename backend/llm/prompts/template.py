@@ -0,0 +1,59 @@
+"""
+Prompt template rendering helpers.
+"""
+
+from string import Formatter
+from typing import Any, Mapping, Optional, Tuple
+
+
+class CompiledTemplate:
+    """
+    A `str.format` template parsed once at import time.
+
+    Rendering walks the pre-split literal/field pairs instead of re-parsing
+    the format string on every call. Only plain `{name}` fields are
+    supported; missing fields render as "unknown".
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, template: str):
+        parts = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in field {field!r}")
+            parts.append((literal, field))
+        self._parts: Tuple[Tuple[str, Optional[str]], ...] = tuple(parts)
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """Substitute `context` values into the template."""
+        out = []
+        append = out.append
+        get = context.get
+        for literal, field in self._parts:
+            if literal:
+                append(literal)
+            if field is not None:
+                append(format(get(field, "unknown")))
+        return "".join(out)
+
+
+def split_static_prefix(template: str) -> Tuple[str, str]:
+    """
+    Split a format template into its leading literal text and the rest.
+
+    The prefix contains no fields, so it is byte-identical on every request
+    and can be sent as its own content block for provider-side prefix caching.
+
+    Returns:
+        (prefix, remainder_template) where prefix + remainder.format(...) equals
+        template.format(...)
+    """
+    # Escaped braces ("{{"/"}}") end a parsed literal without a field
+    literal = ""
+    for text, field, _, _ in Formatter().parse(template):
+        literal += text
+        if field is not None:
+            break
+    escaped_len = len(literal.replace("{", "{{").replace("}", "}}"))
+    return literal, template[escaped_len:]
@@ -1,13 +1,25 @@
 """
 Pydantic models for LLM structured outputs.
 
-Uses LangChain v1.0 `.with_structured_output()` pattern for type-safe responses.
+The models' JSON schemas are sent as the OpenAI `response_format`, and raw
+response JSON is validated in a single pass through module-level TypeAdapters.
 These models define the exact JSON structure the LLM must return.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+
+from core.config import settings
+
+# LLM outputs are read-only once validated: frozen instances, unknown keys
+# dropped without error, and stray whitespace stripped from strings
+OUTPUT_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", str_strip_whitespace=True)
+
+# Same rules for pydantic dataclasses, where frozen is set on the decorator
+_OUTPUT_DATACLASS_CONFIG = ConfigDict(extra="ignore", str_strip_whitespace=True)
 
 
 # ============================================================
@@ -23,12 +35,14 @@ class ProfileAnalysis(BaseModel):
     not redirect them to different topics.
     """
 
+    model_config = OUTPUT_MODEL_CONFIG
+
     skill_level: str = Field(
         description="User's detected skill level FOR THEIR REQUESTED AREA: 'beginner', 'intermediate', or 'advanced'. "
         "Consider transferable skills from their background."
     )
 
-    skill_gaps: List[str] = Field(
+    skill_gaps: Tuple[str, ...] = Field(
         max_length=3,
         description="Max 3 specific skills the user needs FOR WHAT THEY'RE REQUESTING. "
         "Short phrases only. Be concrete and relevant to their query."
@@ -77,6 +91,8 @@ class CourseRecommendation(BaseModel):
     Single course recommendation with rich, personalized explanation.
     """
 
+    model_config = OUTPUT_MODEL_CONFIG
+
     course_id: str = Field(
         description="UUID of the recommended course (as string). "
         "Must be from the provided filtered course list."
@@ -94,8 +110,8 @@ class CourseRecommendation(BaseModel):
         "is valuable for THIS specific learner. Reference their goals and gaps."
     )
 
-    skill_gaps_addressed: List[str] = Field(
-        default_factory=list,
+    skill_gaps_addressed: Tuple[str, ...] = Field(
+        default=(),
         max_length=2,
         description="Max 2 skill gaps this course addresses. Use exact terms from skill_gaps list.",
     )
@@ -107,7 +123,8 @@ class CourseRecommendation(BaseModel):
     )
 
 
-class LearningPathStep(BaseModel):
+@dataclass(frozen=True, slots=True, config=_OUTPUT_DATACLASS_CONFIG)
+class LearningPathStep:
     """
     A step in the recommended 2-3 course learning path.
     """
@@ -127,6 +144,8 @@ class RecommendationOutput(BaseModel):
     Agent 2 output: Complete recommendation response with courses and learning path.
     """
 
+    model_config = OUTPUT_MODEL_CONFIG
+
     recommendations: List[CourseRecommendation] = Field(
         min_length=1,
         max_length=10,
@@ -144,3 +163,104 @@ class RecommendationOutput(BaseModel):
         description="2-3 sentence summary of the recommendation strategy. "
         "Explain the overall approach taken for this learner."
     )
+
+
+# ============================================================
+# Batched Agent 1 Output
+# ============================================================
+
+
+class ProfileAnalysisBatch(BaseModel):
+    """
+    Agent 1 output for several learners in one call, in input order.
+
+    OpenAI JSON-schema output must be an object, so the list is wrapped.
+    """
+
+    model_config = OUTPUT_MODEL_CONFIG
+
+    analyses: List[ProfileAnalysis] = Field(
+        description="One analysis per learner, in the same order as the learners given."
+    )
+
+
+# ============================================================
+# Response validation
+# ============================================================
+
+# Validate raw LLM response JSON directly (no intermediate json.loads dict)
+PROFILE_ANALYSIS_ADAPTER = TypeAdapter(ProfileAnalysis)
+RECOMMENDATION_ADAPTER = TypeAdapter(RecommendationOutput)
+PROFILE_ANALYSIS_BATCH_ADAPTER = TypeAdapter(ProfileAnalysisBatch)
+
+
+# JSON schemas are walked once at import, not per LLM call
+PROFILE_ANALYSIS_SCHEMA: Dict[str, Any] = ProfileAnalysis.model_json_schema()
+RECOMMENDATION_SCHEMA: Dict[str, Any] = RecommendationOutput.model_json_schema()
+
+
+def get_profile_schema() -> Dict[str, Any]:
+    """Return the cached ProfileAnalysis JSON schema (do not mutate)."""
+    return PROFILE_ANALYSIS_SCHEMA
+
+
+_ANNOTATION_KEYWORDS = frozenset({"description", "title"})
+
+
+def compact_schema(schema: Any) -> Any:
+    """
+    Return a copy of a JSON schema without "description"/"title" annotations.
+
+    Field names under "properties" are kept even if a field is called
+    "description" or "title"; only the annotation keywords are dropped.
+    """
+    if isinstance(schema, list):
+        return [compact_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    compact = {}
+    for key, value in schema.items():
+        if key in _ANNOTATION_KEYWORDS:
+            continue
+        if key in ("properties", "$defs"):
+            compact[key] = {name: compact_schema(sub) for name, sub in value.items()}
+        else:
+            compact[key] = compact_schema(value)
+    return compact
+
+
+def _response_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build an OpenAI `response_format` requesting JSON that matches `schema`.
+
+    With LLM_COMPACT_SCHEMAS the field descriptions are left out to save
+    prompt tokens (the prompts already spell out each field).
+    """
+    if settings.LLM_COMPACT_SCHEMAS:
+        schema = compact_schema(schema)
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": schema,
+            "strict": False,  # Optional fields/defaults aren't allowed in strict mode
+        },
+    }
+
+
+PROFILE_ANALYSIS_RESPONSE_FORMAT = _response_format("ProfileAnalysis", PROFILE_ANALYSIS_SCHEMA)
+RECOMMENDATION_RESPONSE_FORMAT = _response_format("RecommendationOutput", RECOMMENDATION_SCHEMA)
+
+
+@lru_cache(maxsize=None)
+def json_schema_response_format(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Return the `response_format` for any output model, built once per model.
+
+    The returned dict is shared, so callers must not mutate it.
+    """
+    if model is ProfileAnalysis:
+        return PROFILE_ANALYSIS_RESPONSE_FORMAT
+    if model is RecommendationOutput:
+        return RECOMMENDATION_RESPONSE_FORMAT
+    return _response_format(model.__name__, model.model_json_schema())
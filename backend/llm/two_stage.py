@@ -0,0 +1,57 @@
+"""
+Two-stage structured output.
+
+Stage 1 lets the primary model answer in free text (no JSON-mode
+constraint on its reasoning). Stage 2 has a small, fast parser model
+convert that text into JSON matching the output schema.
+"""
+
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, TypeAdapter
+
+from llm.config import get_llm, get_parser_llm
+from llm.schemas import json_schema_response_format
+
+T = TypeVar("T", bound=BaseModel)
+
+PARSER_SYSTEM_MESSAGE = SystemMessage(
+    content=(
+        "Convert the analysis below into JSON matching the response schema. "
+        "Use only information stated in the text; do not add new content."
+    )
+)
+
+
+async def call_structured(
+    messages: List,
+    response_type: Type[T],
+    adapter: TypeAdapter,
+    config: Optional[Dict[str, Any]] = None,
+) -> T:
+    """
+    Run the primary model in plain-text mode, then parse its answer to JSON.
+
+    Args:
+        messages: Prompt messages for the primary model
+        response_type: Pydantic model the final output must match
+        adapter: TypeAdapter for response_type (validates the parser's JSON)
+        config: Optional LangChain run config (callbacks see both calls)
+
+    Returns:
+        Validated response_type instance
+    """
+    config = config or {}
+
+    draft = await get_llm().ainvoke(messages, config=config)
+
+    parser = get_parser_llm().bind(
+        response_format=json_schema_response_format(response_type)
+    )
+    parsed = await parser.ainvoke(
+        [PARSER_SYSTEM_MESSAGE, HumanMessage(content=draft.content)],
+        config=config,
+    )
+
+    return adapter.validate_json(parsed.content)
@@ -4,19 +4,44 @@ AcmeLearn FastAPI Application Entry Point
 This is the main entry point for the AcmeLearn backend API.
 """
 
+import asyncio
+import importlib.machinery
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from core.database import init_db, async_session_maker
 from core.config import settings
-from core.logging import setup_logging
-from scripts.seed_courses import seed_courses
-from scripts.seed_demo_users import seed_demo_users
+from core.logging import STARTUP_LOGGER, flush_startup_logs, setup_logging
 from api import auth, users, profiles, courses, admin
 
+log = logging.getLogger(STARTUP_LOGGER)
+
+
+def ensure_compiled_pydantic():
+    """
+    Refuse to start without the compiled pydantic-core extension.
+
+    Every LLM response is validated by Pydantic, so a source-only install
+    would silently slow down the recommendation path. Set
+    PYDANTIC_ALLOW_PURE_PY=true to skip the check in development.
+    """
+    if settings.PYDANTIC_ALLOW_PURE_PY:
+        return
+
+    import pydantic_core
+
+    extension = getattr(pydantic_core, "_pydantic_core", None)
+    origin = getattr(extension, "__file__", "") or ""
+    if not origin.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)):
+        raise RuntimeError(
+            "pydantic-core compiled extension missing - install pydantic from a "
+            "binary wheel (or set PYDANTIC_ALLOW_PURE_PY=true for local development)"
+        )
+
 
 async def create_or_promote_superuser(db):
     """
@@ -33,29 +58,37 @@ async def create_or_promote_superuser(db):
     from fastapi_users.db import SQLAlchemyUserDatabase
     from fastapi_users.password import PasswordHelper
 
-    print(f"Checking for superuser: {settings.SUPERUSER_EMAIL}")
+    log.info(f"Checking for superuser: {settings.SUPERUSER_EMAIL}")
 
-    # Check if user exists
-    result = await db.execute(
-        select(User).where(User.email == settings.SUPERUSER_EMAIL)
-    )
-    existing_user = result.scalar_one_or_none()
+    # Probe only the columns we branch on; no need to hydrate a full User
+    row = (
+        await db.execute(
+            select(User.id, User.is_superuser)
+            .where(User.email == settings.SUPERUSER_EMAIL)
+            .limit(1)
+        )
+    ).first()
 
-    if existing_user:
-        if not existing_user.is_superuser:
+    if row is not None:
+        if not row.is_superuser:
             # Promote existing user to superuser
-            existing_user.is_superuser = True
+            await db.execute(
+                update(User).where(User.id == row.id).values(is_superuser=True)
+            )
             await db.commit()
-            print(f"Promoted user {settings.SUPERUSER_EMAIL} to superuser")
+            log.info(f"Promoted user {settings.SUPERUSER_EMAIL} to superuser")
         else:
-            print(f"Superuser {settings.SUPERUSER_EMAIL} already exists")
+            log.info(f"Superuser {settings.SUPERUSER_EMAIL} already exists")
     else:
         # Create new superuser using UserManager
         user_db = SQLAlchemyUserDatabase(db, User)
         user_manager = UserManager(user_db)
 
         password_helper = PasswordHelper()
-        hashed_password = password_helper.hash(settings.SUPERUSER_PASSWORD)
+        # Hashing is CPU-bound; keep it off the event loop during startup
+        hashed_password = await asyncio.to_thread(
+            password_helper.hash, settings.SUPERUSER_PASSWORD
+        )
 
         superuser = User(
             email=settings.SUPERUSER_EMAIL,
@@ -71,7 +104,7 @@ async def create_or_promote_superuser(db):
         # Trigger on_after_register to create profile
         await user_manager.on_after_register(superuser)
 
-        print(f"Created superuser: {settings.SUPERUSER_EMAIL}")
+        log.info(f"Created superuser: {settings.SUPERUSER_EMAIL}")
 
 
 @asynccontextmanager
@@ -82,44 +115,53 @@ async def lifespan(app: FastAPI):
     Manages startup and shutdown events using modern context manager pattern.
     Runs once when uvicorn starts (or reloads).
     """
+    # Seed scripts are only needed here, so keep them out of module import
+    from scripts.seed_courses import seed_courses
+    from scripts.seed_demo_users import seed_demo_users
+
     # Startup - configure logging first
     setup_logging()
-    print("Starting up AcmeLearn API...")
+    log.info("Starting up AcmeLearn API...")
+    ensure_compiled_pydantic()
 
     # Create tables from models (idempotent - safe to run multiple times)
     await init_db()
 
-    # Seed courses (only if empty)
+    # All startup seeding shares one session (one pool checkout); each step
+    # rolls back its own failure so later steps still run
     async with async_session_maker() as db:
+        # Seed courses (only if empty)
         try:
             await seed_courses(db)
         except Exception as e:
-            print(f"Error seeding database: {e}")
+            log.error(f"Error seeding database: {e}")
             await db.rollback()
             raise
 
-    # Create superuser if configured
-    async with async_session_maker() as db:
+        # Create superuser if configured
         try:
             await create_or_promote_superuser(db)
         except Exception as e:
-            print(f"Error creating superuser: {e}")
+            log.error(f"Error creating superuser: {e}")
             await db.rollback()
 
-    # Seed demo users if configured (for assessment/demos)
-    async with async_session_maker() as db:
+        # Seed demo users if configured (for assessment/demos)
         try:
             await seed_demo_users(db)
         except Exception as e:
-            print(f"Error seeding demo users: {e}")
+            log.error(f"Error seeding demo users: {e}")
             await db.rollback()
 
-    print("Startup complete!")
+        await db.commit()
+
+    log.info("Startup complete!")
+    flush_startup_logs()
 
     yield  # Application runs here
 
     # Shutdown (runs after yield when app stops)
-    print("Shutting down AcmeLearn API...")
+    log.info("Shutting down AcmeLearn API...")
+    flush_startup_logs()
 
 
 app = FastAPI(
@@ -13,6 +13,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import func
 
 from models.base import Base
+from models.ids import uuid7
 
 
 class ActivityEventType(str, enum.Enum):
@@ -35,7 +36,7 @@ class ActivityLog(Base):
     __tablename__ = "activity_logs"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     event_type: Mapped[ActivityEventType] = mapped_column(
         Enum(ActivityEventType), nullable=False
@@ -8,10 +8,11 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import String, Text, Integer, Enum as SQLEnum, ForeignKey, Uuid
+from sqlalchemy import String, Text, Integer, Enum as SQLEnum, ForeignKey, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .ids import uuid7
 from .enums import DifficultyLevel, TagCategory
 
 
@@ -72,14 +73,14 @@ class Course(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
 
     # Required fields from courses.json
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     difficulty: Mapped[DifficultyLevel] = mapped_column(
-        SQLEnum(DifficultyLevel, native_enum=False),
+        SQLEnum(DifficultyLevel, name="difficulty_level"),
         nullable=False,
         index=True  # For filtering by difficulty
     )
@@ -88,7 +89,7 @@ class Course(Base):
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
@@ -97,13 +98,13 @@ class Course(Base):
         "Tag",
         secondary="course_tags",
         back_populates="courses",
-        lazy="selectin"  # Eager load to avoid N+1 queries
+        lazy="raise_on_sql"  # Load per query with selectinload(Course.tags)
     )
     skills: Mapped[List["Skill"]] = relationship(
         "Skill",
         secondary="course_skills",
         back_populates="courses",
-        lazy="selectin"
+        lazy="raise_on_sql"  # Load per query with selectinload(Course.skills)
     )
 
     def __repr__(self) -> str:
@@ -122,7 +123,7 @@ class Tag(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     name: Mapped[str] = mapped_column(
         String(100),
@@ -131,12 +132,12 @@ class Tag(Base):
         index=True  # For fast lookups and autocomplete
     )
     category: Mapped[Optional[TagCategory]] = mapped_column(
-        SQLEnum(TagCategory, native_enum=False),
+        SQLEnum(TagCategory, name="tag_category"),
         nullable=True,
         index=True  # For filtering by category
     )
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
@@ -144,12 +145,14 @@ class Tag(Base):
     courses: Mapped[List["Course"]] = relationship(
         "Course",
         secondary="course_tags",
-        back_populates="tags"
+        back_populates="tags",
+        lazy="raise_on_sql"  # Never loaded implicitly; query CourseTag instead
     )
     interested_users: Mapped[List["UserProfile"]] = relationship(
         "UserProfile",
         secondary="user_interests",
-        back_populates="interests"
+        back_populates="interests",
+        lazy="raise_on_sql"  # Never loaded implicitly; query UserInterest instead
     )
 
     def __repr__(self) -> str:
@@ -168,7 +171,7 @@ class Skill(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     name: Mapped[str] = mapped_column(
         String(200),
@@ -177,7 +180,7 @@ class Skill(Base):
         index=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
@@ -185,7 +188,8 @@ class Skill(Base):
     courses: Mapped[List["Course"]] = relationship(
         "Course",
         secondary="course_skills",
-        back_populates="skills"
+        back_populates="skills",
+        lazy="raise_on_sql"  # Never loaded implicitly; query CourseSkill instead
     )
 
     def __repr__(self) -> str:
@@ -15,7 +15,7 @@ class DifficultyLevel(str, enum.Enum):
     Course difficulty levels.
 
     Inherits from str to ensure JSON serialization works smoothly.
-    PostgreSQL stores these as VARCHAR with CHECK constraint.
+    PostgreSQL stores these as the native difficulty_level enum (member names).
     """
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
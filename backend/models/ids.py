@@ -0,0 +1,68 @@
+"""
+Primary key generation and lookup helpers for AcmeLearn models.
+
+UUIDv7 (RFC 9562) keys start with a millisecond timestamp, so new rows land
+at the right edge of the primary key B-tree instead of at random pages.
+"""
+import os
+import threading
+import time
+import uuid
+from typing import Iterable
+
+from sqlalchemy import ColumnElement, Uuid, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+_COUNTER_MAX = 0xFFF
+
+# Last timestamp handed out and the 12-bit counter within it (RFC 9562
+# section 6.2, method 1), so IDs from one process sort in creation order
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7.
+
+    Layout: 48-bit Unix ms timestamp | version 7 | 12-bit counter |
+    RFC 4122 variant | 62 random bits.
+
+    Within a millisecond the counter increments, so IDs are strictly
+    increasing. It starts at a random value in its lower half each
+    millisecond; if it overflows, or the clock steps back, the timestamp
+    is advanced past the last one used.
+    """
+    global _last_ms, _counter
+    timestamp_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if timestamp_ms > _last_ms:
+            _last_ms = timestamp_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & (_COUNTER_MAX >> 1)
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0x2 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def id_in(column, ids: Iterable) -> ColumnElement[bool]:
+    """
+    Match column against a list of UUIDs as ``column = ANY($1::uuid[])``.
+
+    in_() renders one placeholder per value, so every list length is a new
+    SQL text and a new server-side prepared statement. A single array
+    parameter keeps the statement identical for any number of IDs.
+    """
+    return column == any_(bindparam(None, list(ids), type_=ARRAY(Uuid)))
@@ -7,11 +7,12 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Text, ForeignKey, Integer, String
+from sqlalchemy import Text, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .ids import uuid7
 
 
 class LLMMetrics(Base):
@@ -32,8 +33,8 @@ class LLMMetrics(Base):
 
     __tablename__ = "llm_metrics"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
 
     # Context
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -56,3 +57,15 @@ class LLMMetrics(Base):
     # Status
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="success")
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        # Error-rate queries: partial index holds only the (rare) error rows
+        Index("idx_llm_errors", "created_at", postgresql_where=text("status = 'error'")),
+        # Per-operation latency/token dashboards, served from the index alone
+        Index(
+            "idx_llm_op_time",
+            "operation",
+            "created_at",
+            postgresql_include=["duration_ms", "tokens_total"],
+        ),
+    )
@@ -5,13 +5,14 @@ Tracks recommendation history with context for analytics and improvements.
 """
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import Text, ForeignKey, Integer, Index
-from sqlalchemy.dialects.postgresql import UUID as Uuid, JSONB
+from sqlalchemy import Text, ForeignKey, Integer, Index, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as Uuid, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .ids import uuid7
 
 
 class Recommendation(Base):
@@ -32,7 +33,7 @@ class Recommendation(Base):
 
     __tablename__ = "recommendations"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
@@ -46,9 +47,9 @@ class Recommendation(Base):
     )  # User's specific request
 
     # LLM output
-    recommended_course_ids: Mapped[list] = mapped_column(
-        JSONB, nullable=False
-    )  # Array of UUIDs
+    recommended_course_ids: Mapped[List[uuid.UUID]] = mapped_column(
+        ARRAY(Uuid), nullable=False
+    )  # Native uuid[] (16 bytes per ID), GIN-indexed
     explanation: Mapped[str] = mapped_column(Text, nullable=False)  # AI reasoning
     llm_model: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True
@@ -67,7 +68,11 @@ class Recommendation(Base):
     )
 
     # Timestamp (used for rate limiting)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
 
-    # Index for rate limiting queries (user + recent timestamps)
-    __table_args__ = (Index("idx_user_created", "user_id", "created_at"),)
+    __table_args__ = (
+        # Index for rate limiting queries (user + recent timestamps)
+        Index("idx_user_created", "user_id", "created_at"),
+        # "How often was course X recommended?" (course_id = ANY(...))
+        Index("idx_recommendation_courses", "recommended_course_ids", postgresql_using="gin"),
+    )
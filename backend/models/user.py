@@ -3,13 +3,17 @@ User model for authentication.
 
 Extends fastapi-users base model with built-in fields for authentication.
 """
+import uuid
 from datetime import datetime
 
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import func
+from fastapi_users_db_sqlalchemy.generics import GUID
+from sqlalchemy import Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .ids import uuid7
 
 
 class User(SQLAlchemyBaseUserTableUUID, Base):
@@ -28,7 +32,32 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     keeping authentication concerns separate from profile data.
     """
 
+    # Same column as the fastapi-users base, with a time-ordered default
+    id: Mapped[uuid.UUID] = mapped_column(GUID, primary_key=True, default=uuid7)
+
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(),
         nullable=False
     )
+
+    # Word tokens of the email for the admin multi-word search. '@' and '.'
+    # become spaces first, otherwise the parser keeps the whole address (and
+    # the domain) as single tokens. Deferred: only the search WHERE reads it.
+    search_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', translate(email, '@.', '  '))", persisted=True),
+        deferred=True,
+    )
+
+    __table_args__ = (
+        # Admin user list: equality filters on the flags, ordered by email;
+        # INCLUDE lets list-shaped reads skip the heap
+        Index(
+            "idx_user_admin_list",
+            "is_active",
+            "is_superuser",
+            "email",
+            postgresql_include=["id", "is_verified"],
+        ),
+        Index("idx_user_search_tsv", "search_tsv", postgresql_using="gin"),
+    )
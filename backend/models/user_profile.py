@@ -7,11 +7,12 @@ import uuid
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import Integer, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Integer, Text, ForeignKey, Enum as SQLEnum, func
 from sqlalchemy.dialects.postgresql import UUID as Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .ids import uuid7
 from .enums import DifficultyLevel, TimeCommitment
 
 
@@ -24,8 +25,11 @@ class UserProfile(Base):
     """
 
     __tablename__ = "user_profiles"
+    # Return server-generated updated_at from the UPDATE itself, so reading it
+    # after a flush doesn't trigger a lazy refresh
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
         ForeignKey("user.id", ondelete="CASCADE"),
@@ -37,24 +41,27 @@ class UserProfile(Base):
     # Profile fields (all optional - can be filled gradually)
     learning_goal: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     current_level: Mapped[Optional[DifficultyLevel]] = mapped_column(
-        SQLEnum(DifficultyLevel, native_enum=False), nullable=True
+        SQLEnum(DifficultyLevel, name="difficulty_level"), nullable=True
     )
     time_commitment: Mapped[Optional[TimeCommitment]] = mapped_column(
-        SQLEnum(TimeCommitment, native_enum=False), nullable=True
+        SQLEnum(TimeCommitment, name="time_commitment"), nullable=True
     )
 
     # Versioning for snapshot tracking
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     # Relationships
     interests: Mapped[List["Tag"]] = relationship(
-        "Tag", secondary="user_interests", back_populates="interested_users"
+        "Tag",
+        secondary="user_interests",
+        back_populates="interested_users",
+        lazy="raise_on_sql"  # Load per query with selectinload(UserProfile.interests)
     )
 
 
@@ -5,13 +5,14 @@ Captures profile state at each update for analytics and audit trails.
 """
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import Integer, Text, ForeignKey, Enum as SQLEnum, Index
-from sqlalchemy.dialects.postgresql import UUID as Uuid, JSONB
+from sqlalchemy import Integer, Text, ForeignKey, Enum as SQLEnum, Index, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .ids import uuid7
 from .enums import DifficultyLevel, TimeCommitment
 
 
@@ -33,7 +34,7 @@ class UserProfileSnapshot(Base):
 
     __tablename__ = "user_profile_snapshots"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     user_profile_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("user_profiles.id", ondelete="CASCADE"), nullable=False
     )
@@ -44,20 +45,30 @@ class UserProfileSnapshot(Base):
     # Snapshot of profile fields
     learning_goal: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     current_level: Mapped[Optional[DifficultyLevel]] = mapped_column(
-        SQLEnum(DifficultyLevel, native_enum=False), nullable=True
+        SQLEnum(DifficultyLevel, name="difficulty_level"), nullable=True
     )
     time_commitment: Mapped[Optional[TimeCommitment]] = mapped_column(
-        SQLEnum(TimeCommitment, native_enum=False), nullable=True
+        SQLEnum(TimeCommitment, name="time_commitment"), nullable=True
     )
 
-    # Interests snapshot (JSONB array of tag names)
+    # Interests at snapshot time, as tag IDs (native uuid[], GIN-indexed for
+    # "who was ever interested in X" queries). Tag IDs never change.
+    interest_tag_ids: Mapped[List[uuid.UUID]] = mapped_column(
+        ARRAY(Uuid), nullable=False, server_default="{}"
+    )
+
+    # Interests snapshot (JSONB array of tag names, in interest_tag_ids order)
     # Denormalized for historical accuracy - tags might be renamed/deleted
-    interests_snapshot: Mapped[dict] = mapped_column(
-        JSONB, nullable=False, default=list
+    interests_snapshot: Mapped[List[str]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
     )
 
     # When this snapshot was created
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
 
     # Composite index for efficient temporal queries
-    __table_args__ = (Index("idx_profile_version", "user_profile_id", "version"),)
+    __table_args__ = (
+        Index("idx_profile_version", "user_profile_id", "version"),
+        Index("idx_snapshot_tags", "interest_tag_ids", postgresql_using="gin"),
+    )
+
@@ -1,24 +1,68 @@
 """
 Course repository for data access.
 
-Provides course queries with eager-loaded relationships.
+Provides course queries with eager-loaded relationships. Tags are joined
+into the course query and skills follow in one selectin query; joining both
+would multiply rows (tags x skills per course). Any relationship
+not listed is set to raise on access, so new lazy loads fail in tests
+instead of adding hidden queries.
+
+The catalog is read-only after seeding, so it is loaded once per process
+and served from memory; call clear_catalog_cache() after changing it.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from models.course import Course
 
 
+class _Catalog:
+    """Detached, fully loaded courses with an id index."""
+
+    __slots__ = ("courses", "by_id")
+
+    def __init__(self, courses: List[Course]):
+        self.courses: Tuple[Course, ...] = tuple(courses)
+        self.by_id: Dict[UUID, Course] = {course.id: course for course in courses}
+
+
+_catalog: Optional[_Catalog] = None
+
+
+def clear_catalog_cache() -> None:
+    """Drop the cached catalog (call after the catalog changes)."""
+    global _catalog
+    _catalog = None
+
+
 class CourseRepository:
     """Repository for Course data access."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _get_catalog(self) -> _Catalog:
+        """Return the cached catalog, loading it on first use."""
+        global _catalog
+        if _catalog is None:
+            # Load through a private session so the cached objects never sit in
+            # a request session, where a rollback would expire their attributes
+            async with AsyncSession(self.db.bind, expire_on_commit=False) as session:
+                result = await session.execute(
+                    select(Course).options(
+                        joinedload(Course.tags),
+                        selectinload(Course.skills),
+                        raiseload("*"),
+                    )
+                )
+                _catalog = _Catalog(list(result.unique().scalars().all()))
+        return _catalog
+
     async def get_all_with_relationships(self) -> List[Course]:
         """
         Get all courses with tags and skills eagerly loaded.
@@ -28,13 +72,7 @@ class CourseRepository:
         Returns:
             List of Course objects with populated relationships
         """
-        result = await self.db.execute(
-            select(Course).options(
-                selectinload(Course.tags),
-                selectinload(Course.skills),
-            )
-        )
-        return list(result.scalars().all())
+        return list((await self._get_catalog()).courses)
 
     async def get_by_id(self, course_id) -> Course | None:
         """
@@ -46,15 +84,7 @@ class CourseRepository:
         Returns:
             Course object or None if not found
         """
-        result = await self.db.execute(
-            select(Course)
-            .where(Course.id == course_id)
-            .options(
-                selectinload(Course.tags),
-                selectinload(Course.skills),
-            )
-        )
-        return result.scalar_one_or_none()
+        return (await self._get_catalog()).by_id.get(course_id)
 
     async def get_by_ids(self, course_ids: List) -> List[Course]:
         """
@@ -69,12 +99,5 @@ class CourseRepository:
         if not course_ids:
             return []
 
-        result = await self.db.execute(
-            select(Course)
-            .where(Course.id.in_(course_ids))
-            .options(
-                selectinload(Course.tags),
-                selectinload(Course.skills),
-            )
-        )
-        return list(result.scalars().all())
+        by_id = (await self._get_catalog()).by_id
+        return [by_id[course_id] for course_id in course_ids if course_id in by_id]
@@ -6,7 +6,7 @@ Handles CRUD operations for Recommendation model.
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional
-from sqlalchemy import select, func
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.recommendation import Recommendation
@@ -35,10 +35,17 @@ class RecommendationRepository:
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
+        # count(*) needs no column from the heap, so the (user_id, created_at)
+        # index can serve it with an index-only scan. lambda_stmt caches the
+        # built statement; user_id and cutoff_time are tracked as binds.
         result = await self.db.execute(
-            select(func.count(Recommendation.id)).where(
-                Recommendation.user_id == user_id,
-                Recommendation.created_at >= cutoff_time,
+            lambda_stmt(
+                lambda: select(func.count())
+                .select_from(Recommendation)
+                .where(
+                    Recommendation.user_id == user_id,
+                    Recommendation.created_at >= cutoff_time,
+                )
             )
         )
 
@@ -56,7 +63,7 @@ class RecommendationRepository:
         recommendation_details: Optional[dict] = None,
     ) -> Recommendation:
         """
-        Create a new recommendation record.
+        Create a new recommendation record (flushed, not committed).
 
         Args:
             user_id: User's UUID
@@ -71,14 +78,11 @@ class RecommendationRepository:
         Returns:
             Created Recommendation
         """
-        # Convert UUIDs to strings for JSONB storage
-        course_ids_json = [str(course_id) for course_id in recommended_course_ids]
-
         recommendation = Recommendation(
             user_id=user_id,
             profile_version=profile_version,
             query=query,
-            recommended_course_ids=course_ids_json,
+            recommended_course_ids=recommended_course_ids,
             explanation=explanation,
             llm_model=llm_model,
             profile_analysis_data=profile_analysis_data,
@@ -86,8 +90,9 @@ class RecommendationRepository:
         )
 
         self.db.add(recommendation)
-        await self.db.commit()
-        await self.db.refresh(recommendation)
+        # Flush only (id/created_at come back via RETURNING); the caller
+        # commits once for the whole unit of work
+        await self.db.flush()
 
         return recommendation
 
@@ -4,15 +4,17 @@ User profile repository for data access.
 Handles CRUD operations for UserProfile model.
 """
 import uuid
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Any, Dict, Optional, List
+from sqlalchemy import delete, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from models.user_profile import UserProfile
+from models.user_profile import UserProfile, UserInterest
 from models.user_profile_snapshot import UserProfileSnapshot
 from models.course import Tag
 from models.enums import DifficultyLevel, TimeCommitment
+from models.ids import id_in
 
 
 class UserProfileRepository:
@@ -31,10 +33,13 @@ class UserProfileRepository:
         Returns:
             UserProfile or None if not found
         """
+        # lambda_stmt caches the built statement; user_id is tracked as a bind
         result = await self.db.execute(
-            select(UserProfile)
-            .where(UserProfile.user_id == user_id)
-            .options(selectinload(UserProfile.interests))
+            lambda_stmt(
+                lambda: select(UserProfile)
+                .where(UserProfile.user_id == user_id)
+                .options(selectinload(UserProfile.interests), raiseload("*"))
+            )
         )
         return result.scalar_one_or_none()
 
@@ -47,7 +52,7 @@ class UserProfileRepository:
         interest_tag_ids: Optional[List[uuid.UUID]] = None,
     ) -> UserProfile:
         """
-        Create a new user profile.
+        Create a new user profile (flushed, not committed).
 
         Args:
             user_id: User's UUID
@@ -72,13 +77,7 @@ class UserProfileRepository:
 
         # Associate interests
         if interest_tag_ids:
-            tags = await self.db.execute(
-                select(Tag).where(Tag.id.in_(interest_tag_ids))
-            )
-            profile.interests = tags.scalars().all()
-
-        await self.db.commit()
-        await self.db.refresh(profile)
+            await self._set_interests(profile, interest_tag_ids)
 
         return profile
 
@@ -93,7 +92,7 @@ class UserProfileRepository:
         """
         Update existing user profile.
 
-        Note: This method does NOT create snapshots.
+        Note: This method does NOT create snapshots or commit.
         Use ProfileService.update_profile_with_snapshot() for that.
 
         Args:
@@ -115,19 +114,71 @@ class UserProfileRepository:
 
         # Replace interests if provided
         if interest_tag_ids is not None:
-            tags = await self.db.execute(
-                select(Tag).where(Tag.id.in_(interest_tag_ids))
-            )
-            profile.interests = tags.scalars().all()
+            await self._set_interests(profile, interest_tag_ids)
 
         # Increment version
         profile.version += 1
 
-        await self.db.commit()
-        await self.db.refresh(profile, ["interests"])
+        await self.db.flush()
 
         return profile
 
+    async def _set_interests(
+        self,
+        profile: UserProfile,
+        interest_tag_ids: List[uuid.UUID],
+    ) -> None:
+        """
+        Replace a profile's interests by writing only the junction-table diff.
+
+        Assigning profile.interests makes the unit of work delete and re-insert
+        every user_interests row; here unchanged links are left alone. Unknown
+        tag IDs are ignored. The loaded collection is updated without history,
+        so the flush emits nothing further for it.
+        """
+        result = await self.db.execute(select(Tag).where(id_in(Tag.id, interest_tag_ids)))
+        tags = list(result.scalars().all())
+
+        new_ids = {tag.id for tag in tags}
+        if "interests" in profile.__dict__:
+            current_ids = {tag.id for tag in profile.interests}
+        else:
+            current = await self.db.execute(
+                select(UserInterest.tag_id).where(UserInterest.user_profile_id == profile.id)
+            )
+            current_ids = set(current.scalars().all())
+        removed = current_ids - new_ids
+        added = new_ids - current_ids
+
+        if removed:
+            await self.db.execute(
+                delete(UserInterest).where(
+                    UserInterest.user_profile_id == profile.id,
+                    id_in(UserInterest.tag_id, removed),
+                )
+            )
+        if added:
+            await self.db.execute(
+                insert(UserInterest),
+                [{"user_profile_id": profile.id, "tag_id": tag_id} for tag_id in added],
+            )
+        set_committed_value(profile, "interests", tags)
+
+    async def bulk_snapshot(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert profile snapshots in one statement, without ORM instances.
+
+        Snapshots are insert-only, so they skip the unit of work. Does not
+        commit; the caller's transaction covers the rows.
+
+        Args:
+            rows: Column values per snapshot (user_profile_id, version,
+                learning_goal, current_level, time_commitment,
+                interest_tag_ids, interests_snapshot, optionally created_at)
+        """
+        if rows:
+            await self.db.execute(insert(UserProfileSnapshot), rows)
+
     async def get_snapshots(
         self,
         profile_id: uuid.UUID,
@@ -144,9 +195,11 @@ class UserProfileRepository:
             List of UserProfileSnapshot objects (newest first)
         """
         result = await self.db.execute(
-            select(UserProfileSnapshot)
-            .where(UserProfileSnapshot.user_profile_id == profile_id)
-            .order_by(UserProfileSnapshot.created_at.desc())
-            .limit(limit)
+            lambda_stmt(
+                lambda: select(UserProfileSnapshot)
+                .where(UserProfileSnapshot.user_profile_id == profile_id)
+                .order_by(UserProfileSnapshot.created_at.desc())
+                .limit(limit)
+            )
         )
         return list(result.scalars().all())
@@ -4,18 +4,65 @@ User repository for admin data access.
 Handles queries for user management and analytics.
 """
 import uuid
-from datetime import datetime
-from typing import Optional, List, Tuple
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, List, Tuple
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, update, func, and_, or_, not_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from models.user import User
-from models.user_profile import UserProfile
+from models.user_profile import UserProfile, UserInterest
 from models.user_profile_snapshot import UserProfileSnapshot
 
 
+# Columns the admin list/export rows use; the rest (hashed_password, ...)
+# stay in the database. Reading an unloaded column raises.
+_USER_LIST_COLUMNS = (User.id, User.email, User.is_active, User.is_superuser, User.is_verified)
+
+# Profile summary expressions for queries that outer-join UserProfile onto
+# User; a user without a profile reads as all-unset with no interests
+_INTEREST_COUNT = (
+    select(func.count())
+    .where(UserInterest.user_profile_id == UserProfile.id)
+    .correlate(UserProfile)
+    .scalar_subquery()
+)
+_PROFILE_FIELDS_SET = (
+    UserProfile.learning_goal.isnot(None),
+    UserProfile.current_level.isnot(None),
+    UserProfile.time_commitment.isnot(None),
+    select(UserInterest.user_profile_id)
+    .where(UserInterest.user_profile_id == UserProfile.id)
+    .correlate(UserProfile)
+    .exists(),
+)
+_PROFILE_STATUS_CONDITIONS = {
+    "complete": and_(*_PROFILE_FIELDS_SET),
+    "empty": not_(or_(*_PROFILE_FIELDS_SET)),
+    "partial": and_(or_(*_PROFILE_FIELDS_SET), not_(and_(*_PROFILE_FIELDS_SET))),
+}
+
+# One flat row per user for UserListItem
+_USER_LIST_ROW = (
+    *_USER_LIST_COLUMNS,
+    _PROFILE_FIELDS_SET[0].label("has_learning_goal"),
+    _PROFILE_FIELDS_SET[1].label("has_level"),
+    _PROFILE_FIELDS_SET[2].label("has_time_commitment"),
+    _INTEREST_COUNT.label("interest_count"),
+    UserProfile.current_level,
+)
+
+
+def _list_item(row) -> dict:
+    """Turn a _USER_LIST_ROW result row into UserListItem fields."""
+    item = dict(row)
+    del item["total"]
+    level = item["current_level"]
+    item["current_level"] = level.value if level else None
+    return item
+
+
 class UserRepository:
     """Repository for User data access (admin operations)."""
 
@@ -31,27 +78,120 @@ class UserRepository:
         is_superuser: Optional[bool] = None,
         registered_after: Optional[datetime] = None,
         registered_before: Optional[datetime] = None,
-    ) -> Tuple[List[User], int]:
+        after_email: Optional[str] = None,
+        profile_status: Optional[str] = None,
+    ) -> Tuple[List[dict], int, Optional[str]]:
         """
-        Get paginated list of users with optional filters.
+        Get a paginated list of users with their profile summary.
+
+        Each row is computed in SQL from users outer-joined to their profile,
+        with the interest count as a correlated subquery, so a page costs one
+        query. Pages are ordered by email. Passing the previous page's
+        next_cursor as after_email seeks straight to the next page through
+        the email index instead of reading and discarding skip rows.
 
         Args:
-            skip: Number of records to skip (pagination offset)
+            skip: Number of records to skip (pagination offset, ignored
+                when after_email is given)
             limit: Maximum number of records to return
-            email_search: Substring search on email
+            email_search: Substring search on email; several words are
+                matched as email tokens instead
             is_active: Filter by active status
             is_superuser: Filter by superuser status
             registered_after: Filter users registered after this date
             registered_before: Filter users registered before this date
+            after_email: Keyset cursor; return users with a greater email
+            profile_status: Filter by profile completion: complete, partial, empty
 
         Returns:
-            Tuple of (list of users, total count)
+            Tuple of (list of UserListItem field dicts, total count, next
+            cursor). The cursor is the last email of a full page, or None on
+            the last page.
+        """
+        conditions = self._filter_conditions(
+            email_search, is_active, is_superuser, profile_status
+        )
+
+        # Note: fastapi-users doesn't add created_at by default,
+        # but the base has it. Using the SQLAlchemy inspection if available.
+        # For now, we'll skip date filtering if the column doesn't exist.
+
+        if after_email is not None:
+            rows, total = await self._get_users_after(conditions, after_email, limit)
+        else:
+            rows, total = await self._get_users_at_offset(conditions, skip, limit)
+
+        users = [_list_item(row) for row in rows]
+        next_cursor = users[-1]["email"] if len(users) == limit else None
+        return users, total, next_cursor
+
+    async def stream_users_with_profiles(
+        self,
+        email_search: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        is_superuser: Optional[bool] = None,
+        profile_status: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Tuple[User, Optional[UserProfile], int]]:
+        """
+        Stream filtered users with their profile and interest count.
+
+        Rows come from one outer-joined query read through a server-side
+        cursor in batches, so exports hold batch_size rows in memory
+        however many users match.
+
+        Args:
+            email_search: Substring search on email; several words are
+                matched as email tokens instead
+            is_active: Filter by active status
+            is_superuser: Filter by superuser status
+            profile_status: Filter by profile completion: complete, partial, empty
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            (User, UserProfile or None, interest count), ordered by email
+        """
+        conditions = self._filter_conditions(
+            email_search, is_active, is_superuser, profile_status
+        )
+        query = (
+            select(User, UserProfile, _INTEREST_COUNT)
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .where(*conditions)
+            .order_by(User.email)
+            .options(load_only(*_USER_LIST_COLUMNS, raiseload=True))
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await self.db.stream(query)
+        async for user, profile, count in result:
+            yield user, profile, count
+
+    @staticmethod
+    def _filter_conditions(
+        email_search: Optional[str],
+        is_active: Optional[bool],
+        is_superuser: Optional[bool],
+        profile_status: Optional[str] = None,
+    ) -> list:
+        """
+        Build WHERE conditions for the admin user filters.
+
+        The conditions may reference UserProfile, so queries using them must
+        outer-join it onto User. Unknown profile_status values are ignored.
         """
-        # Build filter conditions
         conditions = []
 
         if email_search:
-            conditions.append(User.email.ilike(f"%{email_search}%"))
+            if " " in email_search.strip():
+                # Several words: match them as tokens through the tsvector
+                # GIN index; websearch syntax ("quotes", OR, -word) applies
+                query = func.websearch_to_tsquery(
+                    "simple", func.translate(email_search, "@.", "  ")
+                )
+                conditions.append(User.search_tsv.op("@@")(query))
+            else:
+                conditions.append(User.email.ilike(f"%{email_search}%"))
 
         if is_active is not None:
             conditions.append(User.is_active == is_active)
@@ -59,30 +199,70 @@ class UserRepository:
         if is_superuser is not None:
             conditions.append(User.is_superuser == is_superuser)
 
-        # Note: fastapi-users doesn't add created_at by default,
-        # but the base has it. Using the SQLAlchemy inspection if available.
-        # For now, we'll skip date filtering if the column doesn't exist.
-
-        # Build query
-        query = select(User)
-        if conditions:
-            query = query.where(and_(*conditions))
-
-        # Get total count
-        count_query = select(func.count()).select_from(User)
-        if conditions:
-            count_query = count_query.where(and_(*conditions))
-
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        # Apply pagination and ordering
-        query = query.order_by(User.email).offset(skip).limit(limit)
+        if profile_status in _PROFILE_STATUS_CONDITIONS:
+            conditions.append(_PROFILE_STATUS_CONDITIONS[profile_status])
+
+        return conditions
+
+    async def _get_users_at_offset(
+        self, conditions: list, skip: int, limit: int
+    ) -> Tuple[list, int]:
+        """Fetch an OFFSET page of list rows and the filtered total in one query."""
+        # The window count sees the filtered set before OFFSET/LIMIT, so
+        # every row carries the full total
+        query = (
+            select(*_USER_LIST_ROW, func.count().over().label("total"))
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .where(*conditions)
+            .order_by(User.email)
+            .offset(skip)
+            .limit(limit)
+        )
 
         result = await self.db.execute(query)
-        users = result.scalars().all()
+        rows = result.mappings().all()
+        if rows:
+            return rows, rows[0]["total"]
+
+        # Empty page: only a page past the end needs a separate count
+        if skip == 0:
+            return [], 0
+        return [], await self._count_users(conditions)
+
+    async def _get_users_after(
+        self, conditions: list, after_email: str, limit: int
+    ) -> Tuple[list, int]:
+        """Fetch the list rows after a keyset cursor and the filtered total in one query."""
+        # The cursor narrows the page, not the total, so the total comes from
+        # an uncorrelated scalar subquery over the filters alone
+        total = self._count_query(conditions).correlate(None).scalar_subquery()
+        query = (
+            select(*_USER_LIST_ROW, total.label("total"))
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .where(User.email > after_email, *conditions)
+            .order_by(User.email)
+            .limit(limit)
+        )
 
-        return list(users), total
+        result = await self.db.execute(query)
+        rows = result.mappings().all()
+        if rows:
+            return rows, rows[0]["total"]
+        return [], await self._count_users(conditions)
+
+    async def _count_users(self, conditions: list) -> int:
+        """Count users matching the filter conditions."""
+        return (await self.db.execute(self._count_query(conditions))).scalar() or 0
+
+    @staticmethod
+    def _count_query(conditions: list):
+        """Build the COUNT query for the filter conditions."""
+        return (
+            select(func.count())
+            .select_from(User)
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .where(*conditions)
+        )
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """
@@ -94,10 +274,8 @@ class UserRepository:
         Returns:
             User or None if not found
         """
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+        # Identity-map lookup first; only queries if the user isn't loaded
+        return await self.db.get(User, user_id)
 
     async def get_user_with_profile(self, user_id: uuid.UUID) -> Optional[Tuple[User, Optional[UserProfile]]]:
         """
@@ -109,23 +287,22 @@ class UserRepository:
         Returns:
             Tuple of (User, UserProfile or None) or None if user not found
         """
-        # Get user
-        user_result = await self.db.execute(
-            select(User).where(User.id == user_id)
+        # One round trip for user + profile (outer join), then one selectin
+        # query for interests when a profile exists
+        result = await self.db.execute(
+            select(User, UserProfile)
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .where(User.id == user_id)
+            .options(
+                load_only(*_USER_LIST_COLUMNS, User.created_at, raiseload=True),
+                selectinload(UserProfile.interests),
+            )
         )
-        user = user_result.scalar_one_or_none()
-
-        if not user:
+        row = result.one_or_none()
+        if row is None:
             return None
 
-        # Get profile with interests
-        profile_result = await self.db.execute(
-            select(UserProfile)
-            .where(UserProfile.user_id == user_id)
-            .options(selectinload(UserProfile.interests))
-        )
-        profile = profile_result.scalar_one_or_none()
-
+        user, profile = row
         return user, profile
 
     async def deactivate_user(self, user_id: uuid.UUID) -> Optional[User]:
@@ -138,17 +315,19 @@ class UserRepository:
         Returns:
             Updated User or None if not found
         """
+        # One UPDATE ... RETURNING instead of fetch, flush, then reload
         result = await self.db.execute(
-            select(User).where(User.id == user_id)
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=False)
+            .returning(User)
         )
         user = result.scalar_one_or_none()
 
         if not user:
             return None
 
-        user.is_active = False
         await self.db.commit()
-        await self.db.refresh(user)
 
         return user
 
@@ -167,19 +346,12 @@ class UserRepository:
         Returns:
             List of UserProfileSnapshot ordered by version desc
         """
-        # First get the profile
-        profile_result = await self.db.execute(
-            select(UserProfile).where(UserProfile.user_id == user_id)
-        )
-        profile = profile_result.scalar_one_or_none()
-
-        if not profile:
-            return []
-
-        # Get snapshots
+        # Join through the profile instead of loading it first; the
+        # (user_profile_id, version) index serves the ORDER BY in reverse
         result = await self.db.execute(
             select(UserProfileSnapshot)
-            .where(UserProfileSnapshot.user_profile_id == profile.id)
+            .join(UserProfile, UserProfile.id == UserProfileSnapshot.user_profile_id)
+            .where(UserProfile.user_id == user_id)
             .order_by(UserProfileSnapshot.version.desc())
             .limit(limit)
         )
@@ -191,50 +363,66 @@ class UserRepository:
         Get user count statistics for analytics.
 
         Returns:
-            Dict with total_users, active_users, superuser_count
+            Dict with total_users, active_users, superuser_count,
+            new_registrations_7d, new_registrations_30d
         """
-        # Total users
-        total_result = await self.db.execute(select(func.count()).select_from(User))
-        total_users = total_result.scalar() or 0
-
-        # Active users
-        active_result = await self.db.execute(
-            select(func.count()).select_from(User).where(User.is_active == True)
-        )
-        active_users = active_result.scalar() or 0
-
-        # Superusers
-        super_result = await self.db.execute(
-            select(func.count()).select_from(User).where(User.is_superuser == True)
-        )
-        superuser_count = super_result.scalar() or 0
+        now = datetime.utcnow()
+
+        # One scan computes all counters
+        row = (
+            await self.db.execute(
+                select(
+                    func.count().label("total"),
+                    func.count().filter(User.is_active.is_(True)).label("active"),
+                    func.count().filter(User.is_superuser.is_(True)).label("superuser"),
+                    func.count().filter(User.created_at >= now - timedelta(days=7)).label("new_7d"),
+                    func.count().filter(User.created_at >= now - timedelta(days=30)).label("new_30d"),
+                ).select_from(User)
+            )
+        ).one()
 
         return {
-            "total_users": total_users,
-            "active_users": active_users,
-            "superuser_count": superuser_count,
+            "total_users": row.total,
+            "active_users": row.active,
+            "superuser_count": row.superuser,
+            "new_registrations_7d": row.new_7d,
+            "new_registrations_30d": row.new_30d,
         }
 
-    async def get_profile_completion_rate(self) -> float:
+    async def get_profile_stats(self) -> dict:
         """
-        Calculate percentage of profiles with learning_goal set.
+        Get profile completion statistics for analytics.
 
         Returns:
-            Float between 0.0 and 1.0
+            Dict with completion_rate (share of profiles with learning_goal
+            set, 0.0-1.0), avg_version and complete_count (all 4 fields filled)
         """
-        total_result = await self.db.execute(
-            select(func.count()).select_from(UserProfile)
+        has_interests = (
+            select(UserInterest.user_profile_id)
+            .where(UserInterest.user_profile_id == UserProfile.id)
+            .exists()
         )
-        total = total_result.scalar() or 0
-
-        if total == 0:
-            return 0.0
-
-        completed_result = await self.db.execute(
-            select(func.count())
-            .select_from(UserProfile)
-            .where(UserProfile.learning_goal.isnot(None))
+        is_complete = and_(
+            UserProfile.learning_goal.isnot(None),
+            UserProfile.current_level.isnot(None),
+            UserProfile.time_commitment.isnot(None),
+            has_interests,
         )
-        completed = completed_result.scalar() or 0
 
-        return completed / total
+        # One scan of user_profiles; interests are probed per row by index
+        row = (
+            await self.db.execute(
+                select(
+                    func.count().label("total"),
+                    func.count().filter(UserProfile.learning_goal.isnot(None)).label("with_goal"),
+                    func.avg(UserProfile.version).label("avg_version"),
+                    func.count().filter(is_complete).label("complete"),
+                ).select_from(UserProfile)
+            )
+        ).one()
+
+        return {
+            "completion_rate": row.with_goal / row.total if row.total else 0.0,
+            "avg_version": float(row.avg_version or 0.0),
+            "complete_count": row.complete,
+        }
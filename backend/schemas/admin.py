@@ -1,15 +1,25 @@
 """
 Admin schemas for user management and analytics.
 """
+import sys
 import uuid
 from datetime import datetime
-from typing import Optional, List, Literal
+from typing import Annotated, Optional, List, Literal, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter
 
 from models.enums import DifficultyLevel, TimeCommitment
 
 
+def _intern_names(names):
+    """Intern tag names so repeated names across rows share one str object."""
+    return tuple(sys.intern(name) for name in names)
+
+
+# Tag names as an immutable tuple of interned strings (JSON: array of str)
+TagNames = Annotated[Tuple[str, ...], BeforeValidator(_intern_names)]
+
+
 class UserListItem(BaseModel):
     """User item in list response."""
     id: uuid.UUID
@@ -24,8 +34,7 @@ class UserListItem(BaseModel):
     interest_count: int = 0
     current_level: Optional[str] = None  # beginner, intermediate, advanced
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserListResponse(BaseModel):
@@ -34,6 +43,7 @@ class UserListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # Pass as `after` for the next page
 
 
 class ProfileSummary(BaseModel):
@@ -44,12 +54,11 @@ class ProfileSummary(BaseModel):
     time_commitment: Optional[TimeCommitment] = None
     version: int
     interest_count: int = 0
-    interests: List[str] = []  # Tag names
+    interests: TagNames = ()  # Tag names
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserDetailResponse(BaseModel):
@@ -63,8 +72,7 @@ class UserDetailResponse(BaseModel):
     recommendation_count: int = 0  # Count of AI recommendations
     profile: Optional[ProfileSummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SnapshotRead(BaseModel):
@@ -74,11 +82,16 @@ class SnapshotRead(BaseModel):
     learning_goal: Optional[str] = None
     current_level: Optional[DifficultyLevel] = None
     time_commitment: Optional[TimeCommitment] = None
-    interests_snapshot: List[str] = []
+    interests_snapshot: TagNames = ()
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# List adapters validate a whole page in one pydantic-core call instead of
+# one model construction per row
+UserListItemListAdapter = TypeAdapter(List[UserListItem])
+SnapshotListAdapter = TypeAdapter(List[SnapshotRead])
 
 
 class SnapshotListResponse(BaseModel):
@@ -164,8 +177,7 @@ class ActivityLogRead(BaseModel):
     description: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ActivityFeedResponse(BaseModel):
@@ -4,7 +4,7 @@ User profile schemas.
 import uuid
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from models.enums import DifficultyLevel, TimeCommitment, TagCategory
 
@@ -15,8 +15,7 @@ class TagResponse(BaseModel):
     name: str
     category: Optional[TagCategory] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProfileRead(BaseModel):
@@ -35,8 +34,7 @@ class ProfileRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProfileCreate(BaseModel):
@@ -78,8 +76,7 @@ class SnapshotRead(BaseModel):
     interests_snapshot: List[str] = []
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SnapshotListResponse(BaseModel):
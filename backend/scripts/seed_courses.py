@@ -4,17 +4,28 @@ Course data seeding script.
 Imports courses from courses.json into the database,
 creating Tag and Skill entities and establishing relationships.
 """
-import json
+import logging
+import uuid
 from pathlib import Path
 from typing import Dict, Set
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import all models to ensure SQLAlchemy can resolve relationships
 import models  # noqa: F401
-from models.course import Course, Tag, Skill
+from core.logging import STARTUP_LOGGER
+from llm.filters import clear_course_cache
+from models.course import Course, CourseSkill, CourseTag, Skill, Tag
 from models.enums import DifficultyLevel, TagCategory
+from models.ids import uuid7
+from repositories.course_repository import clear_catalog_cache
+
+COURSES_FILE = Path(__file__).parent.parent.parent / "courses.json"
+TAG_CATEGORIES_FILE = Path(__file__).parent.parent / "config" / "tag_categories.json"
+
+log = logging.getLogger(STARTUP_LOGGER)
 
 
 async def seed_courses(db: AsyncSession) -> None:
@@ -31,18 +42,15 @@ async def seed_courses(db: AsyncSession) -> None:
         db: Async SQLAlchemy session
     """
     # Check if courses already exist
-    result = await db.execute(select(Course))
-    existing_count = len(result.scalars().all())
+    existing_count = await db.scalar(select(func.count()).select_from(Course))
     if existing_count > 0:
-        print(f"Database already contains {existing_count} courses. Skipping seed.")
+        log.info(f"Database already contains {existing_count} courses. Skipping seed.")
         return
 
     # Load courses.json
-    courses_file = Path(__file__).parent.parent.parent / "courses.json"
-    with open(courses_file, "r") as f:
-        courses_data = json.load(f)
+    courses_data = orjson.loads(COURSES_FILE.read_bytes())
 
-    print(f"Loading {len(courses_data)} courses from {courses_file}")
+    log.info(f"Loading {len(courses_data)} courses from {COURSES_FILE}")
 
     # Step 1: Extract unique tags and skills
     unique_tags: Set[str] = set()
@@ -52,21 +60,22 @@ async def seed_courses(db: AsyncSession) -> None:
         unique_tags.update(course.get("tags", []))
         unique_skills.update(course.get("skills_covered", []))
 
-    print(f"Found {len(unique_tags)} unique tags")
-    print(f"Found {len(unique_skills)} unique skills")
+    log.info(f"Found {len(unique_tags)} unique tags")
+    log.info(f"Found {len(unique_skills)} unique skills")
 
     # Load tag categories from config file
-    tag_categories_file = Path(__file__).parent.parent / "config" / "tag_categories.json"
     tag_categories: Dict[str, str] = {}
-    if tag_categories_file.exists():
-        with open(tag_categories_file, "r") as f:
-            tag_categories = json.load(f)
-        print(f"Loaded {len(tag_categories)} tag categories from config")
+    if TAG_CATEGORIES_FILE.exists():
+        tag_categories = orjson.loads(TAG_CATEGORIES_FILE.read_bytes())
+        log.info(f"Loaded {len(tag_categories)} tag categories from config")
     else:
-        print("Warning: tag_categories.json not found, tags will have no category")
+        log.warning("tag_categories.json not found, tags will have no category")
 
-    # Step 2: Create Tag records with categories
-    tag_map: Dict[str, Tag] = {}
+    # Step 2: Create Tag records with categories. IDs are generated here so
+    # the association rows can be built without reading anything back, and
+    # each table goes in as one executemany insert with no ORM instances.
+    tag_ids: Dict[str, uuid.UUID] = {}
+    tag_rows = []
     for tag_name in unique_tags:
         category_str = tag_categories.get(tag_name, "Other")
         # Convert string to TagCategory enum
@@ -74,62 +83,63 @@ async def seed_courses(db: AsyncSession) -> None:
             category = TagCategory(category_str)
         except ValueError:
             category = TagCategory.OTHER
-        tag = Tag(name=tag_name, category=category)
-        db.add(tag)
-        tag_map[tag_name] = tag
+        tag_ids[tag_name] = uuid7()
+        tag_rows.append({"id": tag_ids[tag_name], "name": tag_name, "category": category})
 
-    await db.flush()  # Get IDs without committing
-    print(f"Created {len(tag_map)} tag records with categories")
+    await db.execute(insert(Tag), tag_rows)
+    log.info(f"Created {len(tag_ids)} tag records with categories")
 
     # Step 3: Create Skill records
-    skill_map: Dict[str, Skill] = {}
-    for skill_name in unique_skills:
-        skill = Skill(name=skill_name)
-        db.add(skill)
-        skill_map[skill_name] = skill
-
-    await db.flush()
-    print(f"Created {len(skill_map)} skill records")
-
-    # Step 4: Create Course records with relationships
+    skill_ids: Dict[str, uuid.UUID] = {name: uuid7() for name in unique_skills}
+    await db.execute(
+        insert(Skill),
+        [{"id": skill_id, "name": name} for name, skill_id in skill_ids.items()],
+    )
+    log.info(f"Created {len(skill_ids)} skill records")
+
+    # Step 4: Create Course records, then their tag and skill links
+    course_rows = []
+    course_tag_rows = []
+    course_skill_rows = []
     for course_data in courses_data:
-        # Map difficulty string to enum
-        difficulty = DifficultyLevel(course_data["difficulty"])
-
-        # Create course
-        course = Course(
-            title=course_data["title"],
-            description=course_data["description"],
-            difficulty=difficulty,
-            duration=course_data["duration"],
-            contents=course_data["contents"]
-        )
-
-        # Add tag relationships
-        for tag_name in course_data.get("tags", []):
-            if tag_name in tag_map:
-                course.tags.append(tag_map[tag_name])
-
-        # Add skill relationships
-        for skill_name in course_data.get("skills_covered", []):
-            if skill_name in skill_map:
-                course.skills.append(skill_map[skill_name])
-
-        db.add(course)
+        course_id = uuid7()
+        course_rows.append({
+            "id": course_id,
+            "title": course_data["title"],
+            "description": course_data["description"],
+            # Map difficulty string to enum
+            "difficulty": DifficultyLevel(course_data["difficulty"]),
+            "duration": course_data["duration"],
+            "contents": course_data["contents"],
+        })
+
+        # dict.fromkeys drops repeated names while keeping their order
+        for tag_name in dict.fromkeys(course_data.get("tags", [])):
+            if tag_name in tag_ids:
+                course_tag_rows.append({"course_id": course_id, "tag_id": tag_ids[tag_name]})
+
+        for skill_name in dict.fromkeys(course_data.get("skills_covered", [])):
+            if skill_name in skill_ids:
+                course_skill_rows.append({"course_id": course_id, "skill_id": skill_ids[skill_name]})
+
+    await db.execute(insert(Course), course_rows)
+    if course_tag_rows:
+        await db.execute(insert(CourseTag), course_tag_rows)
+    if course_skill_rows:
+        await db.execute(insert(CourseSkill), course_skill_rows)
 
     # Commit all changes atomically
     await db.commit()
-    print(f"Successfully seeded {len(courses_data)} courses")
-
-    # Print summary
-    result = await db.execute(select(Course))
-    final_course_count = len(result.scalars().all())
-    result = await db.execute(select(Tag))
-    final_tag_count = len(result.scalars().all())
-    result = await db.execute(select(Skill))
-    final_skill_count = len(result.scalars().all())
-
-    print("\n=== Seeding Summary ===")
-    print(f"Courses: {final_course_count}")
-    print(f"Tags: {final_tag_count}")
-    print(f"Skills: {final_skill_count}")
+    clear_course_cache()
+    clear_catalog_cache()
+    log.info(f"Successfully seeded {len(courses_data)} courses")
+
+    # Log summary
+    final_course_count = await db.scalar(select(func.count()).select_from(Course))
+    final_tag_count = await db.scalar(select(func.count()).select_from(Tag))
+    final_skill_count = await db.scalar(select(func.count()).select_from(Skill))
+
+    log.info(
+        f"Seeding summary: {final_course_count} courses, "
+        f"{final_tag_count} tags, {final_skill_count} skills"
+    )
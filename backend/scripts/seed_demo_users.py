@@ -10,21 +10,25 @@ User distribution (25 users):
 - 10 users: Complete profile, 1-2 updates
 - 6 users: Active users with 3-5 profile updates
 """
+import asyncio
+import logging
 import random
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_users.password import PasswordHelper
 
 from models.user import User
 from models.user_profile import UserProfile
-from models.user_profile_snapshot import UserProfileSnapshot
 from models.course import Tag
 from models.enums import DifficultyLevel, TimeCommitment
 from core.config import settings
+from core.logging import STARTUP_LOGGER
+from repositories.user_profile_repository import UserProfileRepository
 
+log = logging.getLogger(STARTUP_LOGGER)
 
 # Demo user password
 PASSWORD = settings.DEMO_USER_PASSWORD or "123123123"
@@ -54,6 +58,9 @@ LEARNING_GOALS = [
     None,
 ]
 
+# Goals for personas that always fill the field
+FILLED_LEARNING_GOALS = tuple(g for g in LEARNING_GOALS if g)
+
 # Timestamp ranges (days ago)
 TIME_RANGES = {
     "old": (60, 90),      # 2-3 months ago
@@ -72,118 +79,119 @@ async def seed_demo_users(db: AsyncSession) -> None:
     2. No demo users exist yet (idempotent)
     """
     if not settings.SEED_DEMO_USERS:
-        print("Demo user seeding disabled (SEED_DEMO_USERS=false)")
+        log.info("Demo user seeding disabled (SEED_DEMO_USERS=false)")
         return
 
     # Check if demo users already exist
-    result = await db.execute(
-        select(User).where(User.email.like("demo%@example.com"))
+    existing_count = await db.scalar(
+        select(func.count()).select_from(User).where(User.email.like("demo%@example.com"))
     )
-    existing = result.scalars().all()
-    if existing:
-        print(f"Demo users already exist ({len(existing)} users). Skipping seed.")
+    if existing_count > 0:
+        log.info(f"Demo users already exist ({existing_count} users). Skipping seed.")
         return
 
-    print("Seeding demo users...")
+    log.info("Seeding demo users...")
 
-    # Get all tags for interests
-    result = await db.execute(select(Tag))
+    # Get all tags for interests (ordered, so a fixed DEMO_SEED picks the same ones)
+    result = await db.execute(select(Tag).order_by(Tag.name))
     all_tags = result.scalars().all()
 
     if not all_tags:
-        print("Warning: No tags found. Seed courses first.")
+        log.warning("No tags found. Seed courses first.")
         return
 
     password_helper = PasswordHelper()
-    hashed_password = password_helper.hash(PASSWORD)
+    # Hashing is CPU-bound; keep it off the event loop
+    hashed_password = await asyncio.to_thread(password_helper.hash, PASSWORD)
     now = datetime.utcnow()
 
-    # Define user personas
-    personas = _generate_personas()
-
-    created_count = 0
-    snapshot_count = 0
+    # One generator for the whole run; DEMO_SEED makes the data reproducible
+    rng = random.Random(settings.DEMO_SEED)
 
-    for i, persona in enumerate(personas, start=1):
-        email = f"demo{i:02d}@example.com"
+    # Define user personas
+    personas = _generate_personas(rng)
 
-        # Calculate creation date
+    # Calculate creation dates
+    created_ats = []
+    for persona in personas:
         time_range = TIME_RANGES[persona["age"]]
-        days_ago = random.randint(time_range[0], time_range[1])
-        created_at = now - timedelta(days=days_ago)
-
-        # Create user
-        user = User(
-            email=email,
-            hashed_password=hashed_password,
-            is_active=True,
-            is_superuser=False,
-            is_verified=False,
-            created_at=created_at,
-        )
-        db.add(user)
-        await db.flush()
+        days_ago = rng.randint(time_range[0], time_range[1])
+        created_ats.append(now - timedelta(days=days_ago))
 
-        # Create profile based on persona type
+    # Create all users in one executemany insert; RETURNING in parameter
+    # order lines the generated IDs up with the personas
+    result = await db.execute(
+        insert(User).returning(User.id, sort_by_parameter_order=True),
+        [
+            {
+                "email": f"demo{i:02d}@example.com",
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "is_superuser": False,
+                "is_verified": False,
+                "created_at": created_at,
+            }
+            for i, created_at in enumerate(created_ats, start=1)
+        ],
+    )
+    user_ids = result.scalars().all()
+
+    # Create profiles based on persona type, flushed together
+    profiles = []
+    profile_snapshots = []
+    for user_id, persona, created_at in zip(user_ids, personas, created_ats):
         profile, snapshots = await _create_profile_for_persona(
-            db, user.id, persona, all_tags, created_at, now
+            db, user_id, persona, all_tags, created_at, now, rng
         )
+        profiles.append(profile)
+        profile_snapshots.append(snapshots)
 
-        db.add(profile)
-        await db.flush()
+    db.add_all(profiles)
+    await db.flush()
 
+    snapshot_rows = []
+    for profile, snapshots in zip(profiles, profile_snapshots):
         for snapshot in snapshots:
-            snapshot.user_profile_id = profile.id
-            db.add(snapshot)
-
-        created_count += 1
-        snapshot_count += len(snapshots)
+            snapshot["user_profile_id"] = profile.id
+        snapshot_rows.extend(snapshots)
 
+    # All snapshots go in as one multi-row insert
+    await UserProfileRepository(db).bulk_snapshot(snapshot_rows)
     await db.commit()
 
-    print(f"Created {created_count} demo users with {snapshot_count} profile snapshots")
-    print(f"Password for all demo users: {PASSWORD}")
-    print("Demo user emails: demo01@example.com through demo25@example.com")
+    log.info(f"Created {len(user_ids)} demo users with {len(snapshot_rows)} profile snapshots")
+    log.info(f"Password for all demo users: {PASSWORD}")
+    log.info("Demo user emails: demo01@example.com through demo25@example.com")
 
 
-def _generate_personas() -> List[dict]:
+def _generate_personas(rng: random.Random) -> List[dict]:
     """Generate 25 user personas with varied characteristics."""
     personas = []
 
     # 4 users: Never touched profile (inactive/abandoned)
-    for _ in range(4):
-        personas.append({
-            "type": "inactive",
-            "age": random.choice(["old", "recent"]),
-            "updates": 0,
-        })
+    for age in rng.choices(["old", "recent"], k=4):
+        personas.append({"type": "inactive", "age": age, "updates": 0})
 
     # 5 users: Incomplete profile (partial data)
-    for _ in range(5):
-        personas.append({
-            "type": "incomplete",
-            "age": random.choice(["recent", "this_week"]),
-            "updates": 1,
-        })
+    for age in rng.choices(["recent", "this_week"], k=5):
+        personas.append({"type": "incomplete", "age": age, "updates": 1})
 
     # 10 users: Complete profile, minimal activity
-    for _ in range(10):
-        personas.append({
-            "type": "complete",
-            "age": random.choice(["old", "recent", "this_week"]),
-            "updates": random.randint(1, 2),
-        })
+    for age, updates in zip(
+        rng.choices(["old", "recent", "this_week"], k=10),
+        rng.choices(range(1, 3), k=10),
+    ):
+        personas.append({"type": "complete", "age": age, "updates": updates})
 
     # 6 users: Active users with multiple updates
-    for _ in range(6):
-        personas.append({
-            "type": "active",
-            "age": random.choice(["old", "recent"]),
-            "updates": random.randint(3, 5),
-        })
+    for age, updates in zip(
+        rng.choices(["old", "recent"], k=6),
+        rng.choices(range(3, 6), k=6),
+    ):
+        personas.append({"type": "active", "age": age, "updates": updates})
 
     # Shuffle to mix user types
-    random.shuffle(personas)
+    rng.shuffle(personas)
     return personas
 
 
@@ -194,19 +202,21 @@ async def _create_profile_for_persona(
     all_tags: List[Tag],
     created_at: datetime,
     now: datetime,
-) -> tuple[UserProfile, List[UserProfileSnapshot]]:
-    """Create profile and snapshots based on persona type."""
+    rng: random.Random,
+) -> tuple[UserProfile, List[dict]]:
+    """Create profile and snapshot rows based on persona type."""
 
     snapshots = []
     persona_type = persona["type"]
     num_updates = persona["updates"]
 
     # Initial empty snapshot (version 1)
-    initial_snapshot = UserProfileSnapshot(
+    initial_snapshot = dict(
         version=1,
         learning_goal=None,
         current_level=None,
         time_commitment=None,
+        interest_tag_ids=[],
         interests_snapshot=[],
         created_at=created_at,
     )
@@ -228,27 +238,27 @@ async def _create_profile_for_persona(
     # Generate profile data based on type
     if persona_type == "incomplete":
         # Only fill 1-2 fields randomly
-        fields_to_fill = random.randint(1, 2)
-        learning_goal = random.choice(LEARNING_GOALS) if fields_to_fill >= 1 and random.random() > 0.3 else None
-        current_level = random.choice(list(DifficultyLevel)) if fields_to_fill >= 2 or (fields_to_fill == 1 and not learning_goal) else None
+        fields_to_fill = rng.randint(1, 2)
+        learning_goal = rng.choice(LEARNING_GOALS) if fields_to_fill >= 1 and rng.random() > 0.3 else None
+        current_level = rng.choice(list(DifficultyLevel)) if fields_to_fill >= 2 or (fields_to_fill == 1 and not learning_goal) else None
         time_commitment = None
         interest_tags = []
 
     elif persona_type == "complete":
         # All fields filled
-        learning_goal = random.choice([g for g in LEARNING_GOALS if g])
-        current_level = random.choice(list(DifficultyLevel))
-        time_commitment = random.choice(list(TimeCommitment))
-        num_interests = random.randint(2, 5)
-        interest_tags = random.sample(all_tags, min(num_interests, len(all_tags)))
+        learning_goal = rng.choice(FILLED_LEARNING_GOALS)
+        current_level = rng.choice(list(DifficultyLevel))
+        time_commitment = rng.choice(list(TimeCommitment))
+        num_interests = rng.randint(2, 5)
+        interest_tags = rng.sample(all_tags, min(num_interests, len(all_tags)))
 
     else:  # active
         # All fields filled, will have multiple updates
-        learning_goal = random.choice([g for g in LEARNING_GOALS if g])
-        current_level = random.choice(list(DifficultyLevel))
-        time_commitment = random.choice(list(TimeCommitment))
-        num_interests = random.randint(3, 6)
-        interest_tags = random.sample(all_tags, min(num_interests, len(all_tags)))
+        learning_goal = rng.choice(FILLED_LEARNING_GOALS)
+        current_level = rng.choice(list(DifficultyLevel))
+        time_commitment = rng.choice(list(TimeCommitment))
+        num_interests = rng.randint(3, 6)
+        interest_tags = rng.sample(all_tags, min(num_interests, len(all_tags)))
 
     # Create update snapshots
     current_version = 1
@@ -258,14 +268,15 @@ async def _create_profile_for_persona(
         current_version += 1
         update_time = created_at + timedelta(days=days_between_updates * (update_num + 1))
         if update_time > now:
-            update_time = now - timedelta(hours=random.randint(1, 24))
+            update_time = now - timedelta(hours=rng.randint(1, 24))
 
         # Snapshot captures state BEFORE update
-        snapshot = UserProfileSnapshot(
+        snapshot = dict(
             version=current_version,
             learning_goal=learning_goal if update_num > 0 else None,
             current_level=current_level if update_num > 0 else None,
             time_commitment=time_commitment if update_num > 0 else None,
+            interest_tag_ids=[t.id for t in interest_tags] if update_num > 0 else [],
             interests_snapshot=[t.name for t in interest_tags] if update_num > 0 else [],
             created_at=update_time,
         )
@@ -273,13 +284,13 @@ async def _create_profile_for_persona(
 
         # Randomly modify some fields for next iteration (simulates profile evolution)
         if persona_type == "active" and update_num < num_updates - 1:
-            if random.random() < 0.3:
-                learning_goal = random.choice([g for g in LEARNING_GOALS if g])
-            if random.random() < 0.2:
-                num_interests = random.randint(2, 7)
-                interest_tags = random.sample(all_tags, min(num_interests, len(all_tags)))
-            if random.random() < 0.15:
-                time_commitment = random.choice(list(TimeCommitment))
+            if rng.random() < 0.3:
+                learning_goal = rng.choice(FILLED_LEARNING_GOALS)
+            if rng.random() < 0.2:
+                num_interests = rng.randint(2, 7)
+                interest_tags = rng.sample(all_tags, min(num_interests, len(all_tags)))
+            if rng.random() < 0.15:
+                time_commitment = rng.choice(list(TimeCommitment))
 
     # Create final profile state
     profile = UserProfile(
@@ -289,7 +300,7 @@ async def _create_profile_for_persona(
         time_commitment=time_commitment,
         version=current_version,
         created_at=created_at,
-        updated_at=now - timedelta(hours=random.randint(0, 48)) if num_updates > 0 else created_at,
+        updated_at=now - timedelta(hours=rng.randint(0, 48)) if num_updates > 0 else created_at,
     )
 
     # Add interests to profile
@@ -3,6 +3,7 @@ Profile service with business logic.
 
 Handles profile updates with automatic snapshot creation.
 """
+import logging
 import uuid
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,10 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from models.user_profile import UserProfile
-from models.user_profile_snapshot import UserProfileSnapshot
 from models.enums import DifficultyLevel, TimeCommitment
 from repositories.user_profile_repository import UserProfileRepository
 
+logger = logging.getLogger(__name__)
+
 
 class ProfileService:
     """Service for profile-related business logic."""
@@ -29,6 +31,7 @@ class ProfileService:
         current_level: Optional[DifficultyLevel] = None,
         time_commitment: Optional[TimeCommitment] = None,
         interest_tag_ids: Optional[List[uuid.UUID]] = None,
+        user_email: Optional[str] = None,
     ) -> UserProfile:
         """
         Update user profile and create snapshot atomically.
@@ -37,7 +40,8 @@ class ProfileService:
         1. Get current profile
         2. Update profile fields and increment version
         3. Create snapshot of NEW state (after update)
-        4. Commit both changes
+        4. Add the activity log entry
+        5. Commit all of it in one transaction
 
         Args:
             user_id: User's UUID
@@ -45,6 +49,8 @@ class ProfileService:
             current_level: New current level
             time_commitment: New time commitment
             interest_tag_ids: New list of tag IDs
+            user_email: User's email for the activity log; looked up when
+                not given (callers with the authenticated User should pass it)
 
         Returns:
             Updated UserProfile
@@ -67,37 +73,43 @@ class ProfileService:
         )
 
         # 3. Create snapshot of NEW state (AFTER update)
-        snapshot = UserProfileSnapshot(
-            user_profile_id=updated_profile.id,
-            version=updated_profile.version,
-            learning_goal=updated_profile.learning_goal,
-            current_level=updated_profile.current_level,
-            time_commitment=updated_profile.time_commitment,
-            interests_snapshot=[tag.name for tag in updated_profile.interests],
-        )
-        self.db.add(snapshot)
-        await self.db.commit()
-        await self.db.refresh(updated_profile)
+        await self.repo.bulk_snapshot([
+            dict(
+                user_profile_id=updated_profile.id,
+                version=updated_profile.version,
+                learning_goal=updated_profile.learning_goal,
+                current_level=updated_profile.current_level,
+                time_commitment=updated_profile.time_commitment,
+                interest_tag_ids=[tag.id for tag in updated_profile.interests],
+                interests_snapshot=[tag.name for tag in updated_profile.interests],
+            )
+        ])
 
-        # Log profile update event (non-blocking)
-        try:
-            from models.activity_log import ActivityLog, ActivityEventType
-            from models.user import User
+        # 4. Log profile update event. The row goes in a savepoint, so a
+        # failure to write it rolls back only the log, not the update
+        from models.activity_log import ActivityLog, ActivityEventType
+        from models.user import User
 
+        if user_email is None:
             user_result = await self.db.execute(
                 select(User.email).where(User.id == user_id)
             )
             user_email = user_result.scalar_one_or_none() or "unknown"
 
-            activity_log = ActivityLog(
-                event_type=ActivityEventType.PROFILE_UPDATE,
-                user_id=user_id,
-                user_email=user_email,
-                description=f"updated profile (v{updated_profile.version})",
+        try:
+            async with self.db.begin_nested():
+                self.db.add(ActivityLog(
+                    event_type=ActivityEventType.PROFILE_UPDATE,
+                    user_id=user_id,
+                    user_email=user_email,
+                    description=f"updated profile (v{updated_profile.version})",
+                ))
+        except Exception:
+            logger.warning(
+                "Failed to log profile update activity for user %s", user_id, exc_info=True
             )
-            self.db.add(activity_log)
-            await self.db.commit()
-        except Exception as e:
-            print(f"Failed to log profile update activity: {e}")
+
+        # Profile update, snapshot and activity log commit together
+        await self.db.commit()
 
         return updated_profile
@@ -4,6 +4,7 @@ Recommendation service with rate limiting.
 Handles AI recommendation generation with rate limits.
 Uses QUERY-FIRST architecture: user's request is primary, profile is enrichment.
 """
+import asyncio
 import logging
 import time
 import uuid
@@ -17,17 +18,13 @@ from repositories.recommendation_repository import RecommendationRepository
 from repositories.user_profile_repository import UserProfileRepository
 from repositories.course_repository import CourseRepository
 from repositories.llm_metrics_repository import LLMMetricsRepository
-from llm.agents.profile_analyzer import ProfileAnalyzerAgent
-from llm.agents.course_recommender import CourseRecommenderAgent
 from llm.filters import filter_courses
-from llm.intent import QueryIntent, classify_intent, get_intent_message
 from llm.exceptions import (
     LLMEmptyProfileError,
     LLMNoCoursesError,
     LLMTimeoutError,
     LLMValidationError,
 )
-from llm.callbacks import LLMMetricsCallback
 from core.config import settings
 
 
@@ -106,6 +103,7 @@ class RecommendationService:
             query=query,
             llm_model=llm_model,
         )
+        await self.db.commit()
 
         return recommendation
 
@@ -154,7 +152,7 @@ class RecommendationService:
         - Profile is used to ENRICH and PERSONALIZE, not redirect
 
         Orchestrates the 2-agent pipeline:
-        0. Classify intent (handle edge cases without LLM)
+        0. Classify intent (handle edge cases without LLM), concurrently with 2-3
         1. Check rate limit
         2. Load profile and history
         3. Pre-filter courses (query-first scoring)
@@ -177,12 +175,43 @@ class RecommendationService:
             HTTPException 504: LLM timeout
             HTTPException 500: LLM error
         """
+        # LangChain and the OpenAI SDK load on first use, not at app startup
+        from llm.agents.course_recommender import CourseRecommenderAgent
+        from llm.agents.profile_analyzer import ProfileAnalyzerAgent
+        from llm.callbacks import LLMMetricsCallback
+        from llm.intent import QueryIntent, classify_intent, get_intent_message
+
         start_time = time.time()
         logger.info(f"[PERF] Starting recommendation for user {user_id}")
 
-        # 0. Classify intent (brief LLM call for nuanced understanding)
+        # 0. Classify intent (brief LLM call) in the background while the
+        # profile and catalog are loaded and pre-filtered
         t0 = time.time()
-        intent = await classify_intent(query)
+        intent_task = asyncio.create_task(classify_intent(query))
+        try:
+            # 2. Load profile and history
+            t2 = time.time()
+            profile = await self.profile_repo.get_profile_by_user_id(user_id)
+            snapshots = []
+            filtered_courses = []
+            if profile:
+                snapshots = await self.profile_repo.get_snapshots(profile.id, limit=3)
+                logger.info(f"[PERF] Profile loaded: {time.time() - t2:.2f}s")
+
+                # 3. Load and pre-filter courses
+                t3 = time.time()
+                course_repo = CourseRepository(self.db)
+                all_courses = await course_repo.get_all_with_relationships()
+                filtered_courses = filter_courses(all_courses, profile, query)
+                logger.info(
+                    f"[PERF] Courses loaded/filtered: {time.time() - t3:.2f}s "
+                    f"({len(filtered_courses)} of {len(all_courses)} courses)"
+                )
+
+            intent = await intent_task
+        except BaseException:
+            intent_task.cancel()
+            raise
         logger.info(f"[PERF] Intent classified: {intent.value} ({time.time() - t0:.2f}s)")
 
         # Handle IRRELEVANT queries without consuming LLM tokens
@@ -200,9 +229,6 @@ class RecommendationService:
         await self.check_rate_limit(user_id)
         logger.info(f"[PERF] Rate limit check: {time.time() - t1:.2f}s")
 
-        # 2. Load profile and history
-        t2 = time.time()
-        profile = await self.profile_repo.get_profile_by_user_id(user_id)
         if not profile:
             raise HTTPException(status_code=400, detail="Profile not found")
 
@@ -223,19 +249,6 @@ class RecommendationService:
             # Has profile - proceed with profile-based recommendations
             logger.info("[PERF] Vague query with profile - using profile-based recommendations")
 
-        snapshots = await self.profile_repo.get_snapshots(profile.id, limit=3)
-        logger.info(f"[PERF] Profile loaded: {time.time() - t2:.2f}s")
-
-        # 3. Load and pre-filter courses
-        t3 = time.time()
-        course_repo = CourseRepository(self.db)
-        all_courses = await course_repo.get_all_with_relationships()
-        filtered_courses = filter_courses(all_courses, profile, query)
-        logger.info(
-            f"[PERF] Courses loaded/filtered: {time.time() - t3:.2f}s "
-            f"({len(filtered_courses)} of {len(all_courses)} courses)"
-        )
-
         if not filtered_courses:
             raise HTTPException(
                 status_code=400,
@@ -315,20 +328,22 @@ class RecommendationService:
         )
         logger.info(f"[PERF] Database store: {time.time() - t6:.2f}s")
 
-        # 6b. Store LLM metrics
+        # 6b. Store LLM metrics (same transaction as the recommendation).
+        # A cached analysis made no LLM call, so it gets no profile_analysis row
         metrics_repo = LLMMetricsRepository(self.db)
-        await metrics_repo.create(
-            operation="profile_analysis",
-            duration_ms=callback1.duration_ms,
-            user_id=user_id,
-            recommendation_id=stored.id,
-            model=callback1.model,
-            tokens_input=callback1.tokens_input,
-            tokens_output=callback1.tokens_output,
-            tokens_total=callback1.tokens_total,
-            status="error" if callback1.error else "success",
-            error=callback1.error,
-        )
+        if callback1.start_time is not None:
+            await metrics_repo.create(
+                operation="profile_analysis",
+                duration_ms=callback1.duration_ms,
+                user_id=user_id,
+                recommendation_id=stored.id,
+                model=callback1.model,
+                tokens_input=callback1.tokens_input,
+                tokens_output=callback1.tokens_output,
+                tokens_total=callback1.tokens_total,
+                status="error" if callback1.error else "success",
+                error=callback1.error,
+            )
         await metrics_repo.create(
             operation="course_recommendation",
             duration_ms=callback2.duration_ms,
@@ -24,6 +24,7 @@ export type AdminUserListResponse = {
   total: number
   skip: number
   limit: number
+  next_cursor: string | null
 }
 
 export type ProfileSummary = {
@@ -31,6 +31,7 @@ sys.path.insert(0, str(backend_dir))
 
 from main import app
 from core.database import get_async_session
+from api.admin import clear_analytics_cache
 from models.base import Base
 from models.user import User
 from models.user_profile import UserProfile
@@ -159,6 +160,8 @@ async def client(test_db):
         yield test_db
 
     app.dependency_overrides[get_async_session] = override_get_db
+    # Cached aggregates would outlive the per-test data reset
+    clear_analytics_cache()
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
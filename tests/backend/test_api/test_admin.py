@@ -223,6 +223,45 @@ class TestAdminUserManagement:
         assert data["skip"] == 0
         assert data["limit"] == 2
 
+    async def test_list_users_cursor_pagination(self, client, superuser_headers, multiple_users):
+        """GET /admin/users walks all users via next_cursor without skip."""
+        first = await client.get(
+            "/admin/users",
+            headers=superuser_headers,
+            params={"limit": 3}
+        )
+        first_data = first.json()
+        assert len(first_data["users"]) == 3
+        assert first_data["next_cursor"] == first_data["users"][-1]["email"]
+
+        second = await client.get(
+            "/admin/users",
+            headers=superuser_headers,
+            params={"limit": 3, "after": first_data["next_cursor"]}
+        )
+
+        assert second.status_code == 200
+        second_data = second.json()
+        assert len(second_data["users"]) == 1
+        assert second_data["total"] == 4
+        assert second_data["next_cursor"] is None
+        emails = [u["email"] for u in first_data["users"] + second_data["users"]]
+        assert emails == sorted(emails)
+        assert len(set(emails)) == 4
+
+    async def test_list_users_page_past_end_keeps_total(self, client, superuser_headers, multiple_users):
+        """GET /admin/users past the last page returns no users but the real total."""
+        response = await client.get(
+            "/admin/users",
+            headers=superuser_headers,
+            params={"skip": 10, "limit": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["users"] == []
+        assert data["total"] == 4
+
     async def test_list_users_filter_by_email(self, client, superuser_headers, multiple_users):
         """GET /admin/users filters by email substring."""
         response = await client.get(
@@ -236,6 +275,19 @@ class TestAdminUserManagement:
         assert data["total"] == 1
         assert data["users"][0]["email"] == "user1@example.com"
 
+    async def test_list_users_search_by_email_tokens(self, client, superuser_headers, multiple_users):
+        """GET /admin/users matches a multi-word search against email tokens."""
+        response = await client.get(
+            "/admin/users",
+            headers=superuser_headers,
+            params={"email": "example user2"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["users"][0]["email"] == "user2@example.com"
+
     async def test_list_users_filter_by_is_superuser(self, client, superuser_headers, multiple_users):
         """GET /admin/users filters by is_superuser status."""
         response = await client.get(
@@ -249,6 +301,20 @@ class TestAdminUserManagement:
         assert data["total"] == 1
         assert data["users"][0]["is_superuser"] is True
 
+    async def test_list_users_filter_by_profile_status(self, client, superuser_headers, multiple_users):
+        """GET /admin/users filters by profile_status before paging, so total counts all matches."""
+        response = await client.get(
+            "/admin/users",
+            headers=superuser_headers,
+            params={"profile_status": "partial", "limit": 1}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [u["email"] for u in data["users"]] == ["user1@example.com"]
+        assert data["users"][0]["current_level"] == "beginner"
+
     async def test_list_users_includes_profile_summary(self, client, superuser_headers, multiple_users):
         """GET /admin/users includes profile summary (has_learning_goal, interest_count)."""
         response = await client.get("/admin/users", headers=superuser_headers)
@@ -267,6 +333,19 @@ class TestAdminUserManagement:
         assert user3 is not None
         assert user3["has_learning_goal"] is False
 
+    async def test_export_users_csv(self, client, superuser_headers, multiple_users):
+        """GET /admin/users/export streams every matching user as a CSV row."""
+        response = await client.get("/admin/users/export", headers=superuser_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        lines = response.text.strip().splitlines()
+        assert lines[0].startswith("Email,Status")
+        assert len(lines) == 5  # header + superuser + 3 users
+
+        user1 = next(line for line in lines if line.startswith("user1@example.com"))
+        assert user1.endswith(",2")  # interest count
+
     async def test_get_user_detail(self, client, superuser_headers, multiple_users):
         """GET /admin/users/{id} returns user with profile."""
         user_id = str(multiple_users["users"]["user1"].id)
@@ -374,6 +453,21 @@ class TestAdminAnalytics:
         # Rate should be 0.5 (2/4)
         assert 0.4 <= data["profile_completion_rate"] <= 0.6
 
+    async def test_analytics_overview_is_cached(self, client, superuser_headers, multiple_users):
+        """GET /admin/analytics/overview reuses its result until the cache is cleared."""
+        from api.admin import clear_analytics_cache
+
+        first = await client.get("/admin/analytics/overview", headers=superuser_headers)
+        assert first.json()["total_users"] == 4
+
+        await register_and_login(client, "user4@example.com", "Password123")
+        cached = await client.get("/admin/analytics/overview", headers=superuser_headers)
+        assert cached.json()["total_users"] == 4
+
+        clear_analytics_cache()
+        fresh = await client.get("/admin/analytics/overview", headers=superuser_headers)
+        assert fresh.json()["total_users"] == 5
+
     async def test_popular_tags(self, client, superuser_headers, multiple_users):
         """GET /admin/analytics/tags/popular returns tags sorted by interest count."""
         response = await client.get(
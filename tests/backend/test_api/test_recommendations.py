@@ -115,7 +115,7 @@ async def test_quota_reflects_usage(client, user_with_profile, test_db):
         await test_db.execute(
             text("""
                 INSERT INTO recommendations (id, user_id, profile_version, recommended_course_ids, explanation, created_at)
-                VALUES (:id, :user_id, 1, '[]', 'test', NOW())
+                VALUES (:id, :user_id, 1, '{}', 'test', NOW())
             """),
             {"id": str(uuid.uuid4()), "user_id": user_id}
         )
@@ -129,3 +129,48 @@ async def test_quota_reflects_usage(client, user_with_profile, test_db):
     data = response2.json()
     assert data["used"] == 3
     assert data["remaining"] == 7
+
+
+async def test_generate_recommendations_response_body(client, user_with_profile, monkeypatch):
+    """Test the recommendation response is serialized to the documented shape."""
+    from datetime import datetime, timezone
+    from services.recommendation_service import RecommendationService
+
+    recommendation_id = uuid.uuid4()
+    course_id = uuid.uuid4()
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    async def fake_generate(self, user_id, query=None, num_recommendations=5):
+        return {
+            "type": "recommendations",
+            "id": recommendation_id,
+            "query": query,
+            "profile_analysis": {"skill_level": "intermediate", "skill_gaps": ["SQL"], "confidence": 0.8},
+            "profile_feedback": None,
+            "courses": [{
+                "course_id": course_id,
+                "title": "Intro to SQL",
+                "match_score": 0.9,
+                "explanation": "Fills the SQL gap",
+                "skill_gaps_addressed": ["SQL"],
+                "estimated_weeks": 4,
+            }],
+            "learning_path": [],
+            "overall_summary": "Start with SQL",
+            "created_at": created_at,
+        }
+
+    monkeypatch.setattr(RecommendationService, "generate_recommendations", fake_generate)
+
+    response = await client.post(
+        "/users/me/recommendations",
+        headers=user_with_profile["headers"],
+        json={"query": "learn sql"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == str(recommendation_id)
+    assert data["courses"][0]["course_id"] == str(course_id)
+    assert data["created_at"] == "2026-01-02T03:04:05Z"
+    assert "type" not in data  # only RecommendationRead fields are returned
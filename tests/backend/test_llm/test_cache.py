@@ -0,0 +1,92 @@
+"""
+Tests for the in-process LLM result cache.
+"""
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from llm.cache import AsyncTTLCache, profile_cache_key
+from models.enums import DifficultyLevel
+
+
+async def test_concurrent_misses_share_one_call():
+    """Test concurrent requests for the same key run the factory once."""
+    cache = AsyncTTLCache(maxsize=10, ttl_seconds=60)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "analysis"
+
+    results = await asyncio.gather(*(cache.get_or_create(b"k", factory) for _ in range(5)))
+
+    assert results == ["analysis"] * 5
+    assert calls == 1
+    assert await cache.get_or_create(b"k", factory) == "analysis"
+    assert calls == 1
+
+
+async def test_expired_and_evicted_entries_are_dropped():
+    """Test TTL expiry and LRU eviction."""
+    expired = AsyncTTLCache(maxsize=10, ttl_seconds=-1)
+    expired.set(b"k", "stale")
+    assert expired.get(b"k") is None
+
+    cache = AsyncTTLCache(maxsize=2, ttl_seconds=60)
+    cache.set(b"a", 1)
+    cache.set(b"b", 2)
+    cache.get(b"a")  # a becomes most recently used
+    cache.set(b"c", 3)
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == 1
+    assert len(cache) == 2
+
+
+def test_profile_cache_key_ignores_interest_order():
+    """Test the key depends on profile content, not interest ordering."""
+    def profile(*interests, goal="Learn Python"):
+        return SimpleNamespace(
+            learning_goal=goal,
+            current_level=DifficultyLevel.BEGINNER,
+            time_commitment=None,
+            interests=[SimpleNamespace(name=name) for name in interests],
+        )
+
+    key = profile_cache_key(profile("python", "sql"), [], "data")
+    assert key == profile_cache_key(profile("sql", "python"), [], "data")
+    assert key != profile_cache_key(profile("sql", "python"), [], "web")
+    assert key != profile_cache_key(profile("sql", "python", goal="Learn SQL"), [], "data")
+    assert len(key) == 16
+
+
+def test_profile_cache_key_includes_history():
+    """Test the same profile fields with different history get different keys."""
+    profile = SimpleNamespace(
+        learning_goal="Learn Python",
+        current_level=DifficultyLevel.BEGINNER,
+        time_commitment=None,
+        interests=[SimpleNamespace(name="python")],
+    )
+
+    def snapshot(version, goal):
+        return SimpleNamespace(
+            version=version,
+            learning_goal=goal,
+            current_level=DifficultyLevel.BEGINNER,
+            interest_tag_ids=[uuid.UUID(int=version)],
+        )
+
+    # Same current profile reached by different paths (A -> B -> A vs. A)
+    edited = [snapshot(1, "Learn Python"), snapshot(2, "Learn SQL")]
+    key = profile_cache_key(profile, edited, "data")
+    assert key == profile_cache_key(profile, list(edited), "data")
+    assert key != profile_cache_key(profile, [], "data")
+    assert key != profile_cache_key(profile, edited[:1], "data")
+    assert key != profile_cache_key(profile, [edited[0], snapshot(2, "Learn Go")], "data")
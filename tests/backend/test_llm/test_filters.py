@@ -0,0 +1,85 @@
+"""
+Tests for course pre-filtering.
+
+Uses lightweight stand-ins for Course/UserProfile so scoring can be
+checked without a database.
+"""
+import uuid
+from types import SimpleNamespace
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from llm.filters import MAX_DESCRIPTION_LENGTH, TOP_K, filter_courses
+from models.enums import DifficultyLevel, TimeCommitment
+
+
+def make_course(title, tags=(), description="A course.", difficulty=DifficultyLevel.BEGINNER, duration=10):
+    """Build a Course-like object."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        title=title,
+        description=description,
+        difficulty=difficulty,
+        duration=duration,
+        tags=[SimpleNamespace(name=name) for name in tags],
+    )
+
+
+def make_profile(interests=(), level=None, time_commitment=None):
+    """Build a UserProfile-like object."""
+    return SimpleNamespace(
+        interests=[SimpleNamespace(name=name) for name in interests],
+        current_level=level,
+        time_commitment=time_commitment,
+    )
+
+
+def test_query_match_ranks_first():
+    """Test courses matching the query outrank profile-only matches."""
+    courses = [make_course(f"Filler {i}") for i in range(5)]
+    courses.append(make_course("Python Basics", tags=["python"]))
+
+    result = filter_courses(courses, make_profile(), "python")
+
+    assert result[0]["title"] == "Python Basics"
+    assert result[0]["relevance_score"] > result[1]["relevance_score"]
+
+
+def test_keeps_top_k_in_stable_order():
+    """Test only TOP_K courses are kept and ties preserve catalog order."""
+    courses = [make_course(f"Course {i}") for i in range(TOP_K + 10)]
+
+    result = filter_courses(courses, make_profile())
+
+    assert len(result) == TOP_K
+    assert [c["title"] for c in result] == [f"Course {i}" for i in range(TOP_K)]
+
+
+def test_profile_scoring_prefers_interest_level_and_duration():
+    """Test interest overlap, difficulty and duration all contribute."""
+    profile = make_profile(
+        interests=["sql"],
+        level=DifficultyLevel.ADVANCED,
+        time_commitment=TimeCommitment.HOURS_20_PLUS,
+    )
+    best = make_course("Best", tags=["sql"], difficulty=DifficultyLevel.ADVANCED, duration=20)
+    worst = make_course("Worst", difficulty=DifficultyLevel.BEGINNER, duration=500)
+
+    result = filter_courses([worst, best], profile)
+
+    assert [c["title"] for c in result] == ["Best", "Worst"]
+    assert result[0]["relevance_score"] == 8 + 15 + 10
+    assert result[1]["relevance_score"] == 3 + 2
+
+
+def test_description_truncated_at_word_boundary():
+    """Test long descriptions are cut at a space and marked with an ellipsis."""
+    description = "word " * 100
+    result = filter_courses([make_course("Long", description=description)], make_profile())
+
+    truncated = result[0]["description"]
+    assert truncated.endswith("word...")
+    assert len(truncated) <= MAX_DESCRIPTION_LENGTH + 3
@@ -0,0 +1,42 @@
+"""
+Tests for query intent classification.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from langchain_core.runnables import RunnableLambda
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from core.config import settings
+from llm import intent
+from llm.intent import IntentClassification, QueryIntent, classify_intent
+
+
+def fake_llm(delay: float, answer: str = "irrelevant"):
+    """LLM stand-in whose structured output arrives after `delay` seconds."""
+    async def respond(_):
+        await asyncio.sleep(delay)
+        return IntentClassification(intent=answer)
+
+    return SimpleNamespace(with_structured_output=lambda schema: RunnableLambda(respond))
+
+
+async def test_intent_waits_for_slow_llm_by_default(monkeypatch):
+    """Test no timeout applies unless INTENT_TIMEOUT_SECONDS is set."""
+    monkeypatch.setattr(settings, "INTENT_TIMEOUT_SECONDS", None)
+    monkeypatch.setattr(intent, "get_llm", lambda: fake_llm(0.05))
+
+    assert await classify_intent("hey") == QueryIntent.IRRELEVANT
+
+
+async def test_intent_timeout_falls_back_to_specific_and_logs(monkeypatch, caplog):
+    """Test an opt-in timeout falls back to SPECIFIC with a warning."""
+    monkeypatch.setattr(settings, "INTENT_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(intent, "get_llm", lambda: fake_llm(1.0))
+
+    assert await classify_intent("hey") == QueryIntent.SPECIFIC
+    assert "Intent classification timed out" in caplog.text
@@ -0,0 +1,92 @@
+"""
+Tests for compact_schema (LLM_COMPACT_SCHEMAS).
+
+The compact schema drops the "title"/"description" annotations to save
+prompt tokens; everything that constrains a payload must survive.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from llm.schemas import PROFILE_ANALYSIS_SCHEMA, RECOMMENDATION_SCHEMA, compact_schema
+
+ANNOTATIONS = {"title", "description"}
+
+
+def assert_same_constraints(original, compact):
+    """
+    Walk both schemas together: compact must equal original minus the
+    annotation keywords, with property names (which are data, not
+    keywords) left alone.
+    """
+    if isinstance(original, list):
+        assert isinstance(compact, list) and len(compact) == len(original)
+        for orig_item, compact_item in zip(original, compact):
+            assert_same_constraints(orig_item, compact_item)
+    elif isinstance(original, dict):
+        assert set(compact) == set(original) - ANNOTATIONS
+        for key, value in compact.items():
+            if key in ("properties", "$defs"):
+                assert set(value) == set(original[key])
+                for name in value:
+                    assert_same_constraints(original[key][name], value[name])
+            else:
+                assert_same_constraints(original[key], value)
+    else:
+        assert compact == original
+
+
+def test_strips_annotations_but_keeps_fields_named_like_them():
+    schema = {
+        "title": "Course",
+        "description": "A course.",
+        "type": "object",
+        "properties": {
+            "title": {"title": "Title", "type": "string", "maxLength": 255},
+            "description": {"description": "Body text", "type": "string"},
+            "tags": {"type": "array", "items": {"title": "Tag", "type": "string"}},
+        },
+        "required": ["title", "description"],
+        "$defs": {"description": {"title": "Nested", "enum": ["a", "b"]}},
+        "anyOf": [{"title": "Either", "type": "object"}],
+    }
+
+    assert compact_schema(schema) == {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string", "maxLength": 255},
+            "description": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["title", "description"],
+        "$defs": {"description": {"enum": ["a", "b"]}},
+        "anyOf": [{"type": "object"}],
+    }
+
+
+def test_does_not_mutate_input():
+    schema = {"title": "T", "properties": {"a": {"description": "d", "type": "string"}}}
+
+    compact_schema(schema)
+
+    assert schema == {"title": "T", "properties": {"a": {"description": "d", "type": "string"}}}
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param(PROFILE_ANALYSIS_SCHEMA, id="ProfileAnalysis"),
+        pytest.param(RECOMMENDATION_SCHEMA, id="RecommendationOutput"),
+    ],
+)
+def test_output_schemas_keep_every_constraint(schema):
+    """Types, bounds, required lists and $refs are unchanged, so the same payloads validate."""
+    compact = compact_schema(schema)
+
+    assert_same_constraints(schema, compact)
+    assert compact["required"] == schema["required"]
+    assert compact["properties"].keys() == schema["properties"].keys()
@@ -0,0 +1,105 @@
+"""
+Tests for the pre-parsed prompt templates.
+
+Checks CompiledTemplate against LangChain's ChatPromptTemplate rendering
+for the real user prompts, and that split_static_prefix loses nothing.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from llm.prompts import course_recommender, profile_analyzer
+from llm.prompts.template import CompiledTemplate, split_static_prefix
+
+
+PROFILE_CONTEXT = {
+    "learning_goal": "Move into data engineering",
+    "current_level": "intermediate",
+    "time_commitment": "5-10",
+    "interests": "Python, SQL",
+    "profile_history": "No previous profile changes",
+    "user_query": "Courses on {streaming} pipelines",
+}
+
+RECOMMENDER_CONTEXT = {
+    "skill_level": "intermediate",
+    "skill_gaps": "Spark, Airflow",
+    "time_constraint_hours": 8,
+    "personalization_note": "Builds on existing SQL work",
+    "profile_completeness": "complete",
+    "profile_confidence": 0.85,
+    "courses_json": '[{"id": "c1", "title": "Data Pipelines"}]',
+    "user_query": "Recommend the best courses for my profile",
+    "num_courses": 5,
+}
+
+PROMPTS = [
+    pytest.param(profile_analyzer, PROFILE_CONTEXT, id="profile_analyzer"),
+    pytest.param(course_recommender, RECOMMENDER_CONTEXT, id="course_recommender"),
+]
+
+
+@pytest.mark.parametrize("module,context", PROMPTS)
+def test_render_matches_chat_prompt_template(module, context):
+    """The prefix plus the compiled remainder renders what LangChain would."""
+    expected = (
+        ChatPromptTemplate.from_template(module.USER_PROMPT_TEMPLATE)
+        .format_messages(**context)[0]
+        .content
+    )
+
+    rendered = module.USER_PROMPT_PREFIX + CompiledTemplate(module.USER_PROMPT_REST).render(context)
+
+    assert rendered == expected
+    assert CompiledTemplate(module.USER_PROMPT_TEMPLATE).render(context) == expected
+
+
+@pytest.mark.parametrize("module,context", PROMPTS)
+def test_split_prefix_rejoins_to_full_template(module, context):
+    """The split is lossless and the prefix has no fields."""
+    prefix, rest = split_static_prefix(module.USER_PROMPT_TEMPLATE)
+
+    assert (prefix, rest) == (module.USER_PROMPT_PREFIX, module.USER_PROMPT_REST)
+    assert prefix
+    assert prefix + rest == module.USER_PROMPT_TEMPLATE
+    assert prefix + rest.format(**context) == module.USER_PROMPT_TEMPLATE.format(**context)
+
+
+def test_split_prefix_keeps_escaped_braces():
+    """Escaped braces in the lead-in are unescaped in the prefix only."""
+    prefix, rest = split_static_prefix("JSON {{like}} this: {value} end")
+
+    assert prefix == "JSON {like} this: "
+    assert rest == "{value} end"
+    assert prefix + rest.format(value=1) == "JSON {{like}} this: {value} end".format(value=1)
+
+
+def test_split_prefix_of_template_starting_with_field():
+    prefix, rest = split_static_prefix("{value} end")
+
+    assert prefix == ""
+    assert rest == "{value} end"
+
+
+def test_missing_fields_render_as_unknown():
+    template = CompiledTemplate("Level: {level}, goal: {goal}")
+
+    assert template.render({"level": "beginner"}) == "Level: beginner, goal: unknown"
+    assert template.render({}) == "Level: unknown, goal: unknown"
+
+
+def test_values_are_not_reinterpreted_as_templates():
+    template = CompiledTemplate("Query: {user_query}")
+
+    assert template.render({"user_query": "use {braces}"}) == "Query: use {braces}"
+
+
+def test_format_specs_are_rejected():
+    with pytest.raises(ValueError):
+        CompiledTemplate("Score: {score:.2f}")
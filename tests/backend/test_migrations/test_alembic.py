@@ -0,0 +1,233 @@
+"""
+Tests for the Alembic revisions.
+
+Each test rebuilds part of the schema the way older code created it, runs
+`alembic upgrade head` on the test session's connection, checks the result
+and rolls everything back (PostgreSQL DDL is transactional).
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+# Add backend to path
+BACKEND_DIR = Path(__file__).parent.parent.parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+BASELINE_REVISION = "5b0e2c7d9a41"
+
+
+def _upgrade(sync_conn, revision: str = "head") -> None:
+    """
+    Run every revision after the baseline on an existing connection,
+    inside its transaction.
+
+    The database is stamped at the baseline first, so the result does not
+    depend on whichever revision the test database was last upgraded to.
+    """
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.attributes["connection"] = sync_conn
+    command.stamp(config, BASELINE_REVISION, purge=True)
+    command.upgrade(config, revision)
+
+
+@pytest_asyncio.fixture
+async def legacy_db(test_db):
+    """Connection whose schema changes are rolled back after the test."""
+    conn = await test_db.connection()
+    yield conn
+    await test_db.rollback()
+
+
+async def _create_profile(conn) -> str:
+    """Insert a bare user and profile; return the profile ID."""
+    user_id = (await conn.execute(text(
+        'INSERT INTO "user" (id, email, hashed_password, is_active, is_superuser, is_verified) '
+        "VALUES (gen_random_uuid(), 'legacy@example.com', 'x', true, false, false) RETURNING id"
+    ))).scalar_one()
+    return (await conn.execute(
+        text("INSERT INTO user_profiles (id, user_id, version) VALUES (gen_random_uuid(), :user_id, 1) RETURNING id"),
+        {"user_id": user_id},
+    )).scalar_one()
+
+
+async def test_upgrade_is_a_no_op_on_current_schema(legacy_db):
+    """Test upgrading a database created by create_all() succeeds."""
+    await legacy_db.run_sync(_upgrade)
+
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    version = (await legacy_db.execute(text("SELECT version_num FROM alembic_version"))).scalar_one()
+    assert version == ScriptDirectory.from_config(config).get_current_head()
+
+
+async def test_snapshot_interests_backfilled_and_legacy_column_kept(legacy_db, caplog):
+    """Test JSONB tag names become tag IDs in order, keeping the original names."""
+    await legacy_db.execute(text("ALTER TABLE user_profile_snapshots DROP COLUMN interest_tag_ids"))
+    await legacy_db.execute(text(
+        "ALTER TABLE user_profile_snapshots DROP COLUMN interests_snapshot, "
+        "ADD COLUMN interests_snapshot jsonb NOT NULL"
+    ))
+    tags = (await legacy_db.execute(text("SELECT id, name FROM tags ORDER BY name LIMIT 2"))).all()
+    names = [tags[1].name, "No Such Tag", tags[0].name]
+    profile_id = await _create_profile(legacy_db)
+    await legacy_db.execute(
+        text(
+            "INSERT INTO user_profile_snapshots (id, user_profile_id, version, interests_snapshot) "
+            "VALUES (gen_random_uuid(), :profile_id, 1, CAST(:names AS jsonb))"
+        ),
+        {"profile_id": profile_id, "names": json.dumps(names)},
+    )
+
+    await legacy_db.run_sync(_upgrade)
+
+    row = (await legacy_db.execute(text(
+        "SELECT interest_tag_ids, interests_snapshot FROM user_profile_snapshots"
+    ))).one()
+    assert row.interest_tag_ids == [tags[1].id, tags[0].id]
+    assert row.interests_snapshot == names
+    assert "1 snapshot(s) had interest names with no matching tag" in caplog.text
+
+
+async def test_recommendation_course_ids_skip_invalid_elements(legacy_db, caplog):
+    """Test JSONB course IDs become a uuid[], skipping elements that aren't UUIDs."""
+    await legacy_db.execute(text("DROP INDEX idx_recommendation_courses"))
+    await legacy_db.execute(text("ALTER TABLE recommendations DROP COLUMN recommended_course_ids"))
+    await legacy_db.execute(text(
+        "ALTER TABLE recommendations ADD COLUMN recommended_course_ids jsonb NOT NULL"
+    ))
+    course_ids = (await legacy_db.execute(text("SELECT id FROM courses ORDER BY title LIMIT 2"))).scalars().all()
+    stored = [str(course_ids[1]), "not-a-uuid", str(course_ids[0]).upper()]
+    profile_id = await _create_profile(legacy_db)
+    user_id = (await legacy_db.execute(
+        text("SELECT user_id FROM user_profiles WHERE id = :id"), {"id": profile_id}
+    )).scalar_one()
+    await legacy_db.execute(
+        text(
+            "INSERT INTO recommendations (id, user_id, profile_version, recommended_course_ids, explanation) "
+            "VALUES (gen_random_uuid(), :user_id, 1, CAST(:ids AS jsonb), 'x')"
+        ),
+        {"user_id": user_id, "ids": json.dumps(stored)},
+    )
+
+    await legacy_db.run_sync(_upgrade)
+
+    row = (await legacy_db.execute(text(
+        "SELECT recommended_course_ids, recommended_course_ids_jsonb FROM recommendations"
+    ))).one()
+    assert row.recommended_course_ids == [course_ids[1], course_ids[0]]
+    assert row.recommended_course_ids_jsonb == stored
+    index = (await legacy_db.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE indexname = 'idx_recommendation_courses'"
+    ))).scalar_one_or_none()
+    assert index is not None
+    assert "1 recommendation(s) had course IDs that aren't UUIDs" in caplog.text
+
+
+async def test_varchar_enum_column_converted_to_native_enum(legacy_db):
+    """Test a VARCHAR enum column becomes the native enum type, keeping its values."""
+    before = dict((await legacy_db.execute(text("SELECT id, difficulty::text FROM courses"))).all())
+    await legacy_db.execute(text(
+        "ALTER TABLE courses ALTER COLUMN difficulty TYPE varchar(12) USING difficulty::text"
+    ))
+
+    await legacy_db.run_sync(_upgrade)
+
+    udt_name = (await legacy_db.execute(text(
+        "SELECT udt_name FROM information_schema.columns "
+        "WHERE table_name = 'courses' AND column_name = 'difficulty'"
+    ))).scalar_one()
+    assert udt_name == "difficulty_level"
+    after = dict((await legacy_db.execute(text("SELECT id, difficulty::text FROM courses"))).all())
+    assert after == before
+
+
+async def test_missing_created_at_default_restored(legacy_db):
+    """Test a created_at column without a server default gets now() back."""
+    await legacy_db.execute(text("ALTER TABLE tags ALTER COLUMN created_at DROP DEFAULT"))
+
+    await legacy_db.run_sync(_upgrade)
+
+    created_at = (await legacy_db.execute(text(
+        "INSERT INTO tags (id, name, category) "
+        "VALUES (gen_random_uuid(), 'Migration Test Tag', 'OTHER') RETURNING created_at"
+    ))).scalar_one()
+    assert created_at is not None
+
+
+async def test_user_search_tsv_added_for_existing_users(legacy_db):
+    """Test the generated search column is added and filled for existing users."""
+    await _create_profile(legacy_db)
+    await legacy_db.execute(text('ALTER TABLE "user" DROP COLUMN search_tsv'))
+
+    await legacy_db.run_sync(_upgrade)
+
+    matches = (await legacy_db.execute(text(
+        "SELECT email FROM \"user\" WHERE search_tsv @@ to_tsquery('simple', 'legacy')"
+    ))).scalars().all()
+    assert matches == ["legacy@example.com"]
+
+
+async def test_missing_pg_trgm_does_not_abort_upgrade(legacy_db, caplog):
+    """Test the upgrade completes whether or not the trigram index can be built."""
+    await legacy_db.run_sync(_upgrade)
+
+    available = (await legacy_db.execute(text(
+        "SELECT count(*) FROM pg_available_extensions WHERE name = 'pg_trgm'"
+    ))).scalar_one()
+    index = (await legacy_db.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE indexname = 'idx_user_email_trgm'"
+    ))).scalar_one_or_none()
+    if available:
+        assert index is not None
+    else:
+        assert index is None
+        assert "Skipping email trigram index" in caplog.text
+
+
+async def test_missing_model_indexes_created(legacy_db):
+    """Test indexes added to existing tables are created by the upgrade."""
+    await legacy_db.execute(text("DROP INDEX idx_user_admin_list"))
+    await legacy_db.execute(text("DROP INDEX idx_llm_op_time"))
+
+    await legacy_db.run_sync(_upgrade)
+
+    indexes = (await legacy_db.execute(text(
+        "SELECT indexname FROM pg_indexes "
+        "WHERE indexname IN ('idx_user_admin_list', 'idx_llm_op_time')"
+    ))).scalars().all()
+    assert sorted(indexes) == ["idx_llm_op_time", "idx_user_admin_list"]
+
+
+async def test_snapshot_names_filled_for_rows_written_with_ids_only(legacy_db):
+    """Test snapshots stored without tag names get them from their tag IDs."""
+    await legacy_db.execute(text(
+        "ALTER TABLE user_profile_snapshots ALTER COLUMN interests_snapshot DROP NOT NULL, "
+        "ALTER COLUMN interests_snapshot DROP DEFAULT"
+    ))
+    tags = (await legacy_db.execute(text("SELECT id, name FROM tags ORDER BY name LIMIT 2"))).all()
+    profile_id = await _create_profile(legacy_db)
+    await legacy_db.execute(
+        text(
+            "INSERT INTO user_profile_snapshots (id, user_profile_id, version, interest_tag_ids) "
+            "VALUES (gen_random_uuid(), :profile_id, 1, :ids)"
+        ),
+        {"profile_id": profile_id, "ids": [tags[1].id, tags[0].id]},
+    )
+
+    await legacy_db.run_sync(_upgrade)
+
+    names = (await legacy_db.execute(text(
+        "SELECT interests_snapshot FROM user_profile_snapshots"
+    ))).scalar_one()
+    assert names == [tags[1].name, tags[0].name]
+    nullable = (await legacy_db.execute(text(
+        "SELECT is_nullable FROM information_schema.columns "
+        "WHERE table_name = 'user_profile_snapshots' AND column_name = 'interests_snapshot'"
+    ))).scalar_one()
+    assert nullable == "NO"
@@ -0,0 +1,96 @@
+"""
+Tests for UUIDv7 generation and the id_in() array lookup.
+"""
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from models import ids
+from models.course import Course
+from models.ids import id_in, uuid7
+
+FROZEN_MS = 1_760_000_000_000
+
+
+def timestamp_ms(value: uuid.UUID) -> int:
+    return value.int >> 80
+
+
+def counter(value: uuid.UUID) -> int:
+    return (value.int >> 64) & 0xFFF
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin the clock to one millisecond, with fresh generator state."""
+    clock = {"ms": FROZEN_MS}
+    monkeypatch.setattr(ids, "_last_ms", 0)
+    monkeypatch.setattr(ids, "_counter", 0)
+    monkeypatch.setattr(ids.time, "time_ns", lambda: clock["ms"] * 1_000_000)
+    return clock
+
+
+def test_version_and_variant_bits():
+    for _ in range(1000):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+def test_timestamp_is_current_time(frozen_clock):
+    assert timestamp_ms(uuid7()) == FROZEN_MS
+
+
+def test_ids_are_unique_and_sorted():
+    values = [uuid7() for _ in range(10_000)]
+
+    assert len(set(values)) == len(values)
+    assert values == sorted(values)
+
+
+def test_monotonic_within_one_millisecond(frozen_clock):
+    values = [uuid7() for _ in range(1000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert {timestamp_ms(v) for v in values} <= {FROZEN_MS, FROZEN_MS + 1}
+    # The counter starts in its lower half, leaving room to increment
+    assert counter(values[0]) <= 0x7FF
+
+
+def test_counter_overflow_advances_timestamp(frozen_clock):
+    values = [uuid7() for _ in range(0x1000 + 10)]
+
+    assert values == sorted(values)
+    assert timestamp_ms(values[-1]) > FROZEN_MS
+
+
+def test_clock_step_back_stays_monotonic(frozen_clock):
+    before = uuid7()
+    frozen_clock["ms"] -= 5_000
+    after = uuid7()
+
+    assert after > before
+    assert timestamp_ms(after) == FROZEN_MS
+
+
+def test_id_in_renders_one_array_parameter():
+    """Any number of IDs compiles to the same `= ANY($1::UUID[])` statement."""
+    dialect = asyncpg.dialect()
+    one = select(Course.id).where(id_in(Course.id, [uuid.uuid4()])).compile(dialect=dialect)
+    many = select(Course.id).where(
+        id_in(Course.id, (uuid.uuid4() for _ in range(50)))
+    ).compile(dialect=dialect)
+
+    assert "courses.id = ANY ($1::UUID[])" in str(one)
+    assert str(one) == str(many)
+    assert len(many.params) == 1
+    assert len(next(iter(many.params.values()))) == 50
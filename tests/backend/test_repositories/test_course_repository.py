@@ -0,0 +1,36 @@
+"""
+Tests for CourseRepository's in-process catalog cache.
+"""
+import sys
+import uuid
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from repositories.course_repository import CourseRepository, clear_catalog_cache
+
+
+async def test_catalog_survives_request_session_rollback(test_db):
+    """Test cached courses stay readable after the loading session rolls back."""
+    clear_catalog_cache()
+    repo = CourseRepository(test_db)
+
+    courses = await repo.get_all_with_relationships()
+    await test_db.rollback()
+
+    again = await repo.get_all_with_relationships()
+    assert [c.id for c in again] == [c.id for c in courses]
+    assert all(c.title and c.tags for c in again)
+
+
+async def test_get_by_ids_skips_unknown_ids(test_db):
+    """Test lookups by ID return known courses in request order."""
+    repo = CourseRepository(test_db)
+    courses = await repo.get_all_with_relationships()
+    wanted = [courses[2].id, uuid.uuid4(), courses[0].id]
+
+    found = await repo.get_by_ids(wanted)
+
+    assert [c.id for c in found] == [courses[2].id, courses[0].id]
+    assert await repo.get_by_id(courses[1].id) is courses[1]
@@ -4,7 +4,7 @@ Tests for ProfileService business logic.
 Tests snapshot creation, version management, and atomic operations.
 """
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, update
 import sys
 from pathlib import Path
 
@@ -149,3 +149,123 @@ async def test_multiple_updates_create_multiple_snapshots(
 
     assert snapshots[3].learning_goal == "Goal 3"
     assert snapshots[3].time_commitment == TimeCommitment.HOURS_10_20
+
+
+async def test_interest_update_keeps_overlapping_tags(
+    test_db,
+    test_user_profile
+):
+    """Test that changing interests only swaps the tags that differ."""
+    from models.course import Tag
+    from models.user_profile import UserInterest
+
+    result = await test_db.execute(select(Tag.id).order_by(Tag.name).limit(3))
+    first, second, third = result.scalars().all()
+    profile_service = ProfileService(test_db)
+
+    await profile_service.update_profile_with_snapshot(
+        user_id=test_user_profile.user_id,
+        interest_tag_ids=[first, second],
+    )
+    updated_profile = await profile_service.update_profile_with_snapshot(
+        user_id=test_user_profile.user_id,
+        interest_tag_ids=[second, third],
+    )
+
+    assert {tag.id for tag in updated_profile.interests} == {second, third}
+
+    result = await test_db.execute(
+        select(UserInterest.tag_id)
+        .where(UserInterest.user_profile_id == test_user_profile.id)
+    )
+    assert set(result.scalars().all()) == {second, third}
+
+    result = await test_db.execute(
+        select(UserProfileSnapshot.interest_tag_ids)
+        .where(UserProfileSnapshot.user_profile_id == test_user_profile.id)
+        .where(UserProfileSnapshot.version == 3)
+    )
+    assert set(result.scalar_one()) == {second, third}
+
+
+async def test_update_profile_logs_activity_with_given_email(
+    test_db,
+    test_user_profile
+):
+    """Test the activity log uses the caller's email instead of looking it up."""
+    from models.activity_log import ActivityLog, ActivityEventType
+
+    profile_service = ProfileService(test_db)
+
+    await profile_service.update_profile_with_snapshot(
+        user_id=test_user_profile.user_id,
+        learning_goal="Learn SQL",
+        user_email="caller@example.com",
+    )
+
+    result = await test_db.execute(
+        select(ActivityLog.user_email, ActivityLog.description)
+        .where(ActivityLog.user_id == test_user_profile.user_id)
+        .where(ActivityLog.event_type == ActivityEventType.PROFILE_UPDATE)
+    )
+    assert result.all() == [("caller@example.com", "updated profile (v2)")]
+
+
+async def test_failed_activity_log_does_not_lose_update(
+    test_db,
+    test_user_profile,
+    caplog
+):
+    """Test a failed activity log insert rolls back only the log, not the update."""
+    from models.activity_log import ActivityLog, ActivityEventType
+
+    profile_service = ProfileService(test_db)
+
+    # Longer than the user_email column allows, so the log insert fails
+    await profile_service.update_profile_with_snapshot(
+        user_id=test_user_profile.user_id,
+        learning_goal="Learn Rust",
+        user_email="x" * 300,
+    )
+
+    profile = await test_db.execute(
+        select(UserProfile.learning_goal, UserProfile.version)
+        .where(UserProfile.id == test_user_profile.id)
+    )
+    assert profile.one() == ("Learn Rust", 2)
+    result = await test_db.execute(
+        select(ActivityLog.id)
+        .where(ActivityLog.user_id == test_user_profile.user_id)
+        .where(ActivityLog.event_type == ActivityEventType.PROFILE_UPDATE)
+    )
+    assert result.all() == []
+    assert "Failed to log profile update activity" in caplog.text
+
+
+async def test_snapshot_keeps_tag_names_after_rename(
+    test_db,
+    test_user_profile
+):
+    """Test renaming a tag doesn't rewrite the names stored in past snapshots."""
+    from models.course import Tag
+
+    result = await test_db.execute(select(Tag.id, Tag.name).order_by(Tag.name).limit(1))
+    tag_id, tag_name = result.one()
+    profile_service = ProfileService(test_db)
+    await profile_service.update_profile_with_snapshot(
+        user_id=test_user_profile.user_id,
+        interest_tag_ids=[tag_id],
+    )
+
+    try:
+        await test_db.execute(
+            update(Tag).where(Tag.id == tag_id).values(name=f"{tag_name} (renamed)")
+        )
+        result = await test_db.execute(
+            select(UserProfileSnapshot.interests_snapshot)
+            .where(UserProfileSnapshot.user_profile_id == test_user_profile.id)
+            .where(UserProfileSnapshot.version == 2)
+        )
+        assert result.scalar_one() == [tag_name]
+    finally:
+        await test_db.rollback()